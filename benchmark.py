@@ -0,0 +1,442 @@
+"""
+Offline benchmarks of the CP-Stars client.
+
+No server (and no network access) is needed, responses are served by local mock of CP-Stars database
+server (see mock_server.py) with synthetic data of the same structure and size as responses
+of CP-Stars database server.
+
+Benchmarks:
+    -> DESERIALIZATION: best time of deserializing response of each model type by the default
+       (validating) path and by the trusted server fast path, both paths have to produce equal
+       model objects
+    -> REQUESTS: throughput of CPStars functions querying the mock server (calls per second,
+       time and transferred bytes per call)
+    -> MEMORY: peak and retained memory (tracemalloc) of CPStars functions
+    -> IMPORT: time of importing cpstars (and creating CPStars instance) in a fresh interpreter,
+       the time is checked against IMPORT_TIME_LIMIT
+
+Results can be written as JSON (--output) and compared with results of a previous run (--baseline),
+measurements worse than the baseline by more than the tolerance are reported as regressions
+(and the benchmark exits with status 1).
+
+    Example:
+        -------------------------------------------------------------------------------------------------
+           python benchmark.py --output results-1.0.0.json
+           python benchmark.py --baseline results-1.0.0.json --tolerance 0.25
+        -------------------------------------------------------------------------------------------------
+"""
+
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+
+from cpstars import CPStars
+from mock_server import MockData, MockServer
+from openapi_client import ApiClient, Configuration, __version__
+from openapi_client.model.identifier import Identifier
+from openapi_client.model.light_curve_measurement import LightCurveMeasurement
+from openapi_client.model.magnitude import Magnitude
+from openapi_client.model.magnitude_attribute import MagnitudeAttribute
+from openapi_client.model.motion import Motion
+from openapi_client.model.radial_velocity import RadialVelocity
+from openapi_client.model.spectrum_measurement import SpectrumMeasurement
+from openapi_client.model.star import Star
+from openapi_client.model.star_basic_info import StarBasicInfo
+from openapi_client.model.star_datasource_attribute import StarDatasourceAttribute
+
+STARS_COUNT = 8205
+REPETITIONS = 3
+# Minimum number of deserialized items per measurement (responses with few items are deserialized repeatedly)
+MIN_DESERIALIZED_ITEMS = 10000
+IMPORT_REPETITIONS = 7
+# Maximum time of "import cpstars; cpstars.CPStars()" above the start of bare interpreter (seconds)
+IMPORT_TIME_LIMIT = 0.1
+# Version of the format of results file
+RESULTS_FORMAT = 1
+
+SECTIONS = ('deserialization', 'requests', 'memory', 'import')
+
+# Layout of printed tables
+TABLE_WIDTH = 78
+NAME_WIDTH = 36
+
+
+class _Response:
+    """Minimal stand-in for RESTResponse holding already received body."""
+
+    def __init__(self, data: str):
+        self.data = data
+
+    def getheader(self, name, default=None):
+        return default
+
+
+class BenchmarkResults:
+    """
+    Measurements of a benchmark run, each identified by section, name and metric.
+    """
+
+    def __init__(self, options: dict = None):
+        self.options = options or {}
+        self.measurements = []
+
+    def add(self, section: str, name: str, metric: str, value: float, unit: str, better: str = 'lower'):
+        """
+        :param section: benchmark section (e.g. 'requests')
+        :param name: benchmarked subject (e.g. 'get_star')
+        :param metric: measured quantity (e.g. 'time_per_call')
+        :param value: measured value
+        :param unit: unit of the value (e.g. 's', 'B', '1/s')
+        :param better: 'lower' or 'higher', direction in which the value improves
+        """
+        self.measurements.append({
+            'section': section,
+            'name': name,
+            'metric': metric,
+            'value': value,
+            'unit': unit,
+            'better': better,
+        })
+
+    def to_dict(self) -> dict:
+        return {
+            'format': RESULTS_FORMAT,
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'environment': get_environment(),
+            'options': self.options,
+            'measurements': self.measurements,
+        }
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as results_file:
+            json.dump(self.to_dict(), results_file, indent=2)
+
+    def compare(self, baseline: dict, tolerance: float) -> list:
+        """
+        :param baseline: results of a previous run (as written by save)
+        :param tolerance: allowed relative change to the worse (e.g. 0.25 for 25 %)
+        :return: list of (measurement, baseline value, relative change) of regressed measurements
+        """
+        baseline_values = {
+            (measurement['section'], measurement['name'], measurement['metric']): measurement['value']
+            for measurement in baseline['measurements']
+        }
+        regressions = []
+        for measurement in self.measurements:
+            baseline_value = baseline_values.get((measurement['section'], measurement['name'], measurement['metric']))
+            if not baseline_value:
+                continue
+            change = (measurement['value'] - baseline_value) / baseline_value
+            if measurement['better'] == 'higher':
+                change = -change
+            if change > tolerance:
+                regressions.append((measurement, baseline_value, change))
+        return regressions
+
+
+def get_environment() -> dict:
+    """
+    :return: versions of Python, platform and libraries the benchmark runs with
+    """
+    import numpy
+    import urllib3
+
+    return {
+        'library_version': __version__,
+        'python': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': numpy.__version__,
+        'urllib3': urllib3.__version__,
+    }
+
+
+def _print_header(title: str, columns: list = ()):
+    """
+    :param title: table title (printed above the column of names)
+    :param columns: list of (label, width) of value columns, labels are aligned right
+    """
+    line = "+" + "-" * (TABLE_WIDTH - 2) + "+"
+    header = "|  " + title.ljust(NAME_WIDTH) + "".join(label.rjust(width) for label, width in columns)
+    print(line)
+    print(header.ljust(TABLE_WIDTH - 1) + "|")
+    print(line)
+
+
+def _best_time(function, number: int = 1) -> float:
+    """
+    :return: best time of a single call of the function (seconds)
+    """
+    return min(timeit.repeat(function, number=number, repeat=REPETITIONS)) / number
+
+
+def benchmark_deserialization(results: BenchmarkResults, name: str, payload: str, response_type: tuple,
+                              items_count: int) -> float:
+    """
+    Deserialize payload by both deserialization paths, check results are equal
+    and print best times.
+
+    :return: speedup of the trusted server path
+    """
+    default_client = ApiClient(Configuration())
+    trusted_configuration = Configuration()
+    trusted_configuration.trusted_server = True
+    trusted_client = ApiClient(trusted_configuration)
+
+    def run(client):
+        return client.deserialize(_Response(payload), response_type, True)
+
+    assert run(default_client) == run(trusted_client)
+
+    number = max(1, MIN_DESERIALIZED_ITEMS // items_count)
+    default_time = _best_time(lambda: run(default_client), number)
+    trusted_time = _best_time(lambda: run(trusted_client), number)
+    speedup = default_time / trusted_time
+
+    results.add('deserialization', name, 'default_time_per_item', default_time / items_count, 's')
+    results.add('deserialization', name, 'trusted_time_per_item', trusted_time / items_count, 's')
+    results.add('deserialization', name, 'trusted_speedup', speedup, 'x', better='higher')
+
+    print(str.format("   {:<36} {:>10.2f} us {:>9.2f} us {:>8.1f}x",
+                     "%s x %d" % (name, items_count), default_time / items_count * 1e6,
+                     trusted_time / items_count * 1e6, speedup))
+    return speedup
+
+
+def run_deserialization_benchmarks(results: BenchmarkResults, data: MockData):
+    _print_header("DESERIALIZATION (PER ITEM)", [("DEFAULT", 14), ("TRUSTED", 13), ("SPEEDUP", 10)])
+
+    stars_ids = [star['id'] for star in data.stars]
+    payloads = [
+        ('StarBasicInfo', data.stars, StarBasicInfo),
+        ('Star', [data.star(cp_stars_id) for cp_stars_id in stars_ids[:1000]], Star),
+        ('Identifier', data.identifiers(1), Identifier),
+        ('StarDatasourceAttribute', data.attributes(1), StarDatasourceAttribute),
+        ('Magnitude', data.magnitudes(1), Magnitude),
+        ('MagnitudeAttribute', data.magnitude_attributes(1), MagnitudeAttribute),
+        ('Motion', data.motions(1), Motion),
+        ('RadialVelocity', data.radial_velocities(1), RadialVelocity),
+        ('LightCurveMeasurement', data.light_curve(1), LightCurveMeasurement),
+        ('SpectrumMeasurement', data.spectrum(1), SpectrumMeasurement),
+    ]
+    for name, items, model_class in payloads:
+        benchmark_deserialization(results, name, json.dumps(items), ([model_class],), len(items))
+
+
+def benchmark_requests(results: BenchmarkResults, mock_server: MockServer, name: str, function, number: int,
+                       items_count: int = 1):
+    """
+    Call the function (querying the mock server) number of times and print best throughput.
+
+    :param function: function called with index of the call (e.g. to query different stars)
+    :param items_count: number of items (e.g. stars) queried by a single call
+    """
+    calls = iter(range(number * (REPETITIONS + 1)))
+
+    def run():
+        function(next(calls))
+
+    # warm up (imports, connections, compiled decoders), bytes of a call are measured
+    bytes_sent = mock_server.bytes_sent
+    run()
+    bytes_per_call = mock_server.bytes_sent - bytes_sent
+
+    time_per_call = _best_time(run, number)
+    throughput = items_count / time_per_call
+
+    results.add('requests', name, 'time_per_call', time_per_call, 's')
+    results.add('requests', name, 'throughput', throughput, '1/s', better='higher')
+    results.add('requests', name, 'bytes_per_call', bytes_per_call, 'B')
+
+    print(str.format("   {:<36} {:>10.1f} /s {:>9.2f} ms {:>7.0f} kB", name, throughput, time_per_call * 1e3,
+                     bytes_per_call / 1e3))
+    return throughput
+
+
+def run_requests_benchmarks(results: BenchmarkResults, mock_server: MockServer):
+    _print_header("REQUESTS", [("THROUGHPUT", 14), ("TIME/CALL", 13), ("SIZE/CALL", 11)])
+
+    stars_count = len(mock_server.data.stars)
+    cpstars = CPStars(host_address=mock_server.host)
+    trusted_cpstars = CPStars(host_address=mock_server.host, trusted_server=True)
+
+    def star_id(index):
+        return index % stars_count + 1
+
+    def star_ids(index, count):
+        return [star_id(index * count + offset) for offset in range(count)]
+
+    bulk_count = 100
+    benchmarks = [
+        ('get_basic_info_for_stars', lambda index: cpstars.get_basic_info_for_stars(), 1),
+        ('get_basic_info_for_stars (trusted)', lambda index: trusted_cpstars.get_basic_info_for_stars(), 1),
+        ('get_basic_info_table', lambda index: cpstars.get_basic_info_table(), 1),
+        ('get_star', lambda index: cpstars.get_star(star_id(index)), 100),
+        ('get_star_dossier', lambda index: cpstars.get_star_dossier(star_id(index)), 10),
+        ('get_magnitudes_for_star', lambda index: cpstars.get_magnitudes_for_star(star_id(index)), 20),
+        ('get_light_curve_for_star', lambda index: cpstars.get_light_curve_for_star(star_id(index)), 5),
+        ('get_light_curve_array', lambda index: cpstars.get_light_curve_array(star_id(index)), 20),
+        ('get_spectrum_for_star', lambda index: cpstars.get_spectrum_for_star(star_id(index)), 3),
+        ('get_spectrum_array', lambda index: cpstars.get_spectrum_array(star_id(index)), 10),
+        ('export csv (all stars)', lambda index: cpstars.export_controller.download_stars_csv1(), 3),
+        ('export txt', lambda index: cpstars.export_controller.get_extended_star_txt(star_id(index)), 100),
+    ]
+    for name, function, number in benchmarks:
+        benchmark_requests(results, mock_server, name, function, number)
+
+    # concurrent requests, throughput in stars per second
+    benchmark_requests(results, mock_server, "get_magnitudes_for_stars x %d" % bulk_count,
+                       lambda index: cpstars.get_magnitudes_for_stars(star_ids(index, bulk_count)), 1,
+                       items_count=bulk_count)
+
+
+def benchmark_memory(results: BenchmarkResults, name: str, function):
+    """
+    Measure peak memory allocated during the call of the function and memory retained by its result
+    (after warm up call, thus one-time allocations, e.g. imports, are not included).
+    """
+    function()
+
+    tracemalloc.start()
+    try:
+        result = function()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    results.add('memory', name, 'peak', peak, 'B')
+    results.add('memory', name, 'retained', retained, 'B')
+
+    print(str.format("   {:<36} {:>10.2f} MB {:>9.2f} MB", name, peak / 1e6, retained / 1e6))
+
+
+def run_memory_benchmarks(results: BenchmarkResults, mock_server: MockServer):
+    _print_header("MEMORY", [("PEAK", 14), ("RETAINED", 13)])
+
+    cpstars = CPStars(host_address=mock_server.host)
+    lazy_cpstars = CPStars(host_address=mock_server.host, model_representation='lazy')
+    compact_cpstars = CPStars(host_address=mock_server.host, model_representation='compact')
+
+    benchmarks = [
+        ('get_basic_info_for_stars', cpstars.get_basic_info_for_stars),
+        ('get_basic_info_for_stars (lazy)', lazy_cpstars.get_basic_info_for_stars),
+        ('get_basic_info_for_stars (compact)', compact_cpstars.get_basic_info_for_stars),
+        ('get_basic_info_table', cpstars.get_basic_info_table),
+        ('get_light_curve_for_star', lambda: cpstars.get_light_curve_for_star(1)),
+        ('get_light_curve_array', lambda: cpstars.get_light_curve_array(1)),
+        ('get_spectrum_for_star', lambda: cpstars.get_spectrum_for_star(1)),
+        ('get_spectrum_array', lambda: cpstars.get_spectrum_array(1)),
+    ]
+    for name, function in benchmarks:
+        benchmark_memory(results, name, function)
+
+
+def measure_import_time(code: str) -> float:
+    """
+    :return: median wall time of running the code in a fresh interpreter (seconds)
+    """
+    def run():
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        return time.perf_counter() - start
+
+    return statistics.median(run() for _ in range(IMPORT_REPETITIONS))
+
+
+def benchmark_import_time(results: BenchmarkResults) -> float:
+    """
+    Measure import of cpstars relative to start of bare interpreter and print times.
+
+    :return: time of import and creating CPStars instance above interpreter start (seconds)
+    """
+    interpreter_time = measure_import_time('pass')
+    import_time = measure_import_time('import cpstars') - interpreter_time
+    instance_time = measure_import_time('import cpstars; cpstars.CPStars()') - interpreter_time
+
+    results.add('import', 'interpreter start', 'time', interpreter_time, 's')
+    results.add('import', 'import cpstars', 'time', import_time, 's')
+    results.add('import', 'import + CPStars()', 'time', instance_time, 's')
+
+    print(str.format("   {:<36} {:>10.4f} s", "interpreter start", interpreter_time))
+    print(str.format("   {:<36} {:>10.4f} s", "import cpstars", import_time))
+    print(str.format("   {:<36} {:>10.4f} s", "import + CPStars()", instance_time))
+    return instance_time
+
+
+def run_import_benchmarks(results: BenchmarkResults) -> float:
+    _print_header("IMPORT", [("TIME", 13)])
+
+    return benchmark_import_time(results)
+
+
+def print_regressions(regressions: list, tolerance: float):
+    _print_header("REGRESSIONS (tolerance %.0f %%)" % (tolerance * 100),
+                  [("BASELINE", 14), ("CURRENT", 13), ("CHANGE", 10)])
+
+    for measurement, baseline_value, change in regressions:
+        print(str.format("   {:<36} {:>13.4g} {:>12.4g} {:>+8.0f} %  {}", measurement['name'],
+                         baseline_value, measurement['value'], change * 100, measurement['metric']))
+    if not regressions:
+        print("   none")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='CP-Stars client offline benchmarks')
+    parser.add_argument('--sections', nargs='+', choices=SECTIONS, default=list(SECTIONS),
+                        help='benchmarks to run (all by default)')
+    parser.add_argument('--stars-count', type=int, default=STARS_COUNT, help='number of stars of the mock server')
+    parser.add_argument('--output', default=None, help='JSON file the results are written to')
+    parser.add_argument('--baseline', default=None, help='JSON file with results of a previous run to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative change to the worse compared to the baseline (default 0.25)')
+    arguments = parser.parse_args()
+
+    results = BenchmarkResults({'sections': arguments.sections, 'stars_count': arguments.stars_count,
+                                'repetitions': REPETITIONS})
+
+    print()
+    print("Chemically peculiar (CP) stars database library benchmarks")
+    print("==========================================================")
+    print("\n")
+
+    instance_time = None
+    with MockServer(stars_count=arguments.stars_count) as mock_server:
+        if 'deserialization' in arguments.sections:
+            run_deserialization_benchmarks(results, mock_server.data)
+            print()
+        if 'requests' in arguments.sections:
+            run_requests_benchmarks(results, mock_server)
+            print()
+        if 'memory' in arguments.sections:
+            run_memory_benchmarks(results, mock_server)
+            print()
+    if 'import' in arguments.sections:
+        instance_time = run_import_benchmarks(results)
+        print()
+
+    if arguments.output is not None:
+        results.save(arguments.output)
+        print("Results written to " + arguments.output)
+
+    regressions = []
+    if arguments.baseline is not None:
+        with open(arguments.baseline, encoding='utf-8') as baseline_file:
+            regressions = results.compare(json.load(baseline_file), arguments.tolerance)
+        print_regressions(regressions, arguments.tolerance)
+
+    assert instance_time is None or instance_time <= IMPORT_TIME_LIMIT, \
+        "import cpstars takes %.4f s, limit is %.4f s" % (instance_time, IMPORT_TIME_LIMIT)
+    if regressions:
+        sys.exit(1)
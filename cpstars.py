@@ -13,6 +13,7 @@
 |        -> Identifiers (stored in the CP-Stars database)
 |        -> Attributes (e.g. Spectral type)
 |        -> Vizier metadata, external details
+|        -> Data sources (name, full name, year, bibcode, description)
 |
 |    AUTHOR: Ľuboslav Halama
 |
@@ -25,6 +26,7 @@
 |        - python_dateutil >= 2.5.3
 |        - setuptools >= 21.0.0
 |        - urllib3 >= 1.25.3
+|        - numpy >= 1.20 (array-returning functions, e.g. get_light_curve_array)
 |
 |    USAGE:
 |        1.) Instance of the CPStars class has to be created
@@ -61,23 +63,127 @@
 |       Some other examples can also be found in test.py file.
 """
 
-from openapi_client import ApiClient, Configuration
+from __future__ import annotations
 
-from openapi_client.api.export_controller_api import ExportControllerApi
-from openapi_client.api.external_services_controller_api import ExternalServicesControllerApi
-from openapi_client.api.stars_controller_api import StarsControllerApi
+import functools
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple, Optional, Union
 
-from openapi_client.model.external_details import ExternalDetails
-from openapi_client.model.identifier import Identifier
-from openapi_client.model.light_curve_measurement import LightCurveMeasurement
-from openapi_client.model.magnitude import Magnitude
-from openapi_client.model.magnitude_attribute import MagnitudeAttribute
-from openapi_client.model.motion import Motion
-from openapi_client.model.radial_velocity import RadialVelocity
-from openapi_client.model.spectrum_measurement import SpectrumMeasurement
-from openapi_client.model.star import Star
-from openapi_client.model.star_basic_info import StarBasicInfo
-from openapi_client.model.star_datasource_attribute import StarDatasourceAttribute
+from cpstars_arrays import iter_array_chunks, measurements_to_arrays, select_stars, sort_arrays_by_first
+from cpstars_cache import ResultCache
+from cpstars_catalog import (RENSON_DOWNLOAD_THRESHOLD, CatalogStore, RensonIndex, content_hash,
+                             default_spatial_index_path)
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import NotFoundException
+
+# Only names used in annotations are imported here, NumPy, HTTP layer, controllers and models
+# are imported when first used (importing cpstars is cheap, see import_time_test in test.py)
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy as np
+
+    from cpstars_datasources import DatasourceRegistry
+    from cpstars_spatial import CrossmatchResult, SpatialIndex
+    from cpstars_table import StarBasicInfoTable
+    from openapi_client.api_client import ApiClient
+    from openapi_client.http_cache import DirectoryCacheBackend, MemoryCacheBackend
+    from openapi_client.instrumentation import MetricsCollector
+    from openapi_client.retry import RetryPolicy
+
+    from openapi_client.api.datasources_controller_api import DatasourcesControllerApi
+    from openapi_client.api.export_controller_api import ExportControllerApi
+    from openapi_client.api.external_services_controller_api import ExternalServicesControllerApi
+    from openapi_client.api.stars_controller_api import StarsControllerApi
+
+    from openapi_client.model.data_source import DataSource
+    from openapi_client.model.data_source_basic_info import DataSourceBasicInfo
+    from openapi_client.model.extended_star import ExtendedStar
+    from openapi_client.model.external_details import ExternalDetails
+    from openapi_client.model.identifier import Identifier
+    from openapi_client.model.light_curve_measurement import LightCurveMeasurement
+    from openapi_client.model.magnitude import Magnitude
+    from openapi_client.model.magnitude_attribute import MagnitudeAttribute
+    from openapi_client.model.motion import Motion
+    from openapi_client.model.radial_velocity import RadialVelocity
+    from openapi_client.model.spectrum_measurement import SpectrumMeasurement
+    from openapi_client.model.star import Star
+    from openapi_client.model.star_basic_info import StarBasicInfo
+    from openapi_client.model.star_datasource_attribute import StarDatasourceAttribute
+
+# Functions whose results are cached if CPStars instance is created with result cache
+_CACHED_FUNCTIONS = (
+    'get_basic_info_for_stars',
+    'get_basic_info_table',
+    'get_extended_star',
+    'get_extended_star_by_renson',
+    'get_identifiers_for_star',
+    'get_identifiers_for_star_by_renson',
+    'get_simbad_external_details',
+    'get_star_attributes',
+    'get_star_attributes_by_renson',
+    'get_star',
+    'get_star_by_renson',
+    'get_magnitudes_attributes_for_star',
+    'get_magnitudes_attributes_for_star_by_renson',
+    'get_magnitudes_for_star',
+    'get_magnitudes_for_star_by_renson',
+    'get_motion_related_info_for_star',
+    'get_motion_related_info_for_star_by_renson',
+    'get_radial_velocities_for_star',
+    'get_radial_velocities_for_star_by_renson',
+    'get_light_curve_for_star',
+    'get_light_curve_for_star_by_renson',
+    'get_light_curve_array',
+    'get_light_curve_array_by_renson',
+    'get_spectrum_for_star',
+    'get_spectrum_for_star_by_renson',
+    'get_spectrum_array',
+    'get_spectrum_array_by_renson',
+    'get_vizier_metadata',
+)
+
+
+class StarQueryResult(NamedTuple):
+    """
+    Result of a query for a single star obtained by bulk functions (e.g. get_magnitudes_for_stars).
+    Either value or error is set.
+    """
+    cp_stars_id: int
+    value: Any
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class StarDossier(NamedTuple):
+    """
+    All information about a single star obtained by get_star_dossier.
+    """
+    star: Union[Star, ExtendedStar]
+    identifiers: list[Identifier]
+    attributes: list[StarDatasourceAttribute]
+    magnitudes: list[Magnitude]
+    magnitude_attributes: list[MagnitudeAttribute]
+    motions: list[Motion]
+    radial_velocities: list[RadialVelocity]
+    light_curve: Optional[list[LightCurveMeasurement]]
+
+
+# Per-star detail kinds (see cpstars_catalog.STAR_DETAIL_KINDS) and corresponding StarsControllerApi operations
+_STAR_DETAIL_OPERATIONS = {
+    'star': 'get_star',
+    'identifiers': 'get_star_identifiers',
+    'attributes': 'get_star_datasource_attributes',
+    'magnitudes': 'get_star_magnitudes',
+    'magnitude_attributes': 'get_star_magnitude_attributes',
+    'motions': 'get_star_motions',
+    'radial_velocities': 'get_star_radial_velocities',
+}
 
 
 class CPStars:
@@ -87,19 +193,389 @@ class CPStars:
     If no specific configuration is provided, default configuration is used.
     """
 
-    def __init__(self, host_address=None):
+    def __init__(self, host_address=None, trusted_server: bool = False,
+                 catalog: Union[CatalogStore, str] = None,
+                 renson_index: Union[RensonIndex, str, bool] = False,
+                 max_workers: int = None, intern_models: str = None,
+                 http_cache: Union[MemoryCacheBackend, DirectoryCacheBackend, str, bool] = False,
+                 result_cache: Union[ResultCache, bool] = False, coalesce_requests: bool = False,
+                 spatial_index: Union[SpatialIndex, str] = None, model_representation: str = 'model',
+                 metrics_collector: MetricsCollector = None, retries: Union[RetryPolicy, int, bool] = None):
         """
         CPStars class constructor.
         Default configuration may be overridden in case different backend should be queried.
 
         :param host_address: CP-Stars database backend (server) address
+        :param trusted_server: if True, responses are deserialized by precompiled decoders
+                               without client side type validation (faster for large responses)
+        :param catalog: catalog mirror (or path to its database file) used to answer queries locally,
+                        see cpstars_catalog.py
+        :param renson_index: Renson -> CP-Stars identifier index used by *_by_renson functions so that
+                             only a single request is needed per call; True for in-memory index,
+                             path of JSON file for persisted index (or RensonIndex instance)
+        :param max_workers: maximum number of parallel requests of bulk functions (e.g. get_magnitudes_for_stars),
+                            size of the connection pool is used by default
+        :param intern_models: if 'response', embedded stars and data sources equal by identifier share one object
+                              within a response (e.g. all magnitudes of a star refer to the same Star object),
+                              if 'session', they are shared by all responses of this instance;
+                              requires model_representation 'model' (ValueError is raised otherwise)
+        :param http_cache: HTTP cache of responses revalidated by conditional requests (ETag, Last-Modified);
+                           True for in-memory cache, path of directory for persistent cache
+                           (or cache backend instance), see openapi_client/http_cache.py
+        :param result_cache: in-memory cache of query results (returned objects are shared, thus read-only);
+                             True for cache with default settings (or ResultCache instance), see cpstars_cache.py
+        :param coalesce_requests: if True, concurrent identical queries (e.g. of the same star from multiple threads)
+                                  share one request and its result
+        :param spatial_index: index of star positions used by cone_search, get_nearest_stars and box_search;
+                              path of .npz file for persisted index (or SpatialIndex instance), by default
+                              the index is persisted next to the catalog mirror (in memory without catalog mirror)
+        :param model_representation: if 'lazy', returned models are views over the received data and their
+                                     properties are converted (and validated) when accessed for the first time
+                                     (faster when only a few properties of many objects are read);
+                                     if 'compact', basic information of stars, measurements, magnitudes, motions
+                                     and radial velocities are returned as immutable records with the same
+                                     properties using a fraction of memory (record.to_model() returns the model)
+        :param metrics_collector: collector receiving metrics of every request (latency split into network,
+                                  decode and model phases, status, received bytes, retries, connection pool
+                                  usage), e.g. PrometheusCollector, see openapi_client/instrumentation.py
+        :param retries: retry policy of requests (opt-in); True for exponential backoff with jitter (honoring
+                        Retry-After) on connection errors and 429/502/503/504 responses limited by a retry budget
+                        of the instance, number for the same policy with the given maximum of retries per request
+                        (or RetryPolicy instance, its budget can be shared by multiple instances); by default (None
+                        or False) urllib3 defaults are kept, i.e. failed responses are not retried,
+                        see openapi_client/retry.py
+        """
+        configuration = Configuration(host_address)
+        configuration.trusted_server = trusted_server
+        configuration.intern_models = intern_models
+        configuration.coalesce_requests = coalesce_requests
+        configuration.model_representation = model_representation
+        configuration.metrics_collector = metrics_collector
+        if max_workers is None:
+            max_workers = configuration.connection_pool_maxsize
+        else:
+            configuration.connection_pool_maxsize = max(configuration.connection_pool_maxsize, max_workers)
+        self._configuration = configuration
+        self._max_workers = max_workers
+        self._retries = retries
+
+        if http_cache is True or isinstance(http_cache, str):
+            from openapi_client.http_cache import DirectoryCacheBackend, MemoryCacheBackend
+            http_cache = MemoryCacheBackend() if http_cache is True else DirectoryCacheBackend(http_cache)
+        self._http_cache = http_cache if http_cache is not False else None
+
+        # API client, controllers and spatial index are created on first use (see properties below),
+        # thus creating the instance imports neither HTTP layer nor models and NumPy
+        self._lazy_lock = threading.Lock()
+        self._api_client = None
+        self._dossier_executor = None
+        self._spatial_index = spatial_index
+        self._spatial_table = None
+
+        self.catalog = CatalogStore(catalog) if isinstance(catalog, str) else catalog
+        if renson_index is True:
+            renson_index = RensonIndex()
+        elif isinstance(renson_index, str):
+            renson_index = RensonIndex(renson_index)
+        self.renson_index = renson_index or None
+
+        if result_cache is True:
+            result_cache = ResultCache()
+        self.result_cache = result_cache if result_cache is not False else None
+        if self.result_cache is not None:
+            # results of instances of other servers or model representations are not returned by shared cache
+            namespace = (configuration.host, model_representation)
+            for function_name in _CACHED_FUNCTIONS:
+                setattr(self, function_name,
+                        self.result_cache.wrap(function_name, getattr(self, function_name), namespace))
+
+    @property
+    def api_client(self) -> ApiClient:
+        """
+        API client of the instance (with connection pool and HTTP cache), created on first use.
+        """
+        api_client = self._api_client
+        if api_client is None:
+            with self._lazy_lock:
+                if self._api_client is None:
+                    from openapi_client.api_client import ApiClient
+
+                    if self._retries is not None and self._retries is not False:
+                        from openapi_client.retry import RetryBudget, RetryPolicy
+                        retries = self._retries
+                        if retries is True:
+                            retries = RetryPolicy(budget=RetryBudget())
+                        elif isinstance(retries, int):
+                            retries = RetryPolicy(total=retries, budget=RetryBudget())
+                        self._configuration.retries = retries
+                    api_client = ApiClient(self._configuration, pool_threads=self._max_workers)
+                    if self._http_cache is not None:
+                        from openapi_client.http_cache import CachingRESTClientObject
+                        api_client.rest_client = CachingRESTClientObject(api_client.rest_client, self._http_cache)
+                    self._api_client = api_client
+                api_client = self._api_client
+        return api_client
+
+    @property
+    def dossier_executor(self) -> ThreadPoolExecutor:
+        """
+        Workers sending requests of star dossiers, created on first use. Separate from the pool of the API client,
+        thus a dossier can be obtained also by a function run by bulk functions (e.g. _query_stars).
+        """
+        dossier_executor = self._dossier_executor
+        if dossier_executor is None:
+            with self._lazy_lock:
+                if self._dossier_executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    # each request of a dossier holds a connection, more workers would only wait for them
+                    self._dossier_executor = ThreadPoolExecutor(self._configuration.connection_pool_maxsize,
+                                                                thread_name_prefix='cpstars-dossier')
+                dossier_executor = self._dossier_executor
+        return dossier_executor
+
+    @functools.cached_property
+    def stars_controller(self) -> StarsControllerApi:
+        from openapi_client.api.stars_controller_api import StarsControllerApi
+        return StarsControllerApi(self.api_client)
+
+    @functools.cached_property
+    def export_controller(self) -> ExportControllerApi:
+        from openapi_client.api.export_controller_api import ExportControllerApi
+        return ExportControllerApi(self.api_client)
+
+    @functools.cached_property
+    def external_services_controller(self) -> ExternalServicesControllerApi:
+        from openapi_client.api.external_services_controller_api import ExternalServicesControllerApi
+        return ExternalServicesControllerApi(self.api_client)
+
+    @functools.cached_property
+    def datasources_controller(self) -> DatasourcesControllerApi:
+        from openapi_client.api.datasources_controller_api import DatasourcesControllerApi
+        return DatasourcesControllerApi(self.api_client)
+
+    @functools.cached_property
+    def datasource_registry(self) -> DatasourceRegistry:
+        from cpstars_datasources import DatasourceRegistry
+        return DatasourceRegistry(self.datasources_controller)
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """
+        Index of star positions, created (or loaded from its file) on first use.
+        """
+        spatial_index = self._spatial_index
+        if spatial_index is None or isinstance(spatial_index, str):
+            with self._lazy_lock:
+                spatial_index = self._spatial_index
+                if spatial_index is None or isinstance(spatial_index, str):
+                    from cpstars_spatial import SpatialIndex
+
+                    if spatial_index is None and self._get_catalog() is not None:
+                        spatial_index = default_spatial_index_path(self.catalog.path)
+                    spatial_index = self._spatial_index = SpatialIndex(spatial_index)
+        return spatial_index
+
+    @spatial_index.setter
+    def spatial_index(self, spatial_index: SpatialIndex):
+        self._spatial_index = spatial_index
+        self._spatial_table = None
+
+    @staticmethod
+    def _get_json(endpoint_method, *args):
+        """
+        Call generated endpoint method and return decoded JSON body of the response
+        without building model objects.
+
+        :param endpoint_method: generated controller method (e.g. get_star_light_curve_measurements)
+        :param args: positional arguments of the endpoint method
+        :return: decoded JSON (lists and dicts)
+        """
+        response = endpoint_method(*args, _preload_content=False)
+        try:
+            return json.loads(response.data)
+        finally:
+            response.release_conn()
+
+    def _get_catalog(self) -> Optional[CatalogStore]:
+        """
+        :return: catalog mirror if it was refreshed from the server of this instance, None otherwise
+                 (mirror of another server is not used until refresh_catalog is called)
+        """
+        if self.catalog is not None and self.catalog.is_populated(self._configuration.host):
+            return self.catalog
+        return None
+
+    def _get_star_detail(self, kind: str, cp_stars_id: int):
+        """
+        Obtain per-star detail from the catalog mirror (if available), otherwise from the server.
+
+        :param kind: detail kind (key of _STAR_DETAIL_OPERATIONS)
+        :param cp_stars_id: CP-Stars database identifier
+        :return: deserialized detail (model object or list of model objects)
+        """
+        operation = _STAR_DETAIL_OPERATIONS[kind]
+        catalog = self._get_catalog()
+        if catalog is not None:
+            stored_data = catalog.get_star_detail(cp_stars_id, kind)
+            if stored_data is not None:
+                endpoint = getattr(self.stars_controller, operation + '_endpoint')
+                return self.api_client.deserialize_data(stored_data, endpoint.settings['response_type'])
+
+        return getattr(self.stars_controller, operation)(cp_stars_id)
+
+    def _lookup_renson(self, renson_id: str) -> Optional[int]:
+        """
+        Find CP-Stars identifier of the star specified by Renson identifier locally,
+        i.e. in catalog mirror or in Renson index (index is built from a single /stars request
+        when used for the first time).
+
+        :param renson_id: Renson identifier
+        :return: CP-Stars database identifier or None if not found locally
+        """
+        catalog = self._get_catalog()
+        if catalog is not None:
+            cp_stars_id = catalog.get_star_id_by_renson(renson_id)
+            if cp_stars_id is not None:
+                return cp_stars_id
+
+        if self.renson_index is not None:
+            if not self.renson_index.is_built():
+                self.renson_index.build(self._get_basic_info_json())
+            return self.renson_index.get(renson_id)
+
+        return None
+
+    def _resolve_renson(self, renson_id: str) -> int:
+        """
+        Resolve CP-Stars identifier of the star specified by Renson identifier,
+        server is queried only if it cannot be found locally.
+
+        :param renson_id: Renson identifier
+        :return: CP-Stars database identifier
+        """
+        cp_stars_id = self._lookup_renson(renson_id)
+        if cp_stars_id is None:
+            cp_stars_id = self.get_star_by_renson(renson_id).id
+        return cp_stars_id
+
+    def _stream_models(self, item_type: type, endpoint_method: Callable, *args) -> Iterator:
+        """
+        Call generated endpoint method returning JSON array and deserialize its items while
+        the response is received. Request is sent immediately, errors are raised by this call.
+
+        :param item_type: model class of array items
+        :param endpoint_method: generated controller method (e.g. get_star_light_curve_measurements)
+        :param args: positional arguments of the endpoint method
+        :return: generator of model objects
+        """
+        response = endpoint_method(*args, _preload_content=False)
+        return self.api_client.deserialize_stream(response, (item_type,))
+
+    def _stream_json(self, endpoint_method: Callable, *args) -> Iterator:
+        """
+        Call generated endpoint method returning JSON array and decode its items while
+        the response is received. Request is sent immediately, errors are raised by this call.
+
+        :param endpoint_method: generated controller method (e.g. get_star_light_curve_measurements)
+        :param args: positional arguments of the endpoint method
+        :return: generator of decoded JSON items (dicts)
+        """
+        response = endpoint_method(*args, _preload_content=False)
+        return self.api_client.stream_json_array(response)
+
+    def _get_basic_info_json(self) -> list:
+        """
+        :return: decoded JSON basic information of all stars, from catalog mirror if available
+        """
+        catalog = self._get_catalog()
+        if catalog is not None:
+            stored_data = catalog.get_basic_info_list()
+            if stored_data is not None:
+                return stored_data
+        return self._get_json(self.stars_controller.get_basic_info_stars_list)
+
+    def _query_stars(self, function: Callable, cp_stars_ids: list) -> list[StarQueryResult]:
+        """
+        Call the given single-star function for each of the stars in parallel
+        (at most max_workers requests at once).
+
+        :param function: function accepting CP-Stars identifier
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: list of results in the order of given identifiers, failures do not abort the batch
+        """
+        pending = [(cp_stars_id, self.api_client.pool.apply_async(function, (cp_stars_id,)))
+                   for cp_stars_id in cp_stars_ids]
+
+        results = []
+        for cp_stars_id, async_result in pending:
+            try:
+                results.append(StarQueryResult(cp_stars_id, async_result.get(), None))
+            except Exception as error:
+                results.append(StarQueryResult(cp_stars_id, None, error))
+        return results
+
+    def refresh_catalog(self, full: bool = False) -> dict:
         """
-        self.api_client = ApiClient(
-            Configuration(host_address)
-        )
-        self.stars_controller = StarsControllerApi(self.api_client)
-        self.export_controller = ExportControllerApi(self.api_client)
-        self.external_services_controller = ExternalServicesControllerApi(self.api_client)
+        Refresh catalog mirror. Basic information of all stars is downloaded and only stars
+        that are new or whose basic information changed are re-fetched (with all their details).
+        Stars no longer present on the server are removed from the mirror.
+
+        :param full: if True, all stars are re-fetched
+        :return: dictionary with lists of CP-Stars identifiers of 'added', 'updated' and 'removed' stars
+        """
+        if self.catalog is None:
+            raise ValueError("CPStars instance was created without catalog mirror.")
+
+        # stars of a mirror of another server are re-fetched (their details may differ)
+        full = full or not self.catalog.is_populated(self._configuration.host)
+        stored_hashes = self.catalog.get_star_hashes()
+        basic_info_list = self._get_json(self.stars_controller.get_basic_info_stars_list)
+
+        summary = {'added': [], 'updated': [], 'removed': []}
+        changed_stars = {}
+        for basic_info in basic_info_list:
+            star_id = basic_info['id']
+            stored_hash = stored_hashes.pop(star_id, None)
+            if full or stored_hash != content_hash(basic_info):
+                changed_stars[star_id] = basic_info
+                summary['added' if stored_hash is None else 'updated'].append(star_id)
+
+        def fetch_details(star_id):
+            return {
+                kind: self._get_json(getattr(self.stars_controller, operation), star_id)
+                for kind, operation in _STAR_DETAIL_OPERATIONS.items()
+            }
+
+        for result in self._query_stars(fetch_details, list(changed_stars)):
+            if not result.ok:
+                raise result.error
+            self.catalog.store_star(changed_stars[result.cp_stars_id], result.value)
+
+        summary['removed'] = list(stored_hashes)
+        self.catalog.remove_stars(summary['removed'])
+        self.catalog.mark_refreshed(self.api_client.configuration.host)
+        self._invalidate_spatial_index()
+        from cpstars_datasources import invalidate_datasource_registry
+        invalidate_datasource_registry(self.api_client.configuration.host)
+        if self.result_cache is not None:
+            self.result_cache.invalidate()
+        return summary
+
+    def _invalidate_spatial_index(self):
+        """
+        Keep spatial index consistent with the refreshed catalog mirror: index loaded by this instance
+        is rebuilt, index persisted but not loaded yet is removed (it is built again on first spatial query).
+        """
+        self._spatial_table = None
+        spatial_index = self._spatial_index
+        if spatial_index is None or isinstance(spatial_index, str):
+            path = spatial_index if spatial_index is not None else default_spatial_index_path(self.catalog.path)
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+        elif spatial_index.is_built() or spatial_index.path is not None:
+            from cpstars_table import StarBasicInfoTable
+            spatial_index.build(StarBasicInfoTable.from_json(self.catalog.get_basic_info_list()))
 
     def get_basic_info_for_stars(self) -> list[StarBasicInfo]:
         """
@@ -113,8 +589,120 @@ class CPStars:
 
         :return: list of stars in the database with basic information
         """
+        catalog = self._get_catalog()
+        if catalog is not None:
+            stored_data = catalog.get_basic_info_list()
+            if stored_data is not None:
+                endpoint = self.stars_controller.get_basic_info_stars_list_endpoint
+                return self.api_client.deserialize_data(stored_data, endpoint.settings['response_type'])
+
         return self.stars_controller.get_basic_info_stars_list()
 
+    def get_basic_info_table(self) -> StarBasicInfoTable:
+        """
+        Obtain basic information of all stars (see get_basic_info_for_stars) as columnar table.
+        Response is decoded directly into NumPy arrays and categorical columns, no StarBasicInfo objects are created,
+        thus the table can be filtered by vectorized masks, see cpstars_table.py.
+
+        :return: table of stars in the database with basic information
+        """
+        from cpstars_table import StarBasicInfoTable
+        return StarBasicInfoTable.from_json(self._get_basic_info_json())
+
+    def _get_spatial_table(self) -> StarBasicInfoTable:
+        """
+        :return: basic information table of stars found by spatial index (index is built on first use)
+        """
+        table = self._spatial_table
+        if table is None:
+            table = self.get_basic_info_table()
+            if not self.spatial_index.is_built():
+                self.spatial_index.build(table)
+            self._spatial_table = table
+        return table
+
+    def cone_search(self, right_ascension: float, declination: float, radius: float) -> StarBasicInfoTable:
+        """
+        Obtain stars within the given angular distance of the position (ICRS coordinates).
+        Search is done locally by spatial index, only basic information of all stars is downloaded once.
+
+        :param right_ascension: right ascension of the center in degrees
+        :param declination: declination of the center in degrees
+        :param radius: radius of the cone in degrees
+        :return: table of stars with basic information and 'separation' column (degrees), sorted by separation
+        """
+        table = self._get_spatial_table()
+        return select_stars(table, *self.spatial_index.cone_search(right_ascension, declination, radius))
+
+    def get_nearest_stars(self, right_ascension: float, declination: float, count: int = 1) -> StarBasicInfoTable:
+        """
+        Obtain stars closest to the position (ICRS coordinates), see cone_search.
+
+        :param right_ascension: right ascension in degrees
+        :param declination: declination in degrees
+        :param count: number of stars
+        :return: table of stars with basic information and 'separation' column (degrees), sorted by separation
+        """
+        table = self._get_spatial_table()
+        return select_stars(table, *self.spatial_index.nearest(right_ascension, declination, count))
+
+    def box_search(self, right_ascension_min: float, right_ascension_max: float,
+                   declination_min: float, declination_max: float) -> StarBasicInfoTable:
+        """
+        Obtain stars within the box of ICRS coordinates, see cone_search.
+
+        :param right_ascension_min: minimum right ascension in degrees
+        :param right_ascension_max: maximum right ascension in degrees (box crosses 0h if lower than minimum)
+        :param declination_min: minimum declination in degrees
+        :param declination_max: maximum declination in degrees
+        :return: table of stars with basic information
+        """
+        table = self._get_spatial_table()
+        return select_stars(table, self.spatial_index.box_search(right_ascension_min, right_ascension_max,
+                                                                 declination_min, declination_max))
+
+    def crossmatch(self, right_ascensions: np.ndarray, declinations: np.ndarray, max_separation: float,
+                   mode: str = 'best', chunk_size: int = 65536) -> CrossmatchResult:
+        """
+        Match positions (e.g. sources of a survey, ICRS coordinates) with stars of the database.
+        Matching is vectorized and done locally by spatial index, see cone_search.
+
+        :param right_ascensions: right ascensions of positions in degrees
+        :param declinations: declinations of positions in degrees
+        :param max_separation: maximum angular separation of matched star in degrees
+        :param mode: 'best' for the closest star of each position, 'all' for all stars within max_separation
+        :param chunk_size: maximum number of positions processed at once (bounds memory usage)
+        :return: arrays of position indices, CP-Stars identifiers, Renson identifiers and separations (degrees)
+                 with an item per match
+        """
+        self._get_spatial_table()
+        return self.spatial_index.crossmatch(right_ascensions, declinations, max_separation, mode, chunk_size)
+
+    def iter_crossmatch(self, right_ascensions: np.ndarray, declinations: np.ndarray, max_separation: float,
+                        mode: str = 'best', chunk_size: int = 65536) -> Iterator[CrossmatchResult]:
+        """
+        Match positions with stars of the database chunk by chunk (see crossmatch), so matches of millions
+        of positions (e.g. memory-mapped arrays) can be processed without keeping all of them in memory.
+
+        :return: generator of matches of successive chunks of positions
+        """
+        self._get_spatial_table()
+        return self.spatial_index.iter_crossmatch(right_ascensions, declinations, max_separation, mode, chunk_size)
+
+    def iter_basic_info_for_stars(self) -> Iterator[StarBasicInfo]:
+        """
+        Obtain all stars from the database containing basic information (see get_basic_info_for_stars)
+        one by one. Stars are decoded while the response is received, thus memory usage does not
+        depend on the number of stars as long as the returned objects are not kept.
+
+        :return: generator of stars in the database with basic information
+        """
+        if self._get_catalog() is not None:
+            return iter(self.get_basic_info_for_stars())
+
+        from openapi_client.model.star_basic_info import StarBasicInfo
+        return self._stream_models(StarBasicInfo, self.stars_controller.get_basic_info_stars_list)
+
     def get_identifiers_for_star(self, cp_stars_id: int) -> list[Identifier]:
         """
         Obtain identifiers that are stored in the database for the given star
@@ -123,7 +711,7 @@ class CPStars:
         :param cp_stars_id: CP-Stars database identifier
         :return: list of identifiers of the given star
         """
-        return self.stars_controller.get_star_identifiers(cp_stars_id)
+        return self._get_star_detail('identifiers', cp_stars_id)
 
     def get_identifiers_for_star_by_renson(self, renson_id: str) -> list[Identifier]:
         """
@@ -133,8 +721,7 @@ class CPStars:
         :param renson_id: Renson identifier
         :return: list of identifiers of the given star
         """
-        star: Star = self.stars_controller.get_star_by_renson_id(renson_id)
-        return self.stars_controller.get_star_identifiers(star.id)
+        return self._get_star_detail('identifiers', self._resolve_renson(renson_id))
 
     def get_simbad_external_details(self, star_name: str) -> ExternalDetails:
         """
@@ -157,7 +744,7 @@ class CPStars:
         :param cp_stars_id: CP-Stars database identifier
         :return: list of attributes of given star
         """
-        return self.stars_controller.get_star_datasource_attributes(cp_stars_id)
+        return self._get_star_detail('attributes', cp_stars_id)
 
     def get_star_attributes_by_renson(self, renson_id: str) -> list[StarDatasourceAttribute]:
         """
@@ -170,8 +757,7 @@ class CPStars:
         :param renson_id: Renson identifier
         :return: list of attributes of given star
         """
-        star: Star = self.stars_controller.get_star_by_renson_id(renson_id)
-        return self.stars_controller.get_star_datasource_attributes(star.id)
+        return self._get_star_detail('attributes', self._resolve_renson(renson_id))
 
     def get_star(self, cp_stars_id: int) -> Star:
         """
@@ -183,7 +769,27 @@ class CPStars:
         :param cp_stars_id: CP-Stars identifier
         :return: star information
         """
-        return self.stars_controller.get_star(cp_stars_id)
+        return self._get_star_detail('star', cp_stars_id)
+
+    def get_extended_star(self, cp_stars_id: int) -> ExtendedStar:
+        """
+        Get star information (see get_star) including external details
+        using CP-Stars database identifier.
+
+        :param cp_stars_id: CP-Stars identifier
+        :return: extended star information
+        """
+        return self.stars_controller.get_extended_star(cp_stars_id)
+
+    def get_extended_star_by_renson(self, renson_id: str) -> ExtendedStar:
+        """
+        Get star information (see get_star) including external details
+        using Renson identifier.
+
+        :param renson_id: Renson identifier
+        :return: extended star information
+        """
+        return self.get_extended_star(self._resolve_renson(renson_id))
 
     def get_star_by_renson(self, renson_id: str) -> Star:
         """
@@ -195,7 +801,68 @@ class CPStars:
         :param renson_id: Renson identifier
         :return: star information
         """
-        return self.stars_controller.get_star_by_renson_id(renson_id)
+        cp_stars_id = self._lookup_renson(renson_id)
+        if cp_stars_id is not None:
+            return self._get_star_detail('star', cp_stars_id)
+
+        star: Star = self.stars_controller.get_star_by_renson_id(renson_id)
+        if self.renson_index is not None:
+            self.renson_index.add(renson_id, star.id)
+        return star
+
+    def get_star_dossier(self, cp_stars_id: int, extended: bool = False, light_curve: bool = True,
+                         star: Star = None) -> StarDossier:
+        """
+        Obtain all information about the given star specified by CP-Stars database identifier
+        (star, identifiers, attributes, magnitudes, magnitudes attributes, motion-related info,
+        radial velocities and light curve). Requests are sent in parallel, thus the call takes
+        about as long as the slowest of them. Requests are sent by dossier_executor, thus the function
+        may be also called from bulk functions (e.g. as function of _query_stars).
+
+        :param cp_stars_id: CP-Stars database identifier
+        :param extended: if True, star is obtained in extended version (including external details)
+        :param light_curve: if False, light curve is not obtained (light_curve is None)
+        :param star: already obtained star (not requested again)
+        :return: star dossier
+        """
+        functions = {
+            'star': self.get_extended_star if extended else self.get_star,
+            'identifiers': self.get_identifiers_for_star,
+            'attributes': self.get_star_attributes,
+            'magnitudes': self.get_magnitudes_for_star,
+            'magnitude_attributes': self.get_magnitudes_attributes_for_star,
+            'motions': self.get_motion_related_info_for_star,
+            'radial_velocities': self.get_radial_velocities_for_star,
+            'light_curve': self.get_light_curve_for_star if light_curve else None,
+        }
+        if star is not None and not extended:
+            functions['star'] = None
+
+        pending = {
+            field: self.dossier_executor.submit(function, cp_stars_id)
+            for field, function in functions.items() if function is not None
+        }
+        values = {'star': star, 'light_curve': None}
+        values.update((field, future.result()) for field, future in pending.items())
+        return StarDossier(**values)
+
+    def get_star_dossier_by_renson(self, renson_id: str, extended: bool = False,
+                                   light_curve: bool = True) -> StarDossier:
+        """
+        Obtain all information about the given star specified by Renson identifier, see get_star_dossier.
+        If the CP-Stars identifier cannot be found locally, star is obtained first.
+
+        :param renson_id: Renson identifier
+        :param extended: if True, star is obtained in extended version (including external details)
+        :param light_curve: if False, light curve is not obtained (light_curve is None)
+        :return: star dossier
+        """
+        cp_stars_id = self._lookup_renson(renson_id)
+        if cp_stars_id is not None:
+            return self.get_star_dossier(cp_stars_id, extended, light_curve)
+
+        star = self.get_star_by_renson(renson_id)
+        return self.get_star_dossier(star.id, extended, light_curve, star=star)
 
     def get_magnitudes_attributes_for_star(self, cp_stars_id: int) -> list[MagnitudeAttribute]:
         """
@@ -205,7 +872,7 @@ class CPStars:
         :param cp_stars_id: CP-Stars database identifier
         :return: list of stellar magnitudes attributes
         """
-        return self.stars_controller.get_star_magnitude_attributes(cp_stars_id)
+        return self._get_star_detail('magnitude_attributes', cp_stars_id)
 
     def get_magnitudes_attributes_for_star_by_renson(self, renson_id: str) -> list[MagnitudeAttribute]:
         """
@@ -215,8 +882,7 @@ class CPStars:
         :param renson_id: Renson identifier
         :return: list of stellar magnitudes attributes
         """
-        star: Star = self.stars_controller.get_star_by_renson_id(renson_id)
-        return self.stars_controller.get_star_magnitude_attributes(star.id)
+        return self._get_star_detail('magnitude_attributes', self._resolve_renson(renson_id))
 
     def get_magnitudes_for_star(self, cp_stars_id: int) -> [Magnitude]:
         """
@@ -226,7 +892,7 @@ class CPStars:
         :param cp_stars_id: Cp-Stars identifier
         :return: list of star magnitudes
         """
-        return self.stars_controller.get_star_magnitudes(cp_stars_id)
+        return self._get_star_detail('magnitudes', cp_stars_id)
 
     def get_magnitudes_for_star_by_renson(self, renson_id: str) -> [Magnitude]:
         """
@@ -236,8 +902,7 @@ class CPStars:
         :param renson_id: Renson identifier
         :return: list of star magnitudes
         """
-        star: Star = self.stars_controller.get_star_by_renson_id(renson_id)
-        return self.stars_controller.get_star_magnitudes(star.id)
+        return self._get_star_detail('magnitudes', self._resolve_renson(renson_id))
 
     def get_motion_related_info_for_star(self, cp_stars_id: int) -> list[Motion]:
         """
@@ -249,7 +914,7 @@ class CPStars:
         :param cp_stars_id: CP-Stars identifier
         :return: list of motion-related values for given star
         """
-        return self.stars_controller.get_star_motions(cp_stars_id)
+        return self._get_star_detail('motions', cp_stars_id)
 
     def get_motion_related_info_for_star_by_renson(self, renson_id: str) -> list[Motion]:
         """
@@ -261,8 +926,7 @@ class CPStars:
         :param renson_id: Renson identifier
         :return: list of motion-related values for given star
         """
-        star: Star = self.stars_controller.get_star_by_renson_id(renson_id)
-        return self.stars_controller.get_star_motions(star.id)
+        return self._get_star_detail('motions', self._resolve_renson(renson_id))
 
     def get_radial_velocities_for_star(self, cp_stars_id: int) -> list[RadialVelocity]:
         """
@@ -272,7 +936,7 @@ class CPStars:
         :param cp_stars_id: CP-Stars identifier
         :return: list of radial velocities of the given star
         """
-        return self.stars_controller.get_star_radial_velocities(cp_stars_id)
+        return self._get_star_detail('radial_velocities', cp_stars_id)
 
     def get_radial_velocities_for_star_by_renson(self, renson_id: str) -> [RadialVelocity]:
         """
@@ -282,8 +946,7 @@ class CPStars:
         :param renson_id: Renson identifier
         :return: list of radial velocities of the given star
         """
-        star: Star = self.stars_controller.get_star_by_renson_id(renson_id)
-        return self.stars_controller.get_star_radial_velocities(star.id)
+        return self._get_star_detail('radial_velocities', self._resolve_renson(renson_id))
 
     def get_light_curve_for_star(self, cp_stars_id: int) -> list[LightCurveMeasurement]:
         """
@@ -305,6 +968,59 @@ class CPStars:
         """
         return self.stars_controller.get_star_light_curve_measurements_by_renson(renson_id)
 
+    def iter_light_curve_for_star(self, cp_stars_id: int) -> Iterator[LightCurveMeasurement]:
+        """
+        Obtain stellar light curve measurements for the given star specified by CP-Stars
+        database identifier one by one, decoded while the response is received.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: generator of stellar light curve measurements
+        """
+        from openapi_client.model.light_curve_measurement import LightCurveMeasurement
+        return self._stream_models(LightCurveMeasurement, self.stars_controller.get_star_light_curve_measurements,
+                                   cp_stars_id)
+
+    def iter_light_curve_array_chunks(self, cp_stars_id: int,
+                                      chunk_length: int = 65536) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Obtain stellar light curve measurements for the given star specified by CP-Stars
+        database identifier as NumPy arrays in chunks, decoded while the response is received.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :param chunk_length: maximum number of measurements in a chunk
+        :return: generator of tuples of contiguous float64 arrays (times, values)
+        """
+        measurements = self._stream_json(self.stars_controller.get_star_light_curve_measurements, cp_stars_id)
+        return iter_array_chunks(measurements, 'time', 'value', chunk_length)
+
+    def get_light_curve_array(self, cp_stars_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain stellar light curve measurements for the given star
+        specified by CP-Stars database identifier as NumPy arrays.
+
+        Response is decoded directly into arrays, no LightCurveMeasurement
+        objects are created, so the result can be used in vectorized code right away.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: tuple of contiguous float64 arrays (times, values)
+        """
+        measurements = self._get_json(self.stars_controller.get_star_light_curve_measurements, cp_stars_id)
+        return measurements_to_arrays(measurements, 'time', 'value')
+
+    def get_light_curve_array_by_renson(self, renson_id: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain stellar light curve measurements for the given star
+        specified by Renson identifier as NumPy arrays.
+
+        Response is decoded directly into arrays, no LightCurveMeasurement
+        objects are created, so the result can be used in vectorized code right away.
+
+        :param renson_id: Renson identifier
+        :return: tuple of contiguous float64 arrays (times, values)
+        """
+        measurements = self._get_json(self.stars_controller.get_star_light_curve_measurements_by_renson, renson_id)
+        return measurements_to_arrays(measurements, 'time', 'value')
+
     def get_spectrum_for_star(self, cp_stars_id: int) -> list[SpectrumMeasurement]:
         """
         Obtain stellar spectrum measurements for the given star
@@ -325,6 +1041,223 @@ class CPStars:
         """
         return self.stars_controller.get_star_spectra_measurements_by_renson(renson_id)
 
+    def iter_spectrum_for_star(self, cp_stars_id: int) -> Iterator[SpectrumMeasurement]:
+        """
+        Obtain stellar spectrum measurements for the given star specified by CP-Stars
+        database identifier one by one, decoded while the response is received.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: generator of stellar spectrum measurements
+        """
+        from openapi_client.model.spectrum_measurement import SpectrumMeasurement
+        return self._stream_models(SpectrumMeasurement, self.stars_controller.get_star_spectra_measurements,
+                                   cp_stars_id)
+
+    def iter_spectrum_array_chunks(self, cp_stars_id: int,
+                                   chunk_length: int = 65536) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Obtain stellar spectrum measurements for the given star specified by CP-Stars
+        database identifier as NumPy arrays in chunks, decoded while the response is received.
+
+        Chunks are in the order of the response, i.e. not sorted by wavelength (see get_spectrum_array).
+
+        :param cp_stars_id: CP-Stars database identifier
+        :param chunk_length: maximum number of measurements in a chunk
+        :return: generator of tuples of contiguous float64 arrays (wavelengths, fluxes)
+        """
+        measurements = self._stream_json(self.stars_controller.get_star_spectra_measurements, cp_stars_id)
+        return iter_array_chunks(measurements, 'wavelength', 'flux', chunk_length)
+
+    def get_spectrum_array(self, cp_stars_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain stellar spectrum measurements for the given star
+        specified by CP-Stars database identifier as NumPy arrays.
+
+        Response is decoded directly into arrays, no SpectrumMeasurement objects are created.
+        Arrays are always sorted by wavelength, thus e.g. numpy.searchsorted can be used
+        to extract line windows.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: tuple of contiguous float64 arrays (wavelengths, fluxes) sorted by wavelength
+        """
+        measurements = self._get_json(self.stars_controller.get_star_spectra_measurements, cp_stars_id)
+        return sort_arrays_by_first(*measurements_to_arrays(measurements, 'wavelength', 'flux'))
+
+    def get_spectrum_array_by_renson(self, renson_id: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain stellar spectrum measurements for the given star
+        specified by Renson identifier as NumPy arrays.
+
+        Response is decoded directly into arrays, no SpectrumMeasurement objects are created.
+        Arrays are always sorted by wavelength, thus e.g. numpy.searchsorted can be used
+        to extract line windows.
+
+        :param renson_id: Renson identifier
+        :return: tuple of contiguous float64 arrays (wavelengths, fluxes) sorted by wavelength
+        """
+        measurements = self._get_json(self.stars_controller.get_star_spectra_measurements_by_renson, renson_id)
+        return sort_arrays_by_first(*measurements_to_arrays(measurements, 'wavelength', 'flux'))
+
+    def resolve_renson_ids(self, renson_ids: list[str]) -> dict[str, Optional[int]]:
+        """
+        Resolve CP-Stars identifiers of many stars specified by Renson identifiers at once.
+        Identifiers are looked up in catalog mirror and Renson index first, the rest is found in basic
+        information of all stars (single request) and only identifiers missing there are queried one by one
+        (in parallel). A few identifiers are queried one by one directly.
+
+        :param renson_ids: Renson identifiers
+        :return: dictionary of Renson identifier -> CP-Stars database identifier (None if the star does not exist)
+        """
+        resolved = {}
+        for renson_id in renson_ids:
+            if renson_id not in resolved:
+                resolved[renson_id] = self._lookup_renson(renson_id)
+        missing = [renson_id for renson_id, cp_stars_id in resolved.items() if cp_stars_id is None]
+
+        if len(missing) >= RENSON_DOWNLOAD_THRESHOLD or (missing and self._spatial_table is not None):
+            table = self._spatial_table if self._spatial_table is not None else self.get_basic_info_table()
+            for renson_id in missing:
+                index = table.get_index_by_renson(renson_id)
+                if index is not None:
+                    resolved[renson_id] = int(table['id'][index])
+            missing = [renson_id for renson_id in missing if resolved[renson_id] is None]
+
+        def query_renson(renson_id):
+            try:
+                return self._get_json(self.stars_controller.get_star_by_renson_id, renson_id)['id']
+            except NotFoundException:
+                return None
+
+        pending = [(renson_id, self.api_client.pool.apply_async(query_renson, (renson_id,)))
+                   for renson_id in missing]
+        for renson_id, async_result in pending:
+            cp_stars_id = async_result.get()
+            if cp_stars_id is not None:
+                resolved[renson_id] = cp_stars_id
+                if self.renson_index is not None:
+                    self.renson_index.add(renson_id, cp_stars_id)
+        return resolved
+
+    def get_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Get star information (see get_star) of multiple stars specified by CP-Stars database identifiers.
+        Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_star, cp_stars_ids)
+
+    def get_identifiers_for_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Obtain identifiers (see get_identifiers_for_star) of multiple stars
+        specified by CP-Stars database identifiers. Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_identifiers_for_star, cp_stars_ids)
+
+    def get_star_attributes_for_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Obtain attributes (see get_star_attributes) of multiple stars
+        specified by CP-Stars database identifiers. Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_star_attributes, cp_stars_ids)
+
+    def get_magnitudes_attributes_for_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Obtain stellar magnitudes attributes (see get_magnitudes_attributes_for_star) of multiple stars
+        specified by CP-Stars database identifiers. Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_magnitudes_attributes_for_star, cp_stars_ids)
+
+    def get_magnitudes_for_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Obtain magnitudes (see get_magnitudes_for_star) of multiple stars
+        specified by CP-Stars database identifiers. Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_magnitudes_for_star, cp_stars_ids)
+
+    def get_motion_related_info_for_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Obtain motion-related information (see get_motion_related_info_for_star) of multiple stars
+        specified by CP-Stars database identifiers. Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_motion_related_info_for_star, cp_stars_ids)
+
+    def get_radial_velocities_for_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Obtain radial velocities (see get_radial_velocities_for_star) of multiple stars
+        specified by CP-Stars database identifiers. Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_radial_velocities_for_star, cp_stars_ids)
+
+    def get_light_curves_for_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Obtain stellar light curve measurements (see get_light_curve_for_star) of multiple stars
+        specified by CP-Stars database identifiers. Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_light_curve_for_star, cp_stars_ids)
+
+    def get_light_curve_arrays_for_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Obtain stellar light curves as NumPy arrays (see get_light_curve_array) of multiple stars
+        specified by CP-Stars database identifiers. Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_light_curve_array, cp_stars_ids)
+
+    def get_spectra_for_stars(self, cp_stars_ids: list[int]) -> list[StarQueryResult]:
+        """
+        Obtain stellar spectrum measurements (see get_spectrum_for_star) of multiple stars
+        specified by CP-Stars database identifiers. Stars are queried in parallel.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return self._query_stars(self.get_spectrum_for_star, cp_stars_ids)
+
+    def get_datasources(self) -> list[DataSourceBasicInfo]:
+        """
+        Obtain basic information of all data sources (catalogs the values of stars come from).
+        Data sources are loaded once for all CPStars instances of the same server (each instance builds
+        its own objects), see cpstars_datasources.py.
+
+        :return: list of data sources with basic information
+        """
+        return self.datasource_registry.get_all()
+
+    def get_datasource(self, datasource_id: int) -> DataSource:
+        """
+        Obtain data source specified by identifier (e.g. datasource.id of a magnitude),
+        see get_datasources.
+
+        :param datasource_id: data source identifier
+        :return: data source information
+        """
+        return self.datasource_registry.get(datasource_id)
+
     def get_vizier_metadata(self, star_name: str) -> ExternalDetails:
         """
         Obtain Vizier database metadata containing tables the given star is present in.
@@ -0,0 +1,88 @@
+"""
+|    NumPy conversions shared by CPStars (cpstars.py) and AsyncCPStars (cpstars_async.py).
+|
+|    Functions convert decoded JSON measurements (light curves, spectra) into pairs of float64 arrays
+|    and select rows of basic information table found by spatial index. NumPy is imported when
+|    a function is called for the first time, thus importing this module is cheap.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from cpstars_table import StarBasicInfoTable
+
+
+def measurements_to_arrays(measurements: list, x_key: str, y_key: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert decoded JSON measurements (list of dicts) into two contiguous float64 arrays.
+
+    :param measurements: decoded JSON list of measurements
+    :param x_key: JSON key of the independent variable (e.g. 'time')
+    :param y_key: JSON key of the dependent variable (e.g. 'value')
+    :return: tuple of (x, y) float64 arrays
+    """
+    import numpy as np
+
+    count = len(measurements)
+    x = np.fromiter((measurement[x_key] for measurement in measurements), dtype=np.float64, count=count)
+    y = np.fromiter((measurement[y_key] for measurement in measurements), dtype=np.float64, count=count)
+    return x, y
+
+
+def sort_arrays_by_first(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sort pair of arrays by values of the first one (stable).
+    Arrays that are already sorted are returned as they are, without copying.
+
+    :param x: array the pair is sorted by
+    :param y: array reordered along with x
+    :return: tuple of (x, y) sorted by x
+    """
+    import numpy as np
+
+    if x.size < 2 or not np.any(x[1:] < x[:-1]):
+        return x, y
+
+    order = np.argsort(x, kind='stable')
+    return x[order], y[order]
+
+
+def iter_array_chunks(measurements: Iterator[dict], x_key: str, y_key: str,
+                      chunk_length: int) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Convert stream of measurements to pairs of float64 arrays of at most chunk_length items.
+
+    :param measurements: decoded JSON measurements (dicts)
+    :param x_key: key of the first value (e.g. time)
+    :param y_key: key of the second value (e.g. value)
+    :param chunk_length: maximum number of measurements in a chunk
+    :return: generator of tuples of arrays (x, y)
+    """
+    while True:
+        chunk = list(itertools.islice(measurements, chunk_length))
+        if not chunk:
+            return
+        yield measurements_to_arrays(chunk, x_key, y_key)
+
+
+def select_stars(table: StarBasicInfoTable, cp_stars_ids: np.ndarray,
+                 separations: np.ndarray = None) -> StarBasicInfoTable:
+    """
+    Select rows of the given stars (e.g. found by spatial index), stars missing in the table are skipped.
+
+    :param table: basic information table of all stars
+    :param cp_stars_ids: CP-Stars identifiers of the stars in the order of the result
+    :param separations: angular separations of the stars, added as 'separation' column if specified
+    :return: table of the selected stars
+    """
+    indices = table.get_indices_by_ids(cp_stars_ids)
+    found = indices >= 0
+    selected = table[indices[found]]
+    if separations is not None:
+        selected = selected.with_column('separation', separations[found])
+    return selected
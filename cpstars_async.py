@@ -0,0 +1,798 @@
+"""
+|    Asyncio version of the CP-Stars Database Application library.
+|
+|    AsyncCPStars provides the query functions of CPStars class (cpstars.py), all of them
+|    are coroutines. Requests are sent by non-blocking HTTP transport (openapi_client/async_rest.py)
+|    with its own connection pooling, limit of requests in flight and timeouts, thus many
+|    concurrent queries do not block the event loop nor occupy threads.
+|
+|    Features of CPStars built on the blocking transport are not available:
+|        - catalog mirror and refresh_catalog
+|        - streaming functions (iter_basic_info_for_stars, iter_light_curve_for_star, ...)
+|        - HTTP cache, result cache and request coalescing
+|        - metrics collector and retry policy
+|
+|       Example:
+|           -------------------------------------------------------------------------------------------------
+|              async with AsyncCPStars() as cpstars_instance:
+|                  magnitudes = await cpstars_instance.get_magnitudes_for_star_by_renson('710')
+|                  results = await cpstars_instance.get_magnitudes_for_stars(range(1, 1001))
+|           -------------------------------------------------------------------------------------------------
+"""
+
+import asyncio
+import json
+from typing import Iterator, Optional, Union
+from urllib.parse import quote
+
+import numpy as np
+
+from cpstars import StarDossier, StarQueryResult
+from cpstars_arrays import measurements_to_arrays, select_stars, sort_arrays_by_first
+from cpstars_catalog import RENSON_DOWNLOAD_THRESHOLD, RensonIndex
+from cpstars_spatial import CrossmatchResult, SpatialIndex
+from cpstars_table import StarBasicInfoTable
+from openapi_client import ApiClient, Configuration
+from openapi_client.api.datasources_controller_api import DatasourcesControllerApi
+from openapi_client.api.external_services_controller_api import ExternalServicesControllerApi
+from openapi_client.api.stars_controller_api import StarsControllerApi
+from openapi_client.async_rest import AsyncRESTClientObject
+from openapi_client.exceptions import ApiException, NotFoundException
+
+from openapi_client.model.data_source import DataSource
+from openapi_client.model.data_source_basic_info import DataSourceBasicInfo
+from openapi_client.model.extended_star import ExtendedStar
+from openapi_client.model.external_details import ExternalDetails
+from openapi_client.model.identifier import Identifier
+from openapi_client.model.light_curve_measurement import LightCurveMeasurement
+from openapi_client.model.magnitude import Magnitude
+from openapi_client.model.magnitude_attribute import MagnitudeAttribute
+from openapi_client.model.motion import Motion
+from openapi_client.model.radial_velocity import RadialVelocity
+from openapi_client.model.spectrum_measurement import SpectrumMeasurement
+from openapi_client.model.star import Star
+from openapi_client.model.star_basic_info import StarBasicInfo
+from openapi_client.model.star_datasource_attribute import StarDatasourceAttribute
+
+
+class AsyncCPStars:
+    """
+    Class used for querying CP-Stars Database (backend) from asyncio code.
+
+    If no specific configuration is provided, default configuration is used.
+    Only query functions of CPStars are provided, see module documentation.
+    Instance should be closed (or used as async context manager) to release pooled connections.
+    """
+
+    def __init__(self, host_address=None, trusted_server: bool = False,
+                 renson_index: Union[RensonIndex, str, bool] = False,
+                 max_connections: int = None, timeout=None, intern_models: str = None,
+                 model_representation: str = 'model', spatial_index: Union[SpatialIndex, str] = None):
+        """
+        AsyncCPStars class constructor.
+        Default configuration may be overridden in case different backend should be queried.
+
+        :param host_address: CP-Stars database backend (server) address
+        :param trusted_server: if True, responses are deserialized by precompiled decoders
+                               without client side type validation (faster for large responses)
+        :param renson_index: Renson -> CP-Stars identifier index used by *_by_renson functions,
+                             see CPStars
+        :param max_connections: maximum number of requests in flight (and of pooled connections),
+                                size of the connection pool from configuration is used by default
+        :param timeout: timeout of requests in seconds, either total or pair (tuple) of (connection, read) timeouts
+        :param intern_models: sharing of embedded stars and data sources equal by identifier ('response' or 'session'),
+                              requires model_representation 'model', see CPStars
+        :param model_representation: 'model', 'lazy' (properties converted when accessed)
+                                     or 'compact' (immutable records), see CPStars
+        :param spatial_index: index of star positions used by cone_search and other spatial functions (or path
+                              of its file), index is built in memory on first use by default, see CPStars
+        """
+        configuration = Configuration(host_address)
+        configuration.trusted_server = trusted_server
+        configuration.intern_models = intern_models
+        configuration.model_representation = model_representation
+
+        # ApiClient and controllers are used only for endpoints metadata and deserialization,
+        # requests are sent by the asynchronous transport
+        self.api_client = ApiClient(configuration)
+        self.rest_client = AsyncRESTClientObject(configuration, maxsize=max_connections, timeout=timeout)
+        self.stars_controller = StarsControllerApi(self.api_client)
+        self.external_services_controller = ExternalServicesControllerApi(self.api_client)
+        self.datasources_controller = DatasourcesControllerApi(self.api_client)
+        if renson_index is True:
+            renson_index = RensonIndex()
+        elif isinstance(renson_index, str):
+            renson_index = RensonIndex(renson_index)
+        self.renson_index = renson_index or None
+        self._renson_index_lock = None
+        if spatial_index is None or isinstance(spatial_index, str):
+            spatial_index = SpatialIndex(spatial_index)
+        self.spatial_index = spatial_index
+        self._spatial_table = None
+        self._spatial_table_lock = None
+        # data sources are loaded once per instance (CPStars shares them by process-wide registry)
+        self._datasource_basic_infos = None
+        self._datasource_basic_infos_lock = None
+        self._datasources = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self.rest_client.close()
+
+    async def _get_json(self, endpoint, path_value=None):
+        """
+        Send request of the given generated endpoint and return decoded JSON body of the response.
+
+        :param endpoint: generated endpoint (e.g. stars_controller.get_star_endpoint)
+        :param path_value: value of the path parameter (if the endpoint has one)
+        :return: decoded JSON (lists and dicts)
+        """
+        configuration = self.api_client.configuration
+        resource_path = endpoint.settings['endpoint_path']
+        for param_name, location in endpoint.location_map.items():
+            if location == 'path':
+                resource_path = resource_path.replace(
+                    '{%s}' % endpoint.attribute_map[param_name],
+                    quote(str(path_value), safe=configuration.safe_chars_for_path_param)
+                )
+
+        headers = dict(self.api_client.default_headers)
+        headers['Accept'] = self.api_client.select_header_accept(endpoint.headers_map['accept'])
+        try:
+            response = await self.rest_client.request(
+                endpoint.settings['http_method'], configuration.host + resource_path, headers=headers)
+        except ApiException as e:
+            # transport errors (status 0) have no body
+            if isinstance(e.body, bytes):
+                e.body = e.body.decode('utf-8')
+            raise e
+        return json.loads(response.data)
+
+    async def _call(self, endpoint, path_value=None):
+        """
+        Send request of the given generated endpoint and deserialize its response.
+
+        :param endpoint: generated endpoint (e.g. stars_controller.get_star_endpoint)
+        :param path_value: value of the path parameter (if the endpoint has one)
+        :return: deserialized response (model object or list of model objects)
+        """
+        received_data = await self._get_json(endpoint, path_value)
+        return self.api_client.deserialize_data(received_data, endpoint.settings['response_type'])
+
+    async def _lookup_renson(self, renson_id: str) -> Optional[int]:
+        """
+        Find CP-Stars identifier of the star specified by Renson identifier in Renson index
+        (index is built from a single /stars request when used for the first time).
+
+        :param renson_id: Renson identifier
+        :return: CP-Stars database identifier or None if not found locally
+        """
+        if self.renson_index is None:
+            return None
+
+        if not self.renson_index.is_built():
+            if self._renson_index_lock is None:
+                self._renson_index_lock = asyncio.Lock()
+            async with self._renson_index_lock:
+                if not self.renson_index.is_built():
+                    self.renson_index.build(
+                        await self._get_json(self.stars_controller.get_basic_info_stars_list_endpoint))
+        return self.renson_index.get(renson_id)
+
+    async def _resolve_renson(self, renson_id: str) -> int:
+        """
+        Resolve CP-Stars identifier of the star specified by Renson identifier,
+        Renson index is used if available, server is queried only in case of miss.
+
+        :param renson_id: Renson identifier
+        :return: CP-Stars database identifier
+        """
+        cp_stars_id = await self._lookup_renson(renson_id)
+        if cp_stars_id is not None:
+            return cp_stars_id
+
+        star: Star = await self._call(self.stars_controller.get_star_by_renson_id_endpoint, renson_id)
+        if self.renson_index is not None:
+            self.renson_index.add(renson_id, star.id)
+        return star.id
+
+    async def _query_stars(self, function, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Await the given single-star coroutine function for each of the stars concurrently
+        (number of requests in flight is limited by the transport).
+
+        :param function: coroutine function accepting CP-Stars identifier
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: list of results in the order of given identifiers, failures do not abort the batch
+        """
+        cp_stars_ids = list(cp_stars_ids)
+        values = await asyncio.gather(*(function(cp_stars_id) for cp_stars_id in cp_stars_ids),
+                                      return_exceptions=True)
+        for value in values:
+            # cancellation (asyncio.CancelledError) is not a failure of a single query, it aborts the batch
+            if isinstance(value, BaseException) and not isinstance(value, Exception):
+                raise value
+        return [
+            StarQueryResult(cp_stars_id, None, value) if isinstance(value, Exception)
+            else StarQueryResult(cp_stars_id, value, None)
+            for cp_stars_id, value in zip(cp_stars_ids, values)
+        ]
+
+    async def get_basic_info_for_stars(self) -> list[StarBasicInfo]:
+        """
+        Obtain list of all stars from the database containing basic information, see CPStars.
+
+        :return: list of stars in the database with basic information
+        """
+        return await self._call(self.stars_controller.get_basic_info_stars_list_endpoint)
+
+    async def get_basic_info_table(self) -> StarBasicInfoTable:
+        """
+        Obtain basic information of all stars as columnar table, see CPStars.get_basic_info_table.
+
+        :return: table of stars in the database with basic information
+        """
+        return StarBasicInfoTable.from_json(
+            await self._get_json(self.stars_controller.get_basic_info_stars_list_endpoint))
+
+    async def _get_spatial_table(self) -> StarBasicInfoTable:
+        """
+        :return: basic information table of stars found by spatial index (index is built on first use)
+        """
+        if self._spatial_table is None:
+            if self._spatial_table_lock is None:
+                self._spatial_table_lock = asyncio.Lock()
+            async with self._spatial_table_lock:
+                if self._spatial_table is None:
+                    table = await self.get_basic_info_table()
+                    if not self.spatial_index.is_built():
+                        self.spatial_index.build(table)
+                    self._spatial_table = table
+        return self._spatial_table
+
+    async def cone_search(self, right_ascension: float, declination: float, radius: float) -> StarBasicInfoTable:
+        """
+        Obtain stars within the given angular distance of the position (ICRS coordinates), see CPStars.cone_search.
+
+        :param right_ascension: right ascension of the center in degrees
+        :param declination: declination of the center in degrees
+        :param radius: radius of the cone in degrees
+        :return: table of stars with basic information and 'separation' column (degrees), sorted by separation
+        """
+        table = await self._get_spatial_table()
+        return select_stars(table, *self.spatial_index.cone_search(right_ascension, declination, radius))
+
+    async def get_nearest_stars(self, right_ascension: float, declination: float,
+                                count: int = 1) -> StarBasicInfoTable:
+        """
+        Obtain stars closest to the position (ICRS coordinates), see CPStars.get_nearest_stars.
+
+        :param right_ascension: right ascension in degrees
+        :param declination: declination in degrees
+        :param count: number of stars
+        :return: table of stars with basic information and 'separation' column (degrees), sorted by separation
+        """
+        table = await self._get_spatial_table()
+        return select_stars(table, *self.spatial_index.nearest(right_ascension, declination, count))
+
+    async def box_search(self, right_ascension_min: float, right_ascension_max: float,
+                         declination_min: float, declination_max: float) -> StarBasicInfoTable:
+        """
+        Obtain stars within the box of ICRS coordinates, see CPStars.box_search.
+
+        :param right_ascension_min: minimum right ascension in degrees
+        :param right_ascension_max: maximum right ascension in degrees (box crosses 0h if lower than minimum)
+        :param declination_min: minimum declination in degrees
+        :param declination_max: maximum declination in degrees
+        :return: table of stars with basic information
+        """
+        table = await self._get_spatial_table()
+        return select_stars(table, self.spatial_index.box_search(right_ascension_min, right_ascension_max,
+                                                                 declination_min, declination_max))
+
+    async def crossmatch(self, right_ascensions: np.ndarray, declinations: np.ndarray, max_separation: float,
+                         mode: str = 'best', chunk_size: int = 65536) -> CrossmatchResult:
+        """
+        Match positions (ICRS coordinates) with stars of the database, see CPStars.crossmatch.
+
+        :param right_ascensions: right ascensions of positions in degrees
+        :param declinations: declinations of positions in degrees
+        :param max_separation: maximum angular separation of matched star in degrees
+        :param mode: 'best' for the closest star of each position, 'all' for all stars within max_separation
+        :param chunk_size: maximum number of positions processed at once (bounds memory usage)
+        :return: arrays of position indices, CP-Stars identifiers, Renson identifiers and separations (degrees)
+                 with an item per match
+        """
+        await self._get_spatial_table()
+        return self.spatial_index.crossmatch(right_ascensions, declinations, max_separation, mode, chunk_size)
+
+    async def iter_crossmatch(self, right_ascensions: np.ndarray, declinations: np.ndarray, max_separation: float,
+                              mode: str = 'best', chunk_size: int = 65536) -> Iterator[CrossmatchResult]:
+        """
+        Match positions with stars of the database chunk by chunk, see CPStars.iter_crossmatch.
+        Only the index is awaited, the returned generator matches the chunks locally without any request.
+
+        :return: generator of matches of successive chunks of positions
+        """
+        await self._get_spatial_table()
+        return self.spatial_index.iter_crossmatch(right_ascensions, declinations, max_separation, mode, chunk_size)
+
+    async def get_identifiers_for_star(self, cp_stars_id: int) -> list[Identifier]:
+        """
+        Obtain identifiers that are stored in the database for the given star
+        specified by CP-Stars database identifier.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: list of identifiers of the given star
+        """
+        return await self._call(self.stars_controller.get_star_identifiers_endpoint, cp_stars_id)
+
+    async def get_identifiers_for_star_by_renson(self, renson_id: str) -> list[Identifier]:
+        """
+        Obtain identifiers that are stored in the database for the given star
+        specified by Renson identifier.
+
+        :param renson_id: Renson identifier
+        :return: list of identifiers of the given star
+        """
+        return await self.get_identifiers_for_star(await self._resolve_renson(renson_id))
+
+    async def get_simbad_external_details(self, star_name: str) -> ExternalDetails:
+        """
+        Obtain specific subset of information from SIMBAD database.
+        Stellar name has to be specified including data source identification, e.g. 'Renson 61590'.
+
+        :param star_name: star name that will be used for querying external services
+        :return: external details object with SIMBAD details (subset) filled only
+        """
+        return await self._call(self.external_services_controller.get_simbad_external_details_endpoint, star_name)
+
+    async def get_star_attributes(self, cp_stars_id: int) -> list[StarDatasourceAttribute]:
+        """
+        Obtain list of attributes belonging to the specified star.
+        CP-Stars database identifier is used to find corresponding attributes.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: list of attributes of given star
+        """
+        return await self._call(self.stars_controller.get_star_datasource_attributes_endpoint, cp_stars_id)
+
+    async def get_star_attributes_by_renson(self, renson_id: str) -> list[StarDatasourceAttribute]:
+        """
+        Obtain list of attributes belonging to the specified star.
+        Renson identifier is used to find corresponding attributes.
+
+        :param renson_id: Renson identifier
+        :return: list of attributes of given star
+        """
+        return await self.get_star_attributes(await self._resolve_renson(renson_id))
+
+    async def get_star(self, cp_stars_id: int) -> Star:
+        """
+        Get star information using CP-Stars database identifier.
+
+        :param cp_stars_id: CP-Stars identifier
+        :return: star information
+        """
+        return await self._call(self.stars_controller.get_star_endpoint, cp_stars_id)
+
+    async def get_star_by_renson(self, renson_id: str) -> Star:
+        """
+        Get star information using Renson identifier.
+
+        :param renson_id: Renson identifier
+        :return: star information
+        """
+        if self.renson_index is not None:
+            return await self.get_star(await self._resolve_renson(renson_id))
+        return await self._call(self.stars_controller.get_star_by_renson_id_endpoint, renson_id)
+
+    async def get_extended_star(self, cp_stars_id: int) -> ExtendedStar:
+        """
+        Get star information (see get_star) including external details
+        using CP-Stars database identifier.
+
+        :param cp_stars_id: CP-Stars identifier
+        :return: extended star information
+        """
+        return await self._call(self.stars_controller.get_extended_star_endpoint, cp_stars_id)
+
+    async def get_extended_star_by_renson(self, renson_id: str) -> ExtendedStar:
+        """
+        Get star information (see get_star) including external details
+        using Renson identifier.
+
+        :param renson_id: Renson identifier
+        :return: extended star information
+        """
+        return await self.get_extended_star(await self._resolve_renson(renson_id))
+
+    async def get_star_dossier(self, cp_stars_id: int, extended: bool = False, light_curve: bool = True,
+                               star: Star = None) -> StarDossier:
+        """
+        Obtain all information about the given star specified by CP-Stars database identifier,
+        see CPStars.get_star_dossier. Requests are sent concurrently.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :param extended: if True, star is obtained in extended version (including external details)
+        :param light_curve: if False, light curve is not obtained (light_curve is None)
+        :param star: already obtained star (not requested again)
+        :return: star dossier
+        """
+        functions = {
+            'star': self.get_extended_star if extended else self.get_star,
+            'identifiers': self.get_identifiers_for_star,
+            'attributes': self.get_star_attributes,
+            'magnitudes': self.get_magnitudes_for_star,
+            'magnitude_attributes': self.get_magnitudes_attributes_for_star,
+            'motions': self.get_motion_related_info_for_star,
+            'radial_velocities': self.get_radial_velocities_for_star,
+            'light_curve': self.get_light_curve_for_star if light_curve else None,
+        }
+        if star is not None and not extended:
+            functions['star'] = None
+
+        fields = [field for field, function in functions.items() if function is not None]
+        results = await asyncio.gather(*(functions[field](cp_stars_id) for field in fields))
+        values = {'star': star, 'light_curve': None}
+        values.update(zip(fields, results))
+        return StarDossier(**values)
+
+    async def get_star_dossier_by_renson(self, renson_id: str, extended: bool = False,
+                                         light_curve: bool = True) -> StarDossier:
+        """
+        Obtain all information about the given star specified by Renson identifier, see get_star_dossier.
+        If the CP-Stars identifier cannot be found locally, star is obtained first.
+
+        :param renson_id: Renson identifier
+        :param extended: if True, star is obtained in extended version (including external details)
+        :param light_curve: if False, light curve is not obtained (light_curve is None)
+        :return: star dossier
+        """
+        cp_stars_id = await self._lookup_renson(renson_id)
+        if cp_stars_id is not None:
+            return await self.get_star_dossier(cp_stars_id, extended, light_curve)
+
+        star = await self.get_star_by_renson(renson_id)
+        return await self.get_star_dossier(star.id, extended, light_curve, star=star)
+
+    async def get_magnitudes_attributes_for_star(self, cp_stars_id: int) -> list[MagnitudeAttribute]:
+        """
+        Obtain list of stellar magnitudes attributes of the given star
+        specified by CP-Stars database identifier
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: list of stellar magnitudes attributes
+        """
+        return await self._call(self.stars_controller.get_star_magnitude_attributes_endpoint, cp_stars_id)
+
+    async def get_magnitudes_attributes_for_star_by_renson(self, renson_id: str) -> list[MagnitudeAttribute]:
+        """
+        Obtain list of stellar magnitudes attributes of the given star
+        specified by Renson identifier
+
+        :param renson_id: Renson identifier
+        :return: list of stellar magnitudes attributes
+        """
+        return await self.get_magnitudes_attributes_for_star(await self._resolve_renson(renson_id))
+
+    async def get_magnitudes_for_star(self, cp_stars_id: int) -> list[Magnitude]:
+        """
+        Obtain list of magnitudes corresponding to the given star
+        specified by CP-Stars database identifier.
+
+        :param cp_stars_id: Cp-Stars identifier
+        :return: list of star magnitudes
+        """
+        return await self._call(self.stars_controller.get_star_magnitudes_endpoint, cp_stars_id)
+
+    async def get_magnitudes_for_star_by_renson(self, renson_id: str) -> list[Magnitude]:
+        """
+        Obtain list of magnitudes corresponding to the given star
+        specified by Renson identifier.
+
+        :param renson_id: Renson identifier
+        :return: list of star magnitudes
+        """
+        return await self.get_magnitudes_for_star(await self._resolve_renson(renson_id))
+
+    async def get_motion_related_info_for_star(self, cp_stars_id: int) -> list[Motion]:
+        """
+        Obtain motion-related information for the given star
+        specified by CP-Stars database identifier.
+
+        :param cp_stars_id: CP-Stars identifier
+        :return: list of motion-related values for given star
+        """
+        return await self._call(self.stars_controller.get_star_motions_endpoint, cp_stars_id)
+
+    async def get_motion_related_info_for_star_by_renson(self, renson_id: str) -> list[Motion]:
+        """
+        Obtain motion-related information for the given star
+        specified by Renson identifier.
+
+        :param renson_id: Renson identifier
+        :return: list of motion-related values for given star
+        """
+        return await self.get_motion_related_info_for_star(await self._resolve_renson(renson_id))
+
+    async def get_radial_velocities_for_star(self, cp_stars_id: int) -> list[RadialVelocity]:
+        """
+        Obtain radial velocities with corresponding errors for the given star
+        specified by CP-Stars database identifier.
+
+        :param cp_stars_id: CP-Stars identifier
+        :return: list of radial velocities of the given star
+        """
+        return await self._call(self.stars_controller.get_star_radial_velocities_endpoint, cp_stars_id)
+
+    async def get_radial_velocities_for_star_by_renson(self, renson_id: str) -> list[RadialVelocity]:
+        """
+        Obtain radial velocities with corresponding errors for the given star
+        specified by Renson identifier.
+
+        :param renson_id: Renson identifier
+        :return: list of radial velocities of the given star
+        """
+        return await self.get_radial_velocities_for_star(await self._resolve_renson(renson_id))
+
+    async def get_light_curve_for_star(self, cp_stars_id: int) -> list[LightCurveMeasurement]:
+        """
+        Obtain stellar light curve measurements for the given star
+        specified by CP-Stars database identifier.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: stellar light curve measurements
+        """
+        return await self._call(self.stars_controller.get_star_light_curve_measurements_endpoint, cp_stars_id)
+
+    async def get_light_curve_for_star_by_renson(self, renson_id: str) -> list[LightCurveMeasurement]:
+        """
+        Obtain stellar light curve measurements for the given star
+        specified by Renson identifier.
+
+        :param renson_id: Renson identifier
+        :return: stellar light curve measurements
+        """
+        return await self._call(self.stars_controller.get_star_light_curve_measurements_by_renson_endpoint, renson_id)
+
+    async def get_light_curve_array(self, cp_stars_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain stellar light curve measurements for the given star
+        specified by CP-Stars database identifier as NumPy arrays, see CPStars.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: tuple of contiguous float64 arrays (times, values)
+        """
+        measurements = await self._get_json(
+            self.stars_controller.get_star_light_curve_measurements_endpoint, cp_stars_id)
+        return measurements_to_arrays(measurements, 'time', 'value')
+
+    async def get_light_curve_array_by_renson(self, renson_id: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain stellar light curve measurements for the given star
+        specified by Renson identifier as NumPy arrays, see CPStars.
+
+        :param renson_id: Renson identifier
+        :return: tuple of contiguous float64 arrays (times, values)
+        """
+        measurements = await self._get_json(
+            self.stars_controller.get_star_light_curve_measurements_by_renson_endpoint, renson_id)
+        return measurements_to_arrays(measurements, 'time', 'value')
+
+    async def get_spectrum_for_star(self, cp_stars_id: int) -> list[SpectrumMeasurement]:
+        """
+        Obtain stellar spectrum measurements for the given star
+        specified by CP-Stars database identifier.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: stellar spectrum measurements
+        """
+        return await self._call(self.stars_controller.get_star_spectra_measurements_endpoint, cp_stars_id)
+
+    async def get_spectrum_for_star_by_renson(self, renson_id: str) -> list[SpectrumMeasurement]:
+        """
+        Obtain stellar spectrum measurements for the given star
+        specified by Renson identifier.
+
+        :param renson_id: Renson identifier
+        :return: stellar spectrum measurements
+        """
+        return await self._call(self.stars_controller.get_star_spectra_measurements_by_renson_endpoint, renson_id)
+
+    async def get_spectrum_array(self, cp_stars_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain stellar spectrum measurements for the given star specified by CP-Stars
+        database identifier as NumPy arrays sorted by wavelength, see CPStars.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :return: tuple of contiguous float64 arrays (wavelengths, fluxes) sorted by wavelength
+        """
+        measurements = await self._get_json(self.stars_controller.get_star_spectra_measurements_endpoint, cp_stars_id)
+        return sort_arrays_by_first(*measurements_to_arrays(measurements, 'wavelength', 'flux'))
+
+    async def get_spectrum_array_by_renson(self, renson_id: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain stellar spectrum measurements for the given star specified by Renson
+        identifier as NumPy arrays sorted by wavelength, see CPStars.
+
+        :param renson_id: Renson identifier
+        :return: tuple of contiguous float64 arrays (wavelengths, fluxes) sorted by wavelength
+        """
+        measurements = await self._get_json(
+            self.stars_controller.get_star_spectra_measurements_by_renson_endpoint, renson_id)
+        return sort_arrays_by_first(*measurements_to_arrays(measurements, 'wavelength', 'flux'))
+
+    async def resolve_renson_ids(self, renson_ids: list[str]) -> dict[str, Optional[int]]:
+        """
+        Resolve CP-Stars identifiers of many stars specified by Renson identifiers at once,
+        see CPStars.resolve_renson_ids. Identifiers not found locally are queried concurrently.
+
+        :param renson_ids: Renson identifiers
+        :return: dictionary of Renson identifier -> CP-Stars database identifier (None if the star does not exist)
+        """
+        resolved = {}
+        for renson_id in renson_ids:
+            if renson_id not in resolved:
+                resolved[renson_id] = await self._lookup_renson(renson_id)
+        missing = [renson_id for renson_id, cp_stars_id in resolved.items() if cp_stars_id is None]
+
+        if len(missing) >= RENSON_DOWNLOAD_THRESHOLD or (missing and self._spatial_table is not None):
+            table = self._spatial_table if self._spatial_table is not None else await self.get_basic_info_table()
+            for renson_id in missing:
+                index = table.get_index_by_renson(renson_id)
+                if index is not None:
+                    resolved[renson_id] = int(table['id'][index])
+            missing = [renson_id for renson_id in missing if resolved[renson_id] is None]
+
+        async def query_renson(renson_id):
+            try:
+                return (await self._get_json(self.stars_controller.get_star_by_renson_id_endpoint, renson_id))['id']
+            except NotFoundException:
+                return None
+
+        cp_stars_ids = await asyncio.gather(*(query_renson(renson_id) for renson_id in missing))
+        for renson_id, cp_stars_id in zip(missing, cp_stars_ids):
+            if cp_stars_id is not None:
+                resolved[renson_id] = cp_stars_id
+                if self.renson_index is not None:
+                    self.renson_index.add(renson_id, cp_stars_id)
+        return resolved
+
+    async def get_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Get star information of multiple stars, see CPStars.get_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_star, cp_stars_ids)
+
+    async def get_identifiers_for_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Obtain identifiers of multiple stars, see CPStars.get_identifiers_for_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_identifiers_for_star, cp_stars_ids)
+
+    async def get_star_attributes_for_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Obtain attributes of multiple stars, see CPStars.get_star_attributes_for_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_star_attributes, cp_stars_ids)
+
+    async def get_magnitudes_attributes_for_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Obtain stellar magnitudes attributes of multiple stars, see CPStars.get_magnitudes_attributes_for_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_magnitudes_attributes_for_star, cp_stars_ids)
+
+    async def get_magnitudes_for_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Obtain magnitudes of multiple stars, see CPStars.get_magnitudes_for_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_magnitudes_for_star, cp_stars_ids)
+
+    async def get_motion_related_info_for_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Obtain motion-related information of multiple stars, see CPStars.get_motion_related_info_for_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_motion_related_info_for_star, cp_stars_ids)
+
+    async def get_radial_velocities_for_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Obtain radial velocities of multiple stars, see CPStars.get_radial_velocities_for_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_radial_velocities_for_star, cp_stars_ids)
+
+    async def get_light_curves_for_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Obtain stellar light curve measurements of multiple stars, see CPStars.get_light_curves_for_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_light_curve_for_star, cp_stars_ids)
+
+    async def get_light_curve_arrays_for_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Obtain stellar light curves as NumPy arrays of multiple stars, see CPStars.get_light_curve_arrays_for_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_light_curve_array, cp_stars_ids)
+
+    async def get_spectra_for_stars(self, cp_stars_ids) -> list[StarQueryResult]:
+        """
+        Obtain stellar spectrum measurements of multiple stars, see CPStars.get_spectra_for_stars.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: results in the order of given identifiers, failed queries contain error instead of value
+        """
+        return await self._query_stars(self.get_spectrum_for_star, cp_stars_ids)
+
+    async def _get_datasource_basic_infos(self) -> dict:
+        if self._datasource_basic_infos is None:
+            if self._datasource_basic_infos_lock is None:
+                self._datasource_basic_infos_lock = asyncio.Lock()
+            async with self._datasource_basic_infos_lock:
+                if self._datasource_basic_infos is None:
+                    basic_infos = await self._call(self.datasources_controller.get_all_datasources_basic_info_endpoint)
+                    self._datasource_basic_infos = {basic_info.id: basic_info for basic_info in basic_infos}
+        return self._datasource_basic_infos
+
+    async def get_datasources(self) -> list[DataSourceBasicInfo]:
+        """
+        Obtain basic information of all data sources, see CPStars.get_datasources.
+        Data sources are loaded once by the instance.
+
+        :return: list of data sources with basic information
+        """
+        return list((await self._get_datasource_basic_infos()).values())
+
+    async def get_datasource(self, datasource_id: int) -> DataSource:
+        """
+        Obtain data source specified by identifier (e.g. datasource.id of a magnitude),
+        loaded by a request on the first lookup of the identifier, see CPStars.get_datasource.
+
+        :param datasource_id: data source identifier
+        :return: data source information
+        """
+        datasource = self._datasources.get(datasource_id)
+        if datasource is None:
+            datasource = await self._call(self.datasources_controller.get_datasource_endpoint, datasource_id)
+            datasource = self._datasources.setdefault(datasource_id, datasource)
+        return datasource
+
+    async def get_vizier_metadata(self, star_name: str) -> ExternalDetails:
+        """
+        Obtain Vizier database metadata containing tables the given star is present in.
+        Stellar name has to be specified including data source identification, e.g. 'Renson 61593'.
+
+        :param star_name: star name that will be used for querying external services
+        :return: external details object with Vizier metadata (tables) filled only
+        """
+        return await self._call(self.external_services_controller.get_vizier_metadata_endpoint, star_name)
@@ -0,0 +1,252 @@
+"""
+|    In-process cache of CPStars query results.
+|
+|    Results of CPStars functions (model objects, lists, NumPy arrays) are kept in memory keyed by namespace
+|    (server and model representation of the CPStars instance), function name and arguments, so repeated queries
+|    neither send requests nor deserialize responses.
+|        -> expiration (TTL) configurable per function
+|        -> memory cap in bytes (estimated size of cached objects), least recently used results are evicted first
+|        -> explicit invalidation (single result, function, everything)
+|        -> hit / miss counters
+|
+|    Cached objects are shared by all callers, they should be treated as read-only.
+|
+|       Example:
+|           -------------------------------------------------------------------------------------------------
+|              cpstars_instance = CPStars(result_cache=ResultCache(ttls={'get_basic_info_for_stars': 3600}))
+|              star = cpstars_instance.get_star(1)        # request is sent
+|              star = cpstars_instance.get_star(1)        # returned from memory
+|              cpstars_instance.result_cache.invalidate('get_star', 1)
+|           -------------------------------------------------------------------------------------------------
+"""
+
+import collections
+import functools
+import sys
+import threading
+import time
+from typing import Callable, Hashable
+
+
+def estimate_size(value, visited: set = None) -> int:
+    """
+    Estimate memory occupied by the given result (model objects, lists, dicts, NumPy arrays, tables).
+    Objects referenced multiple times (e.g. interned stars) are counted once.
+
+    :param value: result of a CPStars function
+    :param visited: identifiers of already counted objects
+    :return: estimated size in bytes
+    """
+    # imported here, importing cpstars (and this module) does not import NumPy and models
+    import numpy as np
+    from openapi_client.compact_model import CompactRecord
+    from openapi_client.lazy_model import LazyDataStore
+    from openapi_client.model_utils import OpenApiModel
+
+    if visited is None:
+        visited = set()
+
+    def estimate(value) -> int:
+        if id(value) in visited:
+            return 0
+        visited.add(id(value))
+
+        if isinstance(value, np.ndarray):
+            return sys.getsizeof(value) + (0 if value.base is None else value.nbytes)
+        size = sys.getsizeof(value)
+        if isinstance(value, OpenApiModel):
+            size += estimate(value.__dict__.get('_data_store'))
+        elif isinstance(value, CompactRecord):
+            size += sum(estimate(item) for _, item in value.items())
+        elif isinstance(value, LazyDataStore):
+            size += estimate(value.received_data) + estimate(value.converted_values)
+        elif isinstance(value, dict):
+            size += sum(estimate(item) for item in value.values())
+        elif isinstance(value, (list, tuple)):
+            size += sum(estimate(item) for item in value)
+        elif hasattr(value, '__dict__'):
+            # e.g. StarBasicInfoTable
+            size += estimate(vars(value))
+        return size
+
+    return estimate(value)
+
+
+class _Entry:
+    __slots__ = ('value', 'size', 'expires_at')
+
+    def __init__(self, value, size: int, expires_at: float):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class ResultCache:
+    """
+    LRU cache of function results limited by estimated size in bytes, entries expire after TTL
+    of the function. Instance may be shared by multiple threads and CPStars instances, results of instances
+    wrapping functions with different namespaces are kept apart.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, default_ttl: float = 300, ttls: dict = None):
+        """
+        ResultCache class constructor.
+
+        :param max_bytes: maximum estimated size of all cached results
+        :param default_ttl: number of seconds results are valid for
+        :param ttls: dictionary of function name -> number of seconds overriding default_ttl,
+                     0 disables caching of the function
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.size = 0
+        self.hits = collections.Counter()
+        self.misses = collections.Counter()
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        # function name -> signature of the wrapped function, arguments of calls are normalized by it
+        self._signatures = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_ttl(self, function_name: str) -> float:
+        return self.ttls.get(function_name, self.default_ttl)
+
+    def wrap(self, function_name: str, function: Callable, namespace: Hashable = None) -> Callable:
+        """
+        Wrap function so its results are cached.
+        Arguments are bound to parameters of the function (omitted ones get their default values), thus calls
+        with the same arguments passed by position or by keyword share one cache entry.
+
+        :param function_name: name used in cache keys, TTL settings and statistics
+        :param function: function with hashable arguments
+        :param namespace: part of cache keys distinguishing results of equally named functions
+                          (e.g. server address and model representation of CPStars instance)
+        :return: wrapped function
+        """
+        # imported here, importing cpstars (and this module) stays cheap when result cache is not used
+        import inspect
+
+        signature = self._signatures[function_name] = inspect.signature(function)
+
+        @functools.wraps(function)
+        def cached_function(*args, **kwargs):
+            normalized_args = self._normalize_args(signature, args, kwargs)
+            if normalized_args is None:
+                # arguments not matching the signature are left to the function to report
+                return function(*args, **kwargs)
+            return self.get_or_compute(function_name, normalized_args, function, namespace)
+
+        return cached_function
+
+    @staticmethod
+    def _normalize_args(signature, args: tuple, kwargs: dict):
+        """
+        :return: all arguments of the call as positional arguments or None if they cannot be bound to parameters
+        """
+        try:
+            bound_arguments = signature.bind(*args, **kwargs)
+        except TypeError:
+            return None
+        bound_arguments.apply_defaults()
+        if bound_arguments.kwargs:
+            # keyword-only parameters
+            return None
+        return bound_arguments.args
+
+    def get_or_compute(self, function_name: str, args: tuple, function: Callable, namespace: Hashable = None):
+        """
+        Return cached result of function(*args) or call the function and cache its result.
+
+        :param function_name: name of the function
+        :param args: positional arguments of the function
+        :param function: function computing the result on miss
+        :param namespace: namespace of the function (see wrap)
+        :return: result of the function
+        """
+        key = (namespace, function_name, args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits[function_name] += 1
+                    return entry.value
+                self._remove(key)
+            self.misses[function_name] += 1
+
+        value = function(*args)
+        self.set(function_name, args, value, namespace)
+        return value
+
+    def set(self, function_name: str, args: tuple, value, namespace: Hashable = None):
+        """
+        Store result of the function call (replacing previous one).
+        """
+        ttl = self.get_ttl(function_name)
+        if ttl <= 0:
+            return
+        size = estimate_size(value)
+        key = (namespace, function_name, args)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = _Entry(value, size, time.monotonic() + ttl)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, function_name: str = None, *args, namespace: Hashable = None):
+        """
+        Remove cached results.
+
+        :param function_name: name of the function, all results are removed if not specified
+        :param args: arguments of the function call, all results of the function are removed if not specified
+        :param namespace: namespace of the results (see wrap), results of all namespaces are removed if not specified
+        """
+        signature = self._signatures.get(function_name)
+        if args and signature is not None:
+            args = self._normalize_args(signature, args, {}) or args
+        with self._lock:
+            if function_name is None and namespace is None:
+                self._entries.clear()
+                self.size = 0
+            else:
+                for key in [key for key in self._entries
+                            if (namespace is None or key[0] == namespace)
+                            and (function_name is None or key[1] == function_name)
+                            and (not args or key[2] == args)]:
+                    self._remove(key)
+
+    def clear(self):
+        """
+        Remove all cached results and reset statistics.
+        """
+        self.invalidate()
+        with self._lock:
+            self.hits.clear()
+            self.misses.clear()
+
+    def get_statistics(self) -> dict:
+        """
+        :return: dictionary with total hits and misses, per function counters, number of entries and size
+        """
+        with self._lock:
+            return {
+                'hits': sum(self.hits.values()),
+                'misses': sum(self.misses.values()),
+                'functions': {
+                    function_name: {'hits': self.hits[function_name], 'misses': self.misses[function_name]}
+                    for function_name in set(self.hits) | set(self.misses)
+                },
+                'entries': len(self._entries),
+                'size': self.size,
+            }
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
@@ -0,0 +1,314 @@
+"""
+|    Persistent on-disk mirror of the CP-Stars database catalog.
+|
+|    Catalog mirror is a SQLite database (by default stored in the user cache directory)
+|    which contains raw JSON responses of the CP-Stars database server:
+|        -> basic information of all stars (/stars)
+|        -> per-star details (star, identifiers, attributes, magnitudes, magnitudes attributes,
+           motions, radial velocities)
+|
+|    CPStars instance created with catalog mirror answers supported queries from the mirror
+|    and queries the server only for stars missing in it.
+|
+|    REFRESH:
+|        Only stars whose basic information changed (or which are new) are re-fetched,
+|        stars removed from the server are removed from the mirror as well.
+|        Server does not provide any modification timestamps, thus changes limited to per-star
+|        details (e.g. newly added magnitude) are not detected, full refresh can be used instead.
+|
+|           -------------------------------------------------------------------------------------------------
+|              python cpstars_catalog.py refresh [--host HOST] [--path PATH] [--full]
+|           -------------------------------------------------------------------------------------------------
+|
+|       Example:
+|           -------------------------------------------------------------------------------------------------
+|              cpstars_instance = CPStars(catalog=CatalogStore())
+|              cpstars_instance.refresh_catalog()
+|              magnitudes = cpstars_instance.get_magnitudes_for_star(2)   # no request is sent
+|           -------------------------------------------------------------------------------------------------
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+# Kinds of per-star details stored in the catalog mirror
+STAR_DETAIL_KINDS = (
+    'star',
+    'identifiers',
+    'attributes',
+    'magnitudes',
+    'magnitude_attributes',
+    'motions',
+    'radial_velocities',
+)
+
+
+def default_catalog_path() -> str:
+    """
+    Default location of the catalog mirror: <user cache directory>/cpstars/catalog.sqlite3
+
+    :return: path of the catalog mirror database file
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'cpstars', 'catalog.sqlite3')
+
+
+def default_spatial_index_path(catalog_path: str) -> Optional[str]:
+    """
+    :param catalog_path: path of the catalog mirror database file
+    :return: path of the spatial index file next to the catalog mirror, None for in-memory catalog mirror
+    """
+    if catalog_path == ':memory:':
+        return None
+    return os.path.splitext(catalog_path)[0] + '.spatial.npz'
+
+
+def content_hash(data) -> str:
+    """
+    Hash of decoded JSON data independent of keys order.
+
+    :param data: decoded JSON data
+    :return: hexadecimal SHA-1 digest
+    """
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+class CatalogStore:
+    """
+    SQLite catalog mirror of the CP-Stars database.
+
+    Store holds raw JSON data, conversion to model objects is done by CPStars.
+    Instance may be shared by multiple threads.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        CatalogStore class constructor.
+        Database file (and its directory) is created if it does not exist.
+
+        :param path: path of the database file, default_catalog_path() is used if not specified
+        """
+        self.path = path or default_catalog_path()
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript('''
+                CREATE TABLE IF NOT EXISTS stars (
+                    id INTEGER PRIMARY KEY,
+                    renson TEXT,
+                    content_hash TEXT NOT NULL,
+                    payload TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS stars_renson ON stars (renson);
+                CREATE TABLE IF NOT EXISTS star_details (
+                    star_id INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (star_id, kind)
+                );
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            ''')
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _query_one(self, sql: str, parameters: tuple = ()):
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchone()
+
+    def is_populated(self, host: str = None) -> bool:
+        """
+        :param host: server address, if specified the catalog mirror has to be refreshed from the server
+        :return: True if the catalog mirror was refreshed at least once (from the given server)
+        """
+        if self.get_metadata('refreshed_at') is None:
+            return False
+        return host is None or self.get_metadata('host') == host
+
+    def get_metadata(self, key: str) -> Optional[str]:
+        row = self._query_one('SELECT value FROM metadata WHERE key = ?', (key,))
+        return row[0] if row else None
+
+    def set_metadata(self, key: str, value: str):
+        with self._lock, self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)', (key, value))
+
+    def get_basic_info_list(self) -> Optional[list]:
+        """
+        Obtain basic information of all stars (same structure as /stars response).
+
+        :return: decoded JSON list or None if the catalog mirror is not populated
+        """
+        if not self.is_populated():
+            return None
+        with self._lock:
+            payloads = [row[0] for row in self._connection.execute('SELECT payload FROM stars ORDER BY id')]
+        return json.loads('[' + ','.join(payloads) + ']')
+
+    def get_star_hashes(self) -> dict:
+        """
+        :return: dictionary of CP-Stars identifier -> content hash of basic information
+        """
+        with self._lock:
+            return dict(self._connection.execute('SELECT id, content_hash FROM stars'))
+
+    def get_star_id_by_renson(self, renson_id: str) -> Optional[int]:
+        """
+        :param renson_id: Renson identifier
+        :return: CP-Stars identifier or None if the star is not present in the catalog mirror
+        """
+        row = self._query_one('SELECT id FROM stars WHERE renson = ?', (renson_id,))
+        return row[0] if row else None
+
+    def get_star_detail(self, cp_stars_id: int, kind: str):
+        """
+        Obtain stored per-star detail.
+
+        :param cp_stars_id: CP-Stars database identifier
+        :param kind: one of STAR_DETAIL_KINDS
+        :return: decoded JSON data or None if the detail is not stored
+        """
+        row = self._query_one('SELECT payload FROM star_details WHERE star_id = ? AND kind = ?', (cp_stars_id, kind))
+        return json.loads(row[0]) if row else None
+
+    def store_star(self, basic_info: dict, details: dict):
+        """
+        Store (replace) basic information and details of a single star.
+
+        :param basic_info: decoded JSON basic information of the star (item of /stars response)
+        :param details: dictionary of detail kind -> decoded JSON data
+        """
+        star_id = basic_info['id']
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO stars (id, renson, content_hash, payload) VALUES (?, ?, ?, ?)',
+                (star_id, basic_info.get('renson'), content_hash(basic_info), json.dumps(basic_info))
+            )
+            self._connection.execute('DELETE FROM star_details WHERE star_id = ?', (star_id,))
+            self._connection.executemany(
+                'INSERT INTO star_details (star_id, kind, payload) VALUES (?, ?, ?)',
+                [(star_id, kind, json.dumps(data)) for kind, data in details.items()]
+            )
+
+    def remove_stars(self, cp_stars_ids):
+        """
+        :param cp_stars_ids: CP-Stars identifiers of stars to be removed from the catalog mirror
+        """
+        parameters = [(star_id,) for star_id in cp_stars_ids]
+        with self._lock, self._connection:
+            self._connection.executemany('DELETE FROM star_details WHERE star_id = ?', parameters)
+            self._connection.executemany('DELETE FROM stars WHERE id = ?', parameters)
+
+    def mark_refreshed(self, host: str):
+        self.set_metadata('host', host)
+        self.set_metadata('refreshed_at', str(time.time()))
+
+
+# Number of Renson identifiers (not found locally) from which resolve_renson_ids downloads basic information
+# of all stars (single request) instead of querying the identifiers one by one
+RENSON_DOWNLOAD_THRESHOLD = 16
+
+
+class RensonIndex:
+    """
+    Renson identifier -> CP-Stars identifier mapping built from basic information
+    of all stars (renson field of StarBasicInfo), i.e. from a single /stars response.
+
+    Index may be persisted to a JSON file so it is built only once.
+    Instance may be shared by multiple threads.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        RensonIndex class constructor.
+        If the file exists, the index is loaded from it.
+
+        :param path: path of the JSON file the index is persisted to, index is kept in memory only if not specified
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._ids = None
+        if path is not None and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as index_file:
+                self._ids = json.load(index_file)
+
+    def is_built(self) -> bool:
+        return self._ids is not None
+
+    def build(self, basic_info_list: list):
+        """
+        (Re)build the index and persist it if path was specified.
+
+        :param basic_info_list: decoded JSON list of basic information of all stars (/stars response)
+        """
+        ids = {basic_info['renson']: basic_info['id'] for basic_info in basic_info_list if basic_info.get('renson')}
+        with self._lock:
+            self._ids = ids
+        self._save()
+
+    def get(self, renson_id: str) -> Optional[int]:
+        """
+        :param renson_id: Renson identifier
+        :return: CP-Stars identifier or None if the Renson identifier is not indexed
+        """
+        if self._ids is None:
+            return None
+        return self._ids.get(renson_id)
+
+    def add(self, renson_id: str, cp_stars_id: int):
+        """
+        Add single entry (e.g. resolved by the server after an index miss).
+        Entry is persisted the next time the index is built.
+        """
+        with self._lock:
+            if self._ids is None:
+                self._ids = {}
+            self._ids[renson_id] = cp_stars_id
+
+    def _save(self):
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temporary_path = self.path + '.tmp'
+        with self._lock:
+            with open(temporary_path, 'w', encoding='utf-8') as index_file:
+                json.dump(self._ids, index_file)
+            os.replace(temporary_path, self.path)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from cpstars import CPStars
+
+    parser = argparse.ArgumentParser(description='CP-Stars database catalog mirror')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    refresh_parser = subparsers.add_parser('refresh', help='re-fetch new and changed stars')
+    refresh_parser.add_argument('--host', default=None, help='CP-Stars database backend (server) address')
+    refresh_parser.add_argument('--path', default=None, help='catalog mirror database file')
+    refresh_parser.add_argument('--full', action='store_true', help='re-fetch all stars')
+    arguments = parser.parse_args()
+
+    with CatalogStore(arguments.path) as catalog:
+        summary = CPStars(arguments.host, catalog=catalog).refresh_catalog(full=arguments.full)
+        print(str.format("added: {}, updated: {}, removed: {}",
+                         len(summary['added']), len(summary['updated']), len(summary['removed'])))
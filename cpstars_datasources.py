@@ -0,0 +1,163 @@
+"""
+|    Process-wide registry of data sources of the CP-Stars database.
+|
+|    Data sources (catalogs the values of stars come from) are few and rarely change, yet each magnitude
+|    or attribute embeds its data source. The list of data sources (/datasources) is loaded once and details
+|    of each data source (/datasources/{id}) on the first lookup. Decoded JSON of the responses is shared
+|    by all CPStars instances of the same server, model objects are built by each instance (with its own
+|    model representation, validation and interning settings) and kept by its registry, thus later lookups
+|    by identifier are dictionary hits.
+|
+|       Example:
+|           -------------------------------------------------------------------------------------------------
+|              cpstars_instance = CPStars()
+|              magnitude = cpstars_instance.get_magnitudes_for_star(2)[0]
+|              datasource = cpstars_instance.get_datasource(magnitude.datasource.id)
+|              print(datasource.full_name, datasource.bibcode)
+|           -------------------------------------------------------------------------------------------------
+"""
+
+import json
+import threading
+from typing import Callable, Optional
+
+from openapi_client.api.datasources_controller_api import DatasourcesControllerApi
+from openapi_client.model.data_source import DataSource
+from openapi_client.model.data_source_basic_info import DataSourceBasicInfo
+
+# Server address -> decoded JSON data sources of the server
+_shared_data = {}
+_shared_data_lock = threading.Lock()
+
+
+class _SharedDatasourceData:
+    """
+    Decoded JSON data sources of a single server, shared by all registries of the server.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.basic_infos = None
+        self.datasources = {}
+
+
+def _get_shared_data(host: str) -> _SharedDatasourceData:
+    with _shared_data_lock:
+        shared_data = _shared_data.get(host)
+        if shared_data is None:
+            shared_data = _shared_data[host] = _SharedDatasourceData()
+        return shared_data
+
+
+def _get_json(endpoint_method: Callable, *args):
+    response = endpoint_method(*args, _preload_content=False)
+    try:
+        return json.loads(response.data)
+    finally:
+        response.release_conn()
+
+
+class DatasourceRegistry:
+    """
+    Data sources of a single server as model objects of a single API client, loaded on first use.
+    Instance may be shared by multiple threads.
+    """
+
+    def __init__(self, datasources_controller: DatasourcesControllerApi):
+        """
+        DatasourceRegistry class constructor.
+
+        :param datasources_controller: controller used to load data sources and build their model objects
+        """
+        self.datasources_controller = datasources_controller
+        self._shared_data = _get_shared_data(datasources_controller.api_client.configuration.host)
+        self._lock = threading.Lock()
+        # model objects together with the shared JSON they were built from (rebuilt when it is reloaded)
+        self._basic_infos = (None, None)
+        self._datasources = {}
+
+    def _deserialize(self, endpoint, received_data):
+        return self.datasources_controller.api_client.deserialize_data(
+            received_data, endpoint.settings['response_type'])
+
+    def _get_basic_infos(self) -> dict:
+        shared_data = self._shared_data
+        received_data = shared_data.basic_infos
+        if received_data is None:
+            with shared_data.lock:
+                if shared_data.basic_infos is None:
+                    shared_data.basic_infos = _get_json(self.datasources_controller.get_all_datasources_basic_info)
+                received_data = shared_data.basic_infos
+
+        built_from, basic_infos = self._basic_infos
+        if built_from is not received_data:
+            endpoint = self.datasources_controller.get_all_datasources_basic_info_endpoint
+            basic_infos = {basic_info.id: basic_info for basic_info in self._deserialize(endpoint, received_data)}
+            with self._lock:
+                built_from, built_basic_infos = self._basic_infos
+                if built_from is received_data:
+                    # built by another thread meanwhile, all callers get the same objects
+                    basic_infos = built_basic_infos
+                else:
+                    self._basic_infos = (received_data, basic_infos)
+        return basic_infos
+
+    def get_all(self) -> list[DataSourceBasicInfo]:
+        """
+        :return: basic information of all data sources (loaded by a single request once)
+        """
+        return list(self._get_basic_infos().values())
+
+    def get_basic_info(self, datasource_id: int) -> Optional[DataSourceBasicInfo]:
+        """
+        :param datasource_id: data source identifier
+        :return: basic information of the data source or None if it does not exist
+        """
+        return self._get_basic_infos().get(datasource_id)
+
+    def get(self, datasource_id: int) -> DataSource:
+        """
+        :param datasource_id: data source identifier
+        :return: data source (loaded by a request on the first lookup of the identifier)
+        """
+        shared_data = self._shared_data
+        received_data = shared_data.datasources.get(datasource_id)
+        if received_data is None:
+            received_data = _get_json(self.datasources_controller.get_datasource, datasource_id)
+            with shared_data.lock:
+                received_data = shared_data.datasources.setdefault(datasource_id, received_data)
+
+        built_from, datasource = self._datasources.get(datasource_id, (None, None))
+        if built_from is not received_data:
+            datasource = self._deserialize(self.datasources_controller.get_datasource_endpoint, received_data)
+            with self._lock:
+                built_from, built_datasource = self._datasources.get(datasource_id, (None, None))
+                if built_from is received_data:
+                    datasource = built_datasource
+                else:
+                    self._datasources[datasource_id] = (received_data, datasource)
+        return datasource
+
+    def find_by_name(self, name: str) -> Optional[DataSourceBasicInfo]:
+        """
+        :param name: data source name (e.g. 'Renson')
+        :return: basic information of the data source or None if no data source has the name
+        """
+        for basic_info in self._get_basic_infos().values():
+            if basic_info.get('name') == name:
+                return basic_info
+        return None
+
+
+def invalidate_datasource_registry(host: str):
+    """
+    Forget data sources loaded from the server (by all registries), data sources of other servers are kept.
+
+    :param host: address of the server
+    """
+    with _shared_data_lock:
+        shared_data = _shared_data.get(host)
+    if shared_data is not None:
+        with shared_data.lock:
+            shared_data.basic_infos = None
+            shared_data.datasources = {}
@@ -0,0 +1,386 @@
+"""
+|    Client-side spatial index of CP stars (ICRS coordinates).
+|
+|    Sky is split into declination zones, stars are sorted by zone and right ascension, so stars close
+|    to any position are found by binary search in a few zones instead of scanning the whole catalog.
+|    Angular separations are computed exactly from unit vectors of the stars.
+|        -> cone_search(ra, dec, radius): stars within the radius (degrees) sorted by separation
+|        -> nearest(ra, dec, count): the closest stars
+|        -> box_search(ra_min, ra_max, dec_min, dec_max): stars within the coordinate box
+|        -> crossmatch(ra_array, dec_array, max_separation): catalog stars matching each of the given positions,
+           processed in chunks of positions so memory stays bounded even for millions of positions
+|
+|    Index is built from the basic information table (see cpstars_table.py) and may be persisted
+|    to a NumPy (.npz) file, e.g. next to the catalog mirror (see cpstars_catalog.py).
+|
+|       Example:
+|           -------------------------------------------------------------------------------------------------
+|              cpstars_instance = CPStars()
+|              stars = cpstars_instance.cone_search(83.82, -5.39, 2.5)
+|              print(stars['id'], stars['separation'])
+|
+|              matches = cpstars_instance.crossmatch(survey_ra, survey_dec, 2 / 3600)
+|              print(matches.input_indices, matches.cp_stars_ids, matches.renson_ids, matches.separations)
+|           -------------------------------------------------------------------------------------------------
+"""
+
+import math
+import os
+import threading
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from cpstars_table import StarBasicInfoTable
+
+# Surface of the whole sky in square degrees
+SKY_AREA = 4 * np.pi * np.degrees(1) ** 2
+
+# Cross-match modes: the closest star for each position, or all stars within the maximum separation
+CROSSMATCH_MODES = ('best', 'all')
+
+
+class CrossmatchResult(NamedTuple):
+    """
+    Matches of positions with catalog stars, all arrays have a value per match.
+    Matches are sorted by index of the position and separation.
+    """
+    input_indices: np.ndarray
+    cp_stars_ids: np.ndarray
+    renson_ids: np.ndarray
+    separations: np.ndarray
+
+    @classmethod
+    def concatenate(cls, results: list) -> 'CrossmatchResult':
+        if not results:
+            return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                       np.empty(0, dtype=object), np.empty(0, dtype=np.float64))
+        return cls(*(np.concatenate(arrays) for arrays in zip(*results)))
+
+
+def to_unit_vectors(ra, dec) -> np.ndarray:
+    """
+    :param ra: right ascension(s) in degrees
+    :param dec: declination(s) in degrees
+    :return: array of shape (..., 3) of cartesian unit vectors
+    """
+    ra = np.radians(ra)
+    dec = np.radians(dec)
+    cos_dec = np.cos(dec)
+    return np.stack((cos_dec * np.cos(ra), cos_dec * np.sin(ra), np.sin(dec)), axis=-1)
+
+
+def _to_unit_vector(ra: float, dec: float) -> tuple:
+    ra = math.radians(ra)
+    dec = math.radians(dec)
+    return math.cos(dec) * math.cos(ra), math.cos(dec) * math.sin(ra), math.sin(dec)
+
+
+def chord_to_separation(chord) -> np.ndarray:
+    """
+    :param chord: distance(s) of unit vectors
+    :return: angular separation(s) in degrees
+    """
+    return np.degrees(2 * np.arcsin(np.minimum(chord / 2, 1)))
+
+
+def separation_to_chord(separation) -> np.ndarray:
+    """
+    :param separation: angular separation(s) in degrees
+    :return: distance(s) of unit vectors
+    """
+    return 2 * np.sin(np.radians(np.minimum(separation, 180)) / 2)
+
+
+def _expand_ranges(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenation of ranges [start, end) without Python loop.
+
+    :return: tuple of (positions, index of the range of each position)
+    """
+    lengths = np.maximum(ends - starts, 0)
+    total = int(lengths.sum())
+    range_indices = np.repeat(np.arange(len(lengths)), lengths)
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(total) + (starts - offsets)[range_indices], range_indices
+
+
+def _check_position(ra: float, dec: float) -> float:
+    if not -90 <= dec <= 90:
+        raise ValueError("Declination has to be within [-90, 90] degrees.")
+    return ra % 360
+
+
+class SpatialIndex:
+    """
+    Declination zones index of star positions, see module documentation.
+
+    Index may be persisted to a NumPy (.npz) file so it is built only once.
+    Instance may be shared by multiple threads.
+    """
+
+    def __init__(self, path: str = None, zone_height: float = 0.5):
+        """
+        SpatialIndex class constructor.
+        If the file exists, the index is loaded from it.
+
+        :param path: path of the file the index is persisted to, index is kept in memory only if not specified
+        :param zone_height: height of declination zones in degrees
+        """
+        self.path = path
+        self.zone_height = zone_height
+        self._lock = threading.Lock()
+        self._arrays = None
+        if path is not None and os.path.exists(path):
+            with np.load(path) as index_file:
+                self.zone_height = float(index_file['zone_height'])
+                self._set_arrays(index_file['ids'], index_file['ra'], index_file['dec'], index_file['renson'])
+
+    def is_built(self) -> bool:
+        return self._arrays is not None
+
+    def __len__(self):
+        return 0 if self._arrays is None else len(self._arrays['ids'])
+
+    def build(self, table: StarBasicInfoTable):
+        """
+        (Re)build the index and persist it if path was specified.
+        Stars without ICRS coordinates are not indexed.
+
+        :param table: basic information of all stars (see CPStars.get_basic_info_table)
+        """
+        ra = table['icrs_right_ascension']
+        dec = table['icrs_declination']
+        known = ~(np.isnan(ra) | np.isnan(dec))
+        renson = np.array(['' if renson is None else renson for renson in table['renson'][known]], dtype=str)
+        self._set_arrays(table['id'][known], ra[known] % 360, dec[known], renson)
+        self._save()
+
+    def _set_arrays(self, ids: np.ndarray, ra: np.ndarray, dec: np.ndarray, renson: np.ndarray):
+        zones = self._get_zones(dec)
+        keys = zones * 360.0 + ra
+        order = np.argsort(keys, kind='stable')
+        arrays = {
+            'ids': np.ascontiguousarray(ids[order], dtype=np.int64),
+            'ra': np.ascontiguousarray(ra[order], dtype=np.float64),
+            'dec': np.ascontiguousarray(dec[order], dtype=np.float64),
+            'renson': renson[order],
+            'keys': keys[order],
+        }
+        arrays['vectors'] = to_unit_vectors(arrays['ra'], arrays['dec'])
+        with self._lock:
+            self._arrays = arrays
+
+    def _get_zones(self, dec) -> np.ndarray:
+        zones_count = math.ceil(180 / self.zone_height)
+        return np.clip(np.floor((np.asarray(dec) + 90) / self.zone_height), 0, zones_count - 1).astype(np.int64)
+
+    def _get_zone(self, dec: float) -> int:
+        return min(max(math.floor((dec + 90) / self.zone_height), 0), math.ceil(180 / self.zone_height) - 1)
+
+    def _get_arrays(self) -> dict:
+        if self._arrays is None:
+            raise ValueError("Spatial index is not built.")
+        return self._arrays
+
+    def _get_candidates(self, arrays: dict, dec_min: float, dec_max: float, ra_ranges: list) -> np.ndarray:
+        """
+        :return: positions (in the index order) of stars in zones overlapping [dec_min, dec_max]
+                 with right ascension within any of ra_ranges (a superset of the exact result)
+        """
+        zones = np.arange(self._get_zone(dec_min), self._get_zone(dec_max) + 1) * 360.0
+        ra_ranges = np.asarray(ra_ranges, dtype=np.float64)
+        keys = arrays['keys']
+        zone_ends = np.searchsorted(keys, zones + 360, side='left')[:, np.newaxis]
+        starts = np.searchsorted(keys, np.add.outer(zones, ra_ranges[:, 0]), side='left')
+        ends = np.minimum(np.searchsorted(keys, np.add.outer(zones, ra_ranges[:, 1]), side='right'), zone_ends)
+        return _expand_ranges(starts.ravel(), ends.ravel())[0]
+
+    @staticmethod
+    def _get_ra_ranges(ra: float, half_width: float) -> list:
+        if half_width >= 180:
+            return [(0, 360)]
+        ra_min, ra_max = ra - half_width, ra + half_width
+        if ra_min < 0:
+            return [(0, ra_max), (ra_min + 360, 360)]
+        if ra_max >= 360:
+            return [(ra_min, 360), (0, ra_max - 360)]
+        return [(ra_min, ra_max)]
+
+    def cone_search(self, ra: float, dec: float, radius: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find stars within the given angular distance of the position.
+
+        :param ra: right ascension of the center in degrees
+        :param dec: declination of the center in degrees
+        :param radius: radius of the cone in degrees
+        :return: tuple of (CP-Stars identifiers, separations in degrees) sorted by separation
+        """
+        ra = _check_position(ra, dec)
+        if radius < 0:
+            raise ValueError("Radius has to be non-negative.")
+        arrays = self._get_arrays()
+
+        # maximum difference of right ascension within the cone
+        if abs(dec) + radius >= 90:
+            half_width = 180
+        else:
+            half_width = math.degrees(math.asin(min(math.sin(math.radians(radius)) / math.cos(math.radians(dec)), 1)))
+        candidates = self._get_candidates(arrays, max(dec - radius, -90), min(dec + radius, 90),
+                                          self._get_ra_ranges(ra, half_width * (1 + 1e-9) + 1e-9))
+
+        chords = np.linalg.norm(arrays['vectors'][candidates] - _to_unit_vector(ra, dec), axis=1)
+        within = chords <= separation_to_chord(radius) * (1 + 1e-12)
+        candidates, chords = candidates[within], chords[within]
+        order = np.argsort(chords, kind='stable')
+        return arrays['ids'][candidates[order]], chord_to_separation(chords[order])
+
+    def nearest(self, ra: float, dec: float, count: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the closest stars to the position.
+
+        :param ra: right ascension in degrees
+        :param dec: declination in degrees
+        :param count: number of stars
+        :return: tuple of (CP-Stars identifiers, separations in degrees) sorted by separation,
+                 fewer than count stars only if the index is smaller
+        """
+        arrays = self._get_arrays()
+        count = min(count, len(arrays['ids']))
+        if count <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        # start with radius of a circle expected to contain twice as many stars
+        radius = np.sqrt(2 * count / len(arrays['ids']) * SKY_AREA / np.pi)
+        while True:
+            ids, separations = self.cone_search(ra, dec, min(radius, 180))
+            if len(ids) >= count or radius >= 180:
+                return ids[:count], separations[:count]
+            radius *= 2
+
+    def box_search(self, ra_min: float, ra_max: float, dec_min: float, dec_max: float) -> np.ndarray:
+        """
+        Find stars within the coordinate box.
+
+        :param ra_min: minimum right ascension in degrees
+        :param ra_max: maximum right ascension in degrees, box crosses 0h if ra_max < ra_min
+        :param dec_min: minimum declination in degrees
+        :param dec_max: maximum declination in degrees
+        :return: CP-Stars identifiers (sorted)
+        """
+        if dec_min > dec_max:
+            raise ValueError("Minimum declination is greater than maximum declination.")
+        arrays = self._get_arrays()
+        if ra_max - ra_min >= 360:
+            ra_ranges = [(0, 360)]
+        else:
+            ra_min, ra_max = ra_min % 360, ra_max % 360
+            ra_ranges = [(ra_min, ra_max)] if ra_min <= ra_max else [(ra_min, 360), (0, ra_max)]
+        candidates = self._get_candidates(arrays, max(dec_min, -90), min(dec_max, 90), ra_ranges)
+
+        ra, dec = arrays['ra'][candidates], arrays['dec'][candidates]
+        within = (dec >= dec_min) & (dec <= dec_max)
+        within &= np.any([(ra >= range_min) & (ra <= range_max) for range_min, range_max in ra_ranges], axis=0)
+        return np.sort(arrays['ids'][candidates[within]])
+
+    def iter_crossmatch(self, ra: np.ndarray, dec: np.ndarray, max_separation: float, mode: str = 'best',
+                        chunk_size: int = 65536) -> Iterator[CrossmatchResult]:
+        """
+        Match positions with indexed stars, positions are processed in chunks.
+        Positions with unknown (NaN) coordinates have no matches.
+
+        :param ra: right ascensions of positions in degrees
+        :param dec: declinations of positions in degrees
+        :param max_separation: maximum angular separation of matched star in degrees
+        :param mode: 'best' for the closest star of each position, 'all' for all stars within max_separation
+        :param chunk_size: maximum number of positions processed at once
+        :return: generator of matches of successive chunks (input_indices refer to all positions)
+        """
+        if mode not in CROSSMATCH_MODES:
+            raise ValueError("Invalid cross-match mode %r, must be one of %s." % (mode, CROSSMATCH_MODES))
+        if max_separation < 0:
+            raise ValueError("Maximum separation has to be non-negative.")
+        if len(ra) != len(dec):
+            raise ValueError("Arrays of right ascensions and declinations differ in length.")
+        arrays = self._get_arrays()
+        for chunk_start in range(0, len(ra), chunk_size):
+            chunk_ra = np.asarray(ra[chunk_start:chunk_start + chunk_size], dtype=np.float64)
+            chunk_dec = np.asarray(dec[chunk_start:chunk_start + chunk_size], dtype=np.float64)
+            input_indices, positions, separations = self._crossmatch_chunk(arrays, chunk_ra, chunk_dec,
+                                                                           max_separation, mode == 'all')
+            renson_ids = arrays['renson'][positions].astype(object)
+            renson_ids[renson_ids == ''] = None
+            yield CrossmatchResult(input_indices + chunk_start, arrays['ids'][positions], renson_ids, separations)
+
+    def crossmatch(self, ra: np.ndarray, dec: np.ndarray, max_separation: float, mode: str = 'best',
+                   chunk_size: int = 65536) -> CrossmatchResult:
+        """
+        Match positions with indexed stars, see iter_crossmatch.
+
+        :return: matches of all positions
+        """
+        return CrossmatchResult.concatenate(list(self.iter_crossmatch(ra, dec, max_separation, mode, chunk_size)))
+
+    def _crossmatch_chunk(self, arrays: dict, ra: np.ndarray, dec: np.ndarray, max_separation: float,
+                          all_matches: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :return: tuple of (indices of positions, positions of matched stars in the index order, separations)
+        """
+        known = np.flatnonzero(~(np.isnan(ra) | np.isnan(dec)))
+        ra, dec = ra[known] % 360, dec[known]
+        if np.any(np.abs(dec) > 90):
+            raise ValueError("Declination has to be within [-90, 90] degrees.")
+
+        # maximum difference of right ascension within the cone of each position (see cone_search)
+        full_circle = np.abs(dec) + max_separation >= 90
+        with np.errstate(divide='ignore', invalid='ignore'):
+            half_widths = np.degrees(np.arcsin(np.minimum(
+                math.sin(math.radians(max_separation)) / np.cos(np.radians(dec)), 1)))
+        half_widths = np.where(full_circle, 180, half_widths * (1 + 1e-9) + 1e-9)
+        # right ascension ranges of each position: the main one and the ones wrapped around 0h (see _get_ra_ranges)
+        ra_ranges = (
+            (np.where(full_circle, 0, np.maximum(ra - half_widths, 0)),
+             np.where(full_circle, 360, np.minimum(ra + half_widths, 360)), np.ones(len(ra), dtype=bool)),
+            (ra - half_widths + 360, np.full(len(ra), 360.0), ~full_circle & (ra - half_widths < 0)),
+            (np.zeros(len(ra)), ra + half_widths - 360, ~full_circle & (ra + half_widths >= 360)),
+        )
+
+        keys = arrays['keys']
+        first_zones = self._get_zones(dec - max_separation)
+        last_zones = self._get_zones(dec + max_separation)
+        starts, ends, range_inputs = [], [], []
+        for zone_offset in range(int((last_zones - first_zones).max(initial=0)) + 1):
+            zones = first_zones + zone_offset
+            zone_starts = zones * 360.0
+            zone_ends = np.searchsorted(keys, zone_starts + 360, side='left')
+            for ranges_min, ranges_max, ranges_valid in ra_ranges:
+                inputs = np.flatnonzero((zones <= last_zones) & ranges_valid)
+                starts.append(np.searchsorted(keys, zone_starts[inputs] + ranges_min[inputs], side='left'))
+                ends.append(np.minimum(np.searchsorted(keys, zone_starts[inputs] + ranges_max[inputs], side='right'),
+                                       zone_ends[inputs]))
+                range_inputs.append(inputs)
+        positions, range_indices = _expand_ranges(np.concatenate(starts), np.concatenate(ends))
+        inputs = np.concatenate(range_inputs)[range_indices]
+
+        chords = np.linalg.norm(arrays['vectors'][positions] - to_unit_vectors(ra[inputs], dec[inputs]), axis=1)
+        within = chords <= separation_to_chord(max_separation) * (1 + 1e-12)
+        inputs, positions, chords = inputs[within], positions[within], chords[within]
+        order = np.lexsort((chords, inputs))
+        inputs, positions, chords = inputs[order], positions[order], chords[order]
+        if not all_matches:
+            best = np.ones(len(inputs), dtype=bool)
+            best[1:] = inputs[1:] != inputs[:-1]
+            inputs, positions, chords = inputs[best], positions[best], chords[best]
+        return known[inputs], positions, chord_to_separation(chords)
+
+    def _save(self):
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temporary_path = self.path + '.tmp'
+        with self._lock:
+            with open(temporary_path, 'wb') as index_file:
+                np.savez(index_file, zone_height=self.zone_height,
+                         ids=self._arrays['ids'], ra=self._arrays['ra'], dec=self._arrays['dec'],
+                         renson=self._arrays['renson'])
+            os.replace(temporary_path, self.path)
@@ -0,0 +1,228 @@
+"""
+|    Columnar (struct-of-arrays) table of basic information of all stars.
+|
+|    Instead of one StarBasicInfo object per star, each property is stored in a single column:
+|        -> NumPy arrays for identifiers and coordinates (id, icrs_right_ascension, icrs_declination,
+           galactic_longitude, galactic_latitude)
+|        -> object array of interned strings for Renson identifiers (None if missing)
+|        -> categorical columns (integer codes + categories) for flags
+           (considered_category_affiliation_probability_flag, binary_system_component)
+|
+|    Columns can be combined into vectorized masks which select rows of the table, rows can also be found
+|    by CP-Stars or Renson identifier without scanning the table.
+|
+|       Example:
+|           -------------------------------------------------------------------------------------------------
+|              table = cpstars_instance.get_basic_info_table()
+|              northern_binaries = table[(table['icrs_declination'] > 0) & (table['binary_system_component'] != '')]
+|              row = table.get_row_by_renson('710')
+|           -------------------------------------------------------------------------------------------------
+"""
+
+import sys
+from typing import Optional
+
+import numpy as np
+
+# Python name -> JSON name of numeric columns and their types
+NUMERIC_COLUMNS = {
+    'id': ('id', np.int64),
+    'icrs_right_ascension': ('icrsRightAscension', np.float64),
+    'icrs_declination': ('icrsDeclination', np.float64),
+    'galactic_longitude': ('galacticLongitude', np.float64),
+    'galactic_latitude': ('galacticLatitude', np.float64),
+}
+
+# Python name -> JSON name of string columns
+STRING_COLUMNS = {
+    'renson': 'renson',
+}
+
+# Python name -> JSON name of columns with small number of distinct values
+CATEGORICAL_COLUMNS = {
+    'considered_category_affiliation_probability_flag': 'consideredCategoryAffiliationProbabilityFlag',
+    'binary_system_component': 'binarySystemComponent',
+}
+
+
+class CategoricalColumn:
+    """
+    Column of repeated values stored as integer codes into tuple of distinct values (categories).
+    Comparison with a value (==, !=) and isin(...) produce boolean masks.
+    """
+
+    def __init__(self, codes: np.ndarray, categories: tuple):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values) -> 'CategoricalColumn':
+        category_codes = {}
+        codes = np.fromiter((category_codes.setdefault(value, len(category_codes)) for value in values),
+                            dtype=np.int32)
+        return cls(codes, tuple(category_codes))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.categories[self.codes[key]]
+        return CategoricalColumn(self.codes[key], self.categories)
+
+    def __iter__(self):
+        return (self.categories[code] for code in self.codes)
+
+    def _get_code(self, value) -> int:
+        try:
+            return self.categories.index(value)
+        except ValueError:
+            return -1
+
+    def __eq__(self, value) -> np.ndarray:
+        return self.codes == self._get_code(value)
+
+    def __ne__(self, value) -> np.ndarray:
+        return self.codes != self._get_code(value)
+
+    def isin(self, values) -> np.ndarray:
+        return np.isin(self.codes, [self._get_code(value) for value in values])
+
+    def to_list(self) -> list:
+        return list(self)
+
+    def __repr__(self):
+        return 'CategoricalColumn(%r, categories=%r)' % (self.to_list(), self.categories)
+
+
+class StarBasicInfoTable:
+    """
+    Table of basic information of stars stored by columns, see module documentation.
+
+    table['column_name'] returns the column, table[mask], table[indices] or table[slice]
+    returns new table with selected rows.
+    """
+
+    def __init__(self, columns: dict):
+        """
+        StarBasicInfoTable class constructor.
+
+        :param columns: dictionary of column name -> column (all columns of the same length),
+                        'id' column is required
+        """
+        self.columns = columns
+        self._id_order = None
+        self._row_by_renson = None
+
+    @classmethod
+    def from_json(cls, basic_info_list: list) -> 'StarBasicInfoTable':
+        """
+        Build table from decoded JSON basic information of stars (/stars response).
+
+        :param basic_info_list: decoded JSON list
+        :return: table with a row per star
+        """
+        count = len(basic_info_list)
+        columns = {}
+        for name, (json_name, dtype) in NUMERIC_COLUMNS.items():
+            if dtype is np.float64:
+                values = (np.nan if star.get(json_name) is None else star[json_name] for star in basic_info_list)
+            else:
+                values = (star[json_name] for star in basic_info_list)
+            columns[name] = np.fromiter(values, dtype=dtype, count=count)
+        for name, json_name in STRING_COLUMNS.items():
+            column = np.empty(count, dtype=object)
+            column[:] = [None if star.get(json_name) is None else sys.intern(star[json_name])
+                         for star in basic_info_list]
+            columns[name] = column
+        for name, json_name in CATEGORICAL_COLUMNS.items():
+            columns[name] = CategoricalColumn.from_values(star.get(json_name) for star in basic_info_list)
+        return cls(columns)
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    @property
+    def column_names(self) -> list:
+        return list(self.columns)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, (int, np.integer)):
+            return self.get_row(key)
+        return StarBasicInfoTable({name: column[key] for name, column in self.columns.items()})
+
+    def with_column(self, name: str, values) -> 'StarBasicInfoTable':
+        """
+        :return: new table with additional (or replaced) column
+        """
+        columns = dict(self.columns)
+        columns[name] = values
+        return StarBasicInfoTable(columns)
+
+    def get_row(self, index: int) -> dict:
+        """
+        :param index: row index
+        :return: dictionary of column name -> value
+        """
+        row = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            row[name] = value.item() if isinstance(value, np.generic) else value
+        return row
+
+    def get_indices_by_ids(self, cp_stars_ids) -> np.ndarray:
+        """
+        Vectorized lookup of rows by CP-Stars identifiers.
+
+        :param cp_stars_ids: CP-Stars database identifiers
+        :return: array of row indices, -1 for identifiers not present in the table
+        """
+        ids = self.columns['id']
+        if self._id_order is None:
+            self._id_order = np.arange(len(ids)) if np.all(ids[1:] > ids[:-1]) else np.argsort(ids, kind='stable')
+        cp_stars_ids = np.asarray(cp_stars_ids, dtype=np.int64)
+        if len(ids) == 0:
+            return np.full(cp_stars_ids.shape, -1, dtype=np.int64)
+        sorted_ids = ids[self._id_order]
+        positions = np.minimum(np.searchsorted(sorted_ids, cp_stars_ids), len(ids) - 1)
+        found = sorted_ids[positions] == cp_stars_ids
+        return np.where(found, self._id_order[positions], -1)
+
+    def get_index_by_id(self, cp_stars_id: int) -> Optional[int]:
+        """
+        :param cp_stars_id: CP-Stars database identifier
+        :return: row index or None if the star is not present in the table
+        """
+        index = int(self.get_indices_by_ids([cp_stars_id])[0])
+        return index if index >= 0 else None
+
+    def get_index_by_renson(self, renson_id: str) -> Optional[int]:
+        """
+        :param renson_id: Renson identifier
+        :return: row index or None if the star is not present in the table
+        """
+        if self._row_by_renson is None:
+            self._row_by_renson = {renson: index for index, renson in enumerate(self.columns['renson'])
+                                   if renson is not None}
+        return self._row_by_renson.get(renson_id)
+
+    def get_row_by_id(self, cp_stars_id: int) -> Optional[dict]:
+        """
+        :param cp_stars_id: CP-Stars database identifier
+        :return: row (dictionary of column name -> value) or None if the star is not present in the table
+        """
+        index = self.get_index_by_id(cp_stars_id)
+        return self.get_row(index) if index is not None else None
+
+    def get_row_by_renson(self, renson_id: str) -> Optional[dict]:
+        """
+        :param renson_id: Renson identifier
+        :return: row (dictionary of column name -> value) or None if the star is not present in the table
+        """
+        index = self.get_index_by_renson(renson_id)
+        return self.get_row(index) if index is not None else None
+
+    def __repr__(self):
+        return 'StarBasicInfoTable(%d rows, columns=%r)' % (len(self), self.column_names)
@@ -0,0 +1,492 @@
+"""
+|    Local mock of the CP-Stars database server (backend).
+|
+|    Mock server answers all endpoints used by the client library with synthetic, deterministic data
+|    of the same structure as responses of CP-Stars database server. It is intended for offline tests
+|    and benchmarks, no network access is needed.
+|
+|       Example:
+|           -------------------------------------------------------------------------------------------------
+|              with MockServer(stars_count=1000) as server:
+|                  cpstars_instance = CPStars(host_address=server.host)
+|                  stars = cpstars_instance.get_basic_info_for_stars()
+|           -------------------------------------------------------------------------------------------------
+|
+|           -------------------------------------------------------------------------------------------------
+|              python mock_server.py [--port PORT] [--stars-count COUNT]
+|           -------------------------------------------------------------------------------------------------
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DATASOURCES = [
+    {
+        'id': 1,
+        'name': 'Renson',
+        'fullName': 'Catalogue of Ap, HgMn and Am stars',
+        'year': 2009,
+        'bibcode': '2009A&A...498..961R',
+        'description': 'Renson P., Manfroid J.',
+    },
+    {
+        'id': 2,
+        'name': 'Gaia DR2',
+        'fullName': 'Gaia Data Release 2',
+        'year': 2018,
+        'bibcode': '2018A&A...616A...1G',
+        'description': 'Gaia Collaboration',
+    },
+]
+
+MAGNITUDE_ATTRIBUTE_DEFINITION = {
+    'id': 1,
+    'name': 'filter',
+    'type': 'string',
+    'description': 'Photometric filter',
+}
+
+STAR_ATTRIBUTE_DEFINITION = {
+    'id': 2,
+    'name': 'spectralType',
+    'type': 'string',
+    'description': 'Spectral type',
+}
+
+
+class MockData:
+    """
+    Synthetic CP-Stars database content (decoded JSON).
+    The same arguments always produce the same data.
+    """
+
+    def __init__(self, stars_count: int = 500, light_curve_length: int = 1092,
+                 spectrum_length: int = 3233, magnitudes_count: int = 30, seed: int = 0):
+        self.light_curve_length = light_curve_length
+        self.spectrum_length = spectrum_length
+        self.magnitudes_count = magnitudes_count
+
+        generator = random.Random(seed)
+        self.stars = [
+            {
+                'id': star_id,
+                'renson': str(star_id * 10),
+                'consideredCategoryAffiliationProbabilityFlag': generator.choice(['', '?']),
+                'binarySystemComponent': generator.choice(['', 'A', 'B']),
+                'icrsRightAscension': generator.uniform(0.0, 360.0),
+                'icrsDeclination': generator.uniform(-90.0, 90.0),
+                'galacticLongitude': generator.uniform(0.0, 360.0),
+                'galacticLatitude': generator.uniform(-90.0, 90.0),
+            }
+            for star_id in range(1, stars_count + 1)
+        ]
+        self._stars_by_id = {star['id']: star for star in self.stars}
+        self._stars_by_renson = {star['renson']: star for star in self.stars}
+
+    def add_star(self, star: dict):
+        """
+        Add star (basic information), e.g. previously removed by remove_star.
+        """
+        self.stars.append(star)
+        self._stars_by_id[star['id']] = star
+        self._stars_by_renson[star['renson']] = star
+
+    def remove_star(self, cp_stars_id: int) -> dict:
+        """
+        Remove star from the served data.
+
+        :return: basic information of the removed star
+        """
+        star = self._stars_by_id.pop(cp_stars_id)
+        del self._stars_by_renson[star['renson']]
+        self.stars.remove(star)
+        return star
+
+    def get_basic_info(self, cp_stars_id: int):
+        return self._stars_by_id.get(cp_stars_id)
+
+    def get_star_id_by_renson(self, renson_id: str):
+        star = self._stars_by_renson.get(renson_id)
+        return star['id'] if star else None
+
+    def star(self, cp_stars_id: int) -> dict:
+        star = dict(self._stars_by_id[cp_stars_id])
+        star.update({
+            'icrsRightAscensionError': 0.01,
+            'icrsDeclinationError': 0.01,
+            'alpha': '00 00 00.0',
+            'delta': '+00 00 00',
+        })
+        return star
+
+    def extended_star(self, cp_stars_id: int) -> dict:
+        star = self.star(cp_stars_id)
+        star['externalDetails'] = self.external_details('Renson ' + star['renson'])
+        return star
+
+    def identifiers(self, cp_stars_id: int) -> list:
+        star = self.star(cp_stars_id)
+        return [
+            {
+                'id': cp_stars_id * 10 + index,
+                'star': star,
+                'datasource': datasource,
+                'name': '%s %d' % (datasource['name'], cp_stars_id),
+            }
+            for index, datasource in enumerate(DATASOURCES)
+        ]
+
+    def attributes(self, cp_stars_id: int) -> list:
+        return [{
+            'id': cp_stars_id,
+            'attributeDefinition': STAR_ATTRIBUTE_DEFINITION,
+            'datasource': DATASOURCES[0],
+            'value': 'A0p',
+            'star': self.star(cp_stars_id),
+        }]
+
+    def magnitudes(self, cp_stars_id: int) -> list:
+        star = self.star(cp_stars_id)
+        return [
+            {
+                'id': cp_stars_id * self.magnitudes_count + index,
+                'datasource': DATASOURCES[1],
+                'name': 'V',
+                'value': 7.0 + index * 0.25,
+                'star': star,
+                'error': 0.01,
+                'quality': None,
+                'uncertaintyFlag': None,
+            }
+            for index in range(self.magnitudes_count)
+        ]
+
+    def magnitude_attributes(self, cp_stars_id: int) -> list:
+        return [{
+            'id': cp_stars_id,
+            'attributeDefinition': MAGNITUDE_ATTRIBUTE_DEFINITION,
+            'value': 'V',
+        }]
+
+    def motions(self, cp_stars_id: int) -> list:
+        return [{
+            'id': cp_stars_id,
+            'star': self.star(cp_stars_id),
+            'datasource': DATASOURCES[1],
+            'properMotionRa': 1.5,
+            'properMotionRaError': 0.1,
+            'properMotionDec': -2.5,
+            'properMotionDecError': 0.1,
+            'parallax': 4.2,
+            'parallaxError': 0.05,
+        }]
+
+    def radial_velocities(self, cp_stars_id: int) -> list:
+        return [{
+            'id': cp_stars_id,
+            'star': self.star(cp_stars_id),
+            'datasource': DATASOURCES[1],
+            'radialVelocity': -12.5,
+            'radialVelocityError': 0.8,
+        }]
+
+    def light_curve(self, cp_stars_id: int) -> list:
+        return [
+            {'time': 2450000.0 + cp_stars_id + index * 0.125, 'value': 8.0 + (index % 100) * 0.001}
+            for index in range(self.light_curve_length)
+        ]
+
+    def spectrum(self, cp_stars_id: int) -> list:
+        # wavelengths are intentionally not sorted
+        return [
+            {'wavelength': 4000.0 + (index * 37) % self.spectrum_length, 'flux': 1.0 - (index % 50) * 0.002}
+            for index in range(self.spectrum_length)
+        ]
+
+    @staticmethod
+    def external_details(star_name: str) -> dict:
+        return {
+            'effectiveTemperature': 9500.0,
+            'effectiveTemperatureUnit': 'K',
+            'redshift': 0.0001,
+            'vizierTables': [{
+                'name': 'III/260',
+                'description': 'Catalogue of Ap, HgMn and Am stars',
+                'fields': ['Name', 'Sp'],
+                'data': [[star_name, 'A0p']],
+            }],
+        }
+
+    @staticmethod
+    def datasources() -> list:
+        return [
+            {key: datasource[key] for key in ('id', 'name', 'year', 'bibcode')}
+            for datasource in DATASOURCES
+        ]
+
+    @staticmethod
+    def datasource(datasource_id: int):
+        for datasource in DATASOURCES:
+            if datasource['id'] == datasource_id:
+                return datasource
+        return None
+
+    def export_csv(self, cp_stars_ids) -> list:
+        lines = ['id;renson;icrsRightAscension;icrsDeclination']
+        for cp_stars_id in cp_stars_ids:
+            star = self._stars_by_id.get(cp_stars_id)
+            if star is not None:
+                lines.append('%d;%s;%r;%r' % (star['id'], star['renson'],
+                                              star['icrsRightAscension'], star['icrsDeclination']))
+        return lines
+
+    def export_txt(self, cp_stars_id: int) -> str:
+        return '\n'.join('%s: %s' % item for item in self.star(cp_stars_id).items())
+
+
+# Star detail routes: (pattern, MockData method name), star identifier is the first group
+_STAR_ROUTES = [
+    (re.compile(r'/stars/(\d+)'), 'star'),
+    (re.compile(r'/stars/(\d+)/extended'), 'extended_star'),
+    (re.compile(r'/stars/(\d+)/identifiers'), 'identifiers'),
+    (re.compile(r'/stars/(\d+)/star-datasource-attributes'), 'attributes'),
+    (re.compile(r'/stars/(\d+)/magnitudes'), 'magnitudes'),
+    (re.compile(r'/stars/(\d+)/magnitudes-attributes'), 'magnitude_attributes'),
+    (re.compile(r'/stars/(\d+)/motions'), 'motions'),
+    (re.compile(r'/stars/(\d+)/radial-velocities'), 'radial_velocities'),
+    (re.compile(r'/stars/light-curves/(\d+)'), 'light_curve'),
+    (re.compile(r'/stars/spectra/(\d+)'), 'spectrum'),
+]
+
+# Routes of star details queried by Renson identifier (first group)
+_RENSON_ROUTES = [
+    (re.compile(r'/stars/renson/([^/]+)'), 'star'),
+    (re.compile(r'/stars/light-curves/([^/]+)/renson'), 'light_curve'),
+    (re.compile(r'/stars/spectra/([^/]+)/renson'), 'spectrum'),
+]
+
+# smaller responses are sent uncompressed
+_COMPRESSION_MIN_SIZE = 1024
+
+_EXTERNAL_ROUTE = re.compile(r'/external/astrosearcher/(identifiers|simbad|vizier-metadata)/([^/]+)')
+_DATASOURCE_ROUTE = re.compile(r'/datasources/(\d+)')
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # responses are written at once (no small writes delayed by Nagle's algorithm)
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        failing = self.server.mock._count_request()
+        if self.server.mock.latency:
+            time.sleep(self.server.mock.latency)
+        data: MockData = self.server.mock.data
+        parsed = urlsplit(self.path)
+        path = parsed.path
+
+        if failing:
+            return self._send_failure()
+        if path == '/stars':
+            return self._send_json(data.stars)
+        if path == '/datasources':
+            return self._send_json(data.datasources())
+        if path == '/export/csv/all':
+            return self._send_json(data.export_csv(star['id'] for star in data.stars))
+        if path == '/export/txt':
+            cp_stars_id = int(parse_qs(parsed.query).get('id', ['0'])[0])
+            if data.get_basic_info(cp_stars_id) is None:
+                return self._send_error(404)
+            return self._send(200, data.export_txt(cp_stars_id).encode('utf-8'), 'text/plain')
+
+        for pattern, method_name in _STAR_ROUTES:
+            match = pattern.fullmatch(path)
+            if match:
+                cp_stars_id = int(match.group(1))
+                if data.get_basic_info(cp_stars_id) is None:
+                    return self._send_error(404)
+                return self._send_json(getattr(data, method_name)(cp_stars_id))
+
+        for pattern, method_name in _RENSON_ROUTES:
+            match = pattern.fullmatch(path)
+            if match:
+                cp_stars_id = data.get_star_id_by_renson(unquote(match.group(1)))
+                if cp_stars_id is None:
+                    return self._send_error(404)
+                return self._send_json(getattr(data, method_name)(cp_stars_id))
+
+        match = _EXTERNAL_ROUTE.fullmatch(path)
+        if match:
+            star_name = unquote(match.group(2))
+            if match.group(1) == 'identifiers':
+                return self._send_json([star_name])
+            details = data.external_details(star_name)
+            if match.group(1) == 'simbad':
+                details.pop('vizierTables')
+            else:
+                details = {'vizierTables': details['vizierTables']}
+            return self._send_json(details)
+
+        match = _DATASOURCE_ROUTE.fullmatch(path)
+        if match:
+            datasource = data.datasource(int(match.group(1)))
+            if datasource is None:
+                return self._send_error(404)
+            return self._send_json(datasource)
+
+        self._send_error(404)
+
+    def do_POST(self):
+        failing = self.server.mock._count_request()
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if failing:
+            return self._send_failure()
+        if urlsplit(self.path).path != '/export/csv':
+            return self._send_error(404)
+        form = json.loads(body or b'{}')
+        self._send_json(self.server.mock.data.export_csv(form.get('starIdsToExport', [])))
+
+    def _send_json(self, body):
+        self._send(200, json.dumps(body).encode('utf-8'), 'application/json')
+
+    def _send_error(self, status: int):
+        self._send(status, json.dumps({'status': status, 'path': self.path}).encode('utf-8'), 'application/json')
+
+    def _send_failure(self):
+        body = json.dumps({'status': 503, 'path': self.path}).encode('utf-8')
+        self.send_response(503)
+        self.send_header('Content-Type', 'application/json')
+        if self.server.mock.retry_after is not None:
+            self.send_header('Retry-After', str(self.server.mock.retry_after))
+        self.send_header('Content-Length', str(len(body)))
+        # counted before anything is sent, the client can not receive the response before it is counted
+        self.server.mock._count_bytes_sent(len(body))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        if status == 200 and self.command == 'GET':
+            etag = '"%s"' % hashlib.sha1(body).hexdigest()
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if status == 200 and self.command == 'GET':
+            self.send_header('ETag', etag)
+        accepted_encodings = [encoding.strip() for encoding in self.headers.get('Accept-Encoding', '').split(',')]
+        if self.server.mock.compression and 'gzip' in accepted_encodings and len(body) >= _COMPRESSION_MIN_SIZE:
+            body = gzip.compress(body, compresslevel=6)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        # counted before anything is sent, the client can not receive the response before it is counted
+        self.server.mock._count_bytes_sent(len(body))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # clients may close connection without reading the whole response
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class MockServer:
+    """
+    CP-Stars database mock server running in a background thread.
+
+    Server is started by start() (or by entering the context manager) and
+    its address is available in host attribute (e.g. 'http://127.0.0.1:40123').
+    """
+
+    def __init__(self, port: int = 0, data: MockData = None, compression: bool = True, latency: float = 0,
+                 failures: int = 0, retry_after: int = None, **data_options):
+        """
+        MockServer class constructor.
+
+        :param port: port to listen on (127.0.0.1), random free port is used by default
+        :param data: served data, MockData(**data_options) is created if not specified
+        :param compression: if True, responses are gzip compressed for clients accepting it
+        :param latency: number of seconds each response is delayed by (simulated network latency)
+        :param failures: number of first requests answered by 503 Service Unavailable (simulated backend hiccup)
+        :param retry_after: value of Retry-After header (seconds) of 503 responses, not sent if None
+        :param data_options: options of MockData (e.g. stars_count)
+        """
+        self.port = port
+        self.data = data or MockData(**data_options)
+        self.compression = compression
+        self.latency = latency
+        self.failures = failures
+        self.retry_after = retry_after
+        self.requests_count = 0
+        # bytes of sent response bodies (as sent, i.e. compressed), headers are not counted
+        self.bytes_sent = 0
+        self._requests_count_lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        return 'http://127.0.0.1:%d' % self._server.server_address[1]
+
+    def _count_request(self) -> bool:
+        """Counts the request, returns True if it should be answered by failure."""
+        with self._requests_count_lock:
+            self.requests_count += 1
+            return self.requests_count <= self.failures
+
+    def _count_bytes_sent(self, count: int):
+        with self._requests_count_lock:
+            self.bytes_sent += count
+
+    def start(self):
+        self._server = _Server(('127.0.0.1', self.port), _RequestHandler)
+        self._server.mock = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='CP-Stars database mock server')
+    parser.add_argument('--port', type=int, default=8081, help='port to listen on')
+    parser.add_argument('--stars-count', type=int, default=8205, help='number of synthetic stars')
+    parser.add_argument('--latency', type=float, default=0, help='delay of each response in seconds')
+    arguments = parser.parse_args()
+
+    mock_server = MockServer(arguments.port, latency=arguments.latency, stars_count=arguments.stars_count).start()
+    print("Serving CP-Stars mock database at " + mock_server.host)
+    try:
+        mock_server._thread.join()
+    except KeyboardInterrupt:
+        mock_server.stop()
@@ -12,11 +12,18 @@
 
 __version__ = "1.0.0"
 
-# import ApiClient
-from openapi_client.api_client import ApiClient
+import typing
 
-# import Configuration
-from openapi_client.configuration import Configuration
+# ApiClient and Configuration are imported on first access (see __getattr__),
+# importing the package does not import urllib3 and models
+if typing.TYPE_CHECKING:
+    from openapi_client.api_client import ApiClient
+    from openapi_client.configuration import Configuration
+
+_LAZY_ATTRIBUTES = {
+    'ApiClient': 'openapi_client.api_client',
+    'Configuration': 'openapi_client.configuration',
+}
 
 # import exceptions
 from openapi_client.exceptions import OpenApiException
@@ -25,3 +32,17 @@ from openapi_client.exceptions import ApiTypeError
 from openapi_client.exceptions import ApiValueError
 from openapi_client.exceptions import ApiKeyError
 from openapi_client.exceptions import ApiException
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError("module 'openapi_client' has no attribute '{0}'".format(name))
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
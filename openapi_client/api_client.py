@@ -10,11 +10,12 @@
 
 import json
 import atexit
+import functools
 import mimetypes
-from multiprocessing.pool import ThreadPool
 import io
 import os
 import re
+import time
 import typing
 from urllib.parse import quote
 from urllib3.fields import RequestField
@@ -23,6 +24,13 @@ from urllib3.fields import RequestField
 from openapi_client import rest
 from openapi_client.configuration import Configuration
 from openapi_client.exceptions import ApiTypeError, ApiValueError, ApiException
+from openapi_client.compact_model import deserialize_compact_data
+from openapi_client.fast_deserializer import deserialize_trusted_data
+from openapi_client.instrumentation import RequestMetrics, measuring
+from openapi_client.json_stream import iter_json_array
+from openapi_client.lazy_model import deserialize_lazy_data
+from openapi_client.model_interning import InternPool, interning
+from openapi_client.single_flight import SingleFlight
 from openapi_client.model_utils import (
     ModelNormal,
     ModelSimple,
@@ -75,6 +83,10 @@ class ApiClient(object):
         if header_name is not None:
             self.default_headers[header_name] = header_value
         self.cookie = cookie
+        # canonical instances of shared models, see Configuration.intern_models
+        self.intern_pool = InternPool(weak=True)
+        # in-flight requests shared by concurrent callers, see Configuration.coalesce_requests
+        self.single_flight = SingleFlight()
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
 
@@ -98,6 +110,8 @@ class ApiClient(object):
          avoids instantiating unused threadpool for blocking clients.
         """
         if self._pool is None:
+            # imported here, multiprocessing.pool is slow to import
+            from multiprocessing.pool import ThreadPool
             atexit.register(self.close)
             self._pool = ThreadPool(self.pool_threads)
         return self._pool
@@ -138,6 +152,11 @@ class ApiClient(object):
 
         config = self.configuration
 
+        # path of the endpoint identifies measured calls, before parameters are substituted
+        metrics = None
+        if config.metrics_collector is not None:
+            metrics = RequestMetrics(method, resource_path)
+
         # header parameters
         header_params = header_params or {}
         header_params.update(self.default_headers)
@@ -193,6 +212,20 @@ class ApiClient(object):
             # use server/host defined in path or operation instead
             url = _host + resource_path
 
+        if metrics is None:
+            return self.__request_and_deserialize(
+                None, method, url, query_params, header_params, post_params, body, response_type,
+                _return_http_data_only, _preload_content, _request_timeout, _check_type)
+        with measuring(metrics, config.metrics_collector):
+            return self.__request_and_deserialize(
+                metrics, method, url, query_params, header_params, post_params, body, response_type,
+                _return_http_data_only, _preload_content, _request_timeout, _check_type)
+
+    def __request_and_deserialize(self, metrics, method, url, query_params, header_params, post_params, body,
+                                  response_type, _return_http_data_only, _preload_content, _request_timeout,
+                                  _check_type):
+        if metrics is not None:
+            network_started = time.perf_counter()
         try:
             # perform request and return response
             response_data = self.request(
@@ -203,17 +236,25 @@ class ApiClient(object):
         except ApiException as e:
             e.body = e.body.decode('utf-8')
             raise e
+        finally:
+            if metrics is not None:
+                metrics.network_time = time.perf_counter() - network_started
 
         self.last_response = response_data
 
         return_data = response_data
 
+        if metrics is not None:
+            metrics.status = response_data.status
+
         if not _preload_content:
             return (return_data)
             return return_data
 
         # deserialize response data
         if response_type:
+            if metrics is not None:
+                decode_started = time.perf_counter()
             if response_type != (file_type,):
                 encoding = "utf-8"
                 content_type = response_data.getheader('content-type')
@@ -223,11 +264,21 @@ class ApiClient(object):
                         encoding = match.group(1)
                 response_data.data = response_data.data.decode(encoding)
 
-            return_data = self.deserialize(
-                response_data,
-                response_type,
-                _check_type
-            )
+            if metrics is None:
+                return_data = self.deserialize(
+                    response_data,
+                    response_type,
+                    _check_type
+                )
+            elif response_type == (file_type,):
+                return_data = self.deserialize(response_data, response_type, _check_type)
+                metrics.model_time = time.perf_counter() - decode_started
+            else:
+                received_data = self._decode_json(response_data)
+                model_started = time.perf_counter()
+                metrics.decode_time = model_started - decode_started
+                return_data = self.deserialize_data(received_data, response_type, _check_type)
+                metrics.model_time = time.perf_counter() - model_started
         else:
             return_data = None
 
@@ -324,10 +375,115 @@ class ApiClient(object):
                                     content_disposition=content_disposition)
 
         # fetch data from response object
+        received_data = self._decode_json(response)
+
+        return self.deserialize_data(received_data, response_type, _check_type)
+
+    @staticmethod
+    def _decode_json(response):
         try:
-            received_data = json.loads(response.data)
+            return json.loads(response.data)
         except ValueError:
-            received_data = response.data
+            return response.data
+
+    def deserialize_data(self, received_data, response_type, _check_type=True):
+        """Deserializes already decoded JSON data into an object.
+
+        Used for response bodies and for data received earlier and stored
+        locally (e.g. in a catalog mirror).
+
+        :param received_data: decoded JSON data (lists, dicts, primitives).
+        :param response_type: For the response, a tuple containing
+            valid classes, see `deserialize`.
+        :param _check_type: boolean, whether to check the types of the data
+        :type _check_type: bool
+
+        :return: deserialized object.
+        """
+        intern_models = self.configuration.intern_models
+        if intern_models:
+            pool = self.intern_pool if intern_models == 'session' else InternPool()
+            with interning(pool):
+                return self._deserialize_data(received_data, response_type, _check_type)
+        return self._deserialize_data(received_data, response_type, _check_type)
+
+    def stream_json_array(self, response, chunk_size=65536):
+        """Decodes JSON array response item by item while it is received.
+
+        The connection is released when the array is consumed, closed if the
+        iteration is stopped earlier.
+
+        :param response: urllib3.HTTPResponse returned for
+            `_preload_content=False`.
+        :param chunk_size: number of bytes read from the socket at once.
+
+        :return: generator of decoded items (lists, dicts, primitives).
+        """
+        completed = False
+        try:
+            for item in iter_json_array(response.stream(chunk_size)):
+                yield item
+            completed = True
+        finally:
+            if not completed:
+                # unread rest of the body must not be left on pooled connection
+                response.close()
+            response.release_conn()
+
+    def deserialize_stream(self, response, item_type, _check_type=True, chunk_size=65536):
+        """Deserializes JSON array response item by item while it is received.
+
+        Only the currently decoded part of the body is held in memory, models
+        are yielded as soon as their data are received.
+
+        :param response: urllib3.HTTPResponse returned for
+            `_preload_content=False`.
+        :param item_type: a tuple containing valid classes of array items,
+            e.g. (StarBasicInfo,).
+        :param _check_type: boolean, whether to check the types of the data
+        :param chunk_size: number of bytes read from the socket at once.
+
+        :return: generator of deserialized items.
+        """
+        intern_models = self.configuration.intern_models
+        pool = None
+        if intern_models:
+            pool = self.intern_pool if intern_models == 'session' else InternPool()
+
+        for item in self.stream_json_array(response, chunk_size):
+            with interning(pool):
+                deserialized_item = self._deserialize_data(item, item_type, _check_type)
+            yield deserialized_item
+
+    def _deserialize_data(self, received_data, response_type, _check_type):
+        # lazy models convert values of attributes when they are accessed
+        if self.configuration.model_representation == 'lazy':
+            return deserialize_lazy_data(
+                received_data,
+                response_type,
+                ['received_data'],
+                self.configuration,
+                _check_type
+            )
+        if self.configuration.model_representation == 'compact':
+            return deserialize_compact_data(
+                received_data,
+                response_type,
+                ['received_data'],
+                self.configuration,
+                _check_type
+            )
+
+        # responses of trusted server skip type validation and are mapped
+        # to models by precompiled decoders
+        if self.configuration.trusted_server:
+            return deserialize_trusted_data(
+                received_data,
+                response_type,
+                ['received_data'],
+                self.configuration,
+                _check_type
+            )
 
         # store our data under the key of 'received_data' so users have some
         # context if they are deserializing a string and the data type is wrong
@@ -878,7 +1034,8 @@ class Endpoint(object):
                     if content_types_list:
                         params['header']['Content-Type'] = content_types_list
 
-        return self.api_client.call_api(
+        call_api = functools.partial(
+            self.api_client.call_api,
             self.settings['endpoint_path'], self.settings['http_method'],
             params['path'],
             params['query'],
@@ -896,3 +1053,34 @@ class Endpoint(object):
             _host=_host,
             _request_auths=kwargs['_request_auths'],
             collection_formats=params['collection_format'])
+
+        if self.api_client.configuration.coalesce_requests:
+            coalescing_key = self.__get_coalescing_key(params, kwargs, _host)
+            if coalescing_key is not None:
+                return self.api_client.single_flight.do(coalescing_key, call_api)
+        return call_api()
+
+    def __get_coalescing_key(self, params, kwargs, _host):
+        """Returns key identifying equal calls which may share one request
+        or None if the call can not be coalesced (not a GET request, raw or
+        asynchronous response, unhashable parameters)."""
+        if (self.settings['http_method'] != 'GET' or kwargs['async_req'] or
+                not kwargs['_preload_content'] or params['body'] is not None or
+                params['form'] or params['file'] or
+                kwargs['_request_auths']):
+            return None
+        key = (
+            self.settings['operation_id'],
+            _host,
+            tuple(sorted(params['path'].items())),
+            tuple(params['query']),
+            tuple(sorted(params['header'].items())),
+            kwargs['_check_return_type'],
+            kwargs['_return_http_data_only'],
+            kwargs['_request_timeout'],
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
@@ -12,9 +12,37 @@
 #
 #   import sys
 #   sys.setrecursionlimit(n)
+#
+# Classes are imported on first access (see __getattr__), importing this
+# package alone is cheap.
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from openapi_client.api.datasources_controller_api import DatasourcesControllerApi
+    from openapi_client.api.export_controller_api import ExportControllerApi
+    from openapi_client.api.external_services_controller_api import ExternalServicesControllerApi
+    from openapi_client.api.stars_controller_api import StarsControllerApi
+
+_LAZY_ATTRIBUTES = {
+    'DatasourcesControllerApi': 'openapi_client.api.datasources_controller_api',
+    'ExportControllerApi': 'openapi_client.api.export_controller_api',
+    'ExternalServicesControllerApi': 'openapi_client.api.external_services_controller_api',
+    'StarsControllerApi': 'openapi_client.api.stars_controller_api',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
-# Import APIs into API package:
-from openapi_client.api.datasources_controller_api import DatasourcesControllerApi
-from openapi_client.api.export_controller_api import ExportControllerApi
-from openapi_client.api.external_services_controller_api import ExternalServicesControllerApi
-from openapi_client.api.stars_controller_api import StarsControllerApi
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
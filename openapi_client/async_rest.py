@@ -0,0 +1,320 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Non-blocking HTTP/1.1 transport for asyncio based clients.
+
+    The transport uses asyncio streams only (no additional dependencies). It keeps
+    idle keep-alive connections in a per-host pool, limits the number of requests
+    in flight and supports total or (connection, read) timeouts.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import asyncio
+import json
+import logging
+import ssl
+import threading
+import weakref
+from urllib.parse import urlencode, urlsplit
+
+from openapi_client.content_encoding import decode_content, get_accept_encoding
+from openapi_client.exceptions import ApiException, ApiValueError
+from openapi_client.rest import raise_for_status
+
+
+logger = logging.getLogger(__name__)
+
+# Methods whose requests can be repeated without changing the result (RFC 9110)
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'])
+
+
+class _NoResponseError(ConnectionError):
+    """Connection was closed before any byte of the response was received."""
+
+
+class AsyncRESTResponse(object):
+
+    def __init__(self, status, reason, headers, data):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name.lower(), default)
+
+
+class _Connection(object):
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        try:
+            self.writer.close()
+        except RuntimeError:
+            # event loop of the connection is already closed
+            pass
+
+
+class _LoopState(object):
+    """Limit of requests in flight and idle connections of a single event loop
+    (asyncio streams and synchronization primitives are bound to their loop)."""
+
+    def __init__(self, maxsize):
+        self.semaphore = asyncio.Semaphore(maxsize)
+        self.idle_connections = {}
+
+
+class AsyncRESTClientObject(object):
+
+    def __init__(self, configuration, maxsize=None, timeout=None):
+        """
+        :param configuration: .Configuration object (host, SSL settings,
+                              connection_pool_maxsize)
+        :param maxsize: maximum number of requests in flight (and of pooled
+                        connections), configuration.connection_pool_maxsize
+                        is used by default
+        :param timeout: default timeout of requests, one number for total
+                        timeout or a pair (tuple) of (connection, read)
+                        timeouts
+        """
+        if configuration.proxy:
+            raise ApiValueError("Proxy is not supported by AsyncRESTClientObject.")
+
+        self.configuration = configuration
+        self.maxsize = maxsize or configuration.connection_pool_maxsize or 4
+        self.timeout = timeout
+        # event loop -> _LoopState, the client may be used by consecutive (or concurrent) event loops
+        self._loop_states = weakref.WeakKeyDictionary()
+        self._loop_states_lock = threading.Lock()
+        self._ssl_context = None
+        self.accept_encoding = get_accept_encoding(configuration.accept_encoding)
+
+    def _get_ssl_context(self):
+        if self._ssl_context is None:
+            context = ssl.create_default_context(cafile=self.configuration.ssl_ca_cert)
+            if self.configuration.cert_file:
+                context.load_cert_chain(self.configuration.cert_file, self.configuration.key_file)
+            if not self.configuration.verify_ssl:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            elif self.configuration.assert_hostname is False:
+                context.check_hostname = False
+            self._ssl_context = context
+        return self._ssl_context
+
+    def _get_loop_state(self):
+        loop = asyncio.get_running_loop()
+        with self._loop_states_lock:
+            loop_state = self._loop_states.get(loop)
+            if loop_state is None:
+                loop_state = self._loop_states[loop] = _LoopState(self.maxsize)
+            return loop_state
+
+    async def close(self):
+        """Close all idle pooled connections."""
+        with self._loop_states_lock:
+            loop_states = list(self._loop_states.values())
+            self._loop_states.clear()
+        for loop_state in loop_states:
+            for connections in loop_state.idle_connections.values():
+                for connection in connections:
+                    connection.close()
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, _request_timeout=None):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param query_params: query parameters in the url
+        :param headers: http request headers
+        :param body: request body, serialized to json unless it is str/bytes
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        parsed = urlsplit(url)
+        if parsed.scheme not in ('http', 'https'):
+            raise ApiValueError("Unsupported URL scheme: %s" % parsed.scheme)
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        key = (parsed.scheme, parsed.hostname, port)
+
+        target = parsed.path or '/'
+        if parsed.query:
+            target += '?' + parsed.query
+        if query_params:
+            target += ('&' if parsed.query else '?') + urlencode(query_params)
+
+        headers = dict(headers or {})
+        if self.accept_encoding and 'Accept-Encoding' not in headers:
+            headers['Accept-Encoding'] = self.accept_encoding
+        if body is not None and not isinstance(body, (str, bytes)):
+            body = json.dumps(body)
+            headers.setdefault('Content-Type', 'application/json')
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        request_bytes = self._serialize_request(method, target, parsed.netloc, headers, body)
+
+        timeout = _request_timeout if _request_timeout is not None else self.timeout
+        connect_timeout = read_timeout = None
+        if isinstance(timeout, tuple) and len(timeout) == 2:
+            connect_timeout, read_timeout = timeout
+            timeout = None
+
+        loop_state = self._get_loop_state()
+        async with loop_state.semaphore:
+            exchange = self._exchange(loop_state, key, method, request_bytes, connect_timeout, read_timeout)
+            try:
+                if timeout:
+                    r = await asyncio.wait_for(exchange, timeout)
+                else:
+                    r = await exchange
+            except ssl.SSLError as e:
+                msg = "{0}\n{1}".format(type(e).__name__, str(e))
+                raise ApiException(status=0, reason=msg)
+
+        if r.data and 'content-encoding' in r.headers:
+            r.data = decode_content(r.data, r.headers['content-encoding'])
+
+        # log response body
+        logger.debug("response body: %s", r.data)
+
+        raise_for_status(r)
+
+        return r
+
+    @staticmethod
+    def _serialize_request(method, target, netloc, headers, body):
+        lines = ['%s %s HTTP/1.1' % (method, target)]
+        names = {name.lower() for name in headers}
+        if 'host' not in names:
+            lines.append('Host: %s' % netloc)
+        if body is not None:
+            lines.append('Content-Length: %d' % len(body))
+        for name, value in headers.items():
+            lines.append('%s: %s' % (name, value))
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        return head + body if body is not None else head
+
+    async def _connect(self, key, connect_timeout):
+        scheme, host, port = key
+        ssl_context = self._get_ssl_context() if scheme == 'https' else None
+        opening = asyncio.open_connection(host, port, ssl=ssl_context)
+        if connect_timeout:
+            reader, writer = await asyncio.wait_for(opening, connect_timeout)
+        else:
+            reader, writer = await opening
+        return _Connection(reader, writer)
+
+    async def _exchange(self, loop_state, key, method, request_bytes, connect_timeout, read_timeout):
+        idle_connections = loop_state.idle_connections.setdefault(key, [])
+        while True:
+            reused = bool(idle_connections)
+            connection = idle_connections.pop() if reused else await self._connect(key, connect_timeout)
+            request_sent = False
+            try:
+                connection.writer.write(request_bytes)
+                await connection.writer.drain()
+                request_sent = True
+                reading = self._read_response(connection.reader, method)
+                if read_timeout:
+                    r, keep_alive = await asyncio.wait_for(reading, read_timeout)
+                else:
+                    r, keep_alive = await reading
+            except (OSError, RuntimeError, asyncio.IncompleteReadError) as e:
+                connection.close()
+                # idle keep-alive connection was closed by the server (or is otherwise stale), use a new one;
+                # requests of other than idempotent methods are resent only if no response was received
+                # (they were not processed)
+                if reused and (method in IDEMPOTENT_METHODS or not request_sent or isinstance(e, _NoResponseError)):
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            if keep_alive and len(idle_connections) < self.maxsize:
+                idle_connections.append(connection)
+            else:
+                connection.close()
+            return r
+
+    @staticmethod
+    async def _read_response(reader, method):
+        response_started = False
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                if not response_started:
+                    raise _NoResponseError("Connection closed by the server.")
+                raise ConnectionError("Connection closed by the server.")
+            response_started = True
+            version, status, reason = (status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + ['', ''])[:3]
+            if not version.startswith('HTTP/') or not status.isdigit():
+                raise ApiException(status=0, reason="Invalid HTTP status line: %r" % status_line)
+            status = int(status)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                name = name.strip().lower()
+                value = value.strip()
+                headers[name] = headers[name] + ', ' + value if name in headers else value
+
+            # skip interim responses (e.g. 100 Continue)
+            if not 100 <= status < 200:
+                break
+
+        connection_header = headers.get('connection', '').lower()
+        keep_alive = (
+            connection_header != 'close' and
+            (version == 'HTTP/1.1' or connection_header == 'keep-alive')
+        )
+
+        if method == 'HEAD' or status in (204, 304):
+            data = b''
+        elif 'chunked' in headers.get('transfer-encoding', '').lower():
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                try:
+                    size = int(size_line.split(b';', 1)[0].strip(), 16)
+                    if size < 0:
+                        raise ValueError(size)
+                except ValueError:
+                    raise ApiException(status=0, reason="Invalid HTTP chunk size line: %r" % size_line)
+                if size == 0:
+                    # skip trailers
+                    while await reader.readline() not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b''.join(chunks)
+        elif 'content-length' in headers:
+            if not headers['content-length'].isdigit():
+                raise ApiException(status=0, reason="Invalid Content-Length: %r" % headers['content-length'])
+            data = await reader.readexactly(int(headers['content-length']))
+        else:
+            data = await reader.read()
+            keep_alive = False
+
+        return AsyncRESTResponse(status, reason, headers, data), keep_alive
@@ -0,0 +1,284 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Compact records of high-volume models (Configuration.model_representation = 'compact').
+
+    Items of large responses (e.g. basic information of all stars, light curve
+    measurements) are deserialized into immutable records with __slots__
+    instead of model instances, each record holds just the values of its
+    attributes (no __dict__, data store, path or configuration references).
+    Records provide read access of models (attribute access, get(...), [...],
+    to_dict()) and are converted to full models on demand by to_model().
+    Other models (including models embedded in records, e.g. Star of a
+    Magnitude) are deserialized as usual.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import threading
+
+from openapi_client.exceptions import ApiAttributeError
+from openapi_client.lazy_model import _get_trusted_converter, _get_validating_converter
+from openapi_client.model_utils import OpenApiModel, none_type
+
+
+_MISSING = object()
+
+
+def get_compact_model_classes():
+    """Returns model classes deserialized into compact records.
+
+    Imported lazily, the models import model_utils which this module is
+    imported by.
+    """
+    from openapi_client.model.light_curve_measurement import LightCurveMeasurement
+    from openapi_client.model.magnitude import Magnitude
+    from openapi_client.model.motion import Motion
+    from openapi_client.model.radial_velocity import RadialVelocity
+    from openapi_client.model.spectrum_measurement import SpectrumMeasurement
+    from openapi_client.model.star_basic_info import StarBasicInfo
+    return (StarBasicInfo, LightCurveMeasurement, SpectrumMeasurement, Magnitude, Motion, RadialVelocity)
+
+
+def _to_dict_value(value):
+    if isinstance(value, (OpenApiModel, CompactRecord)):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_dict_value(item) for item in value]
+    return value
+
+
+def _restore_record(model_class, values):
+    return get_compact_class(model_class).from_values(values)
+
+
+class CompactRecord(object):
+    """Base class of compact records, see module documentation.
+
+    Attributes which were not present in the received data are not set
+    (get(...) returns the default value, `in` operator returns False).
+    """
+
+    __slots__ = ()
+    model_class = None
+    attribute_names = ()
+
+    @classmethod
+    def from_values(cls, values):
+        """Creates record from dictionary of python attribute name -> value."""
+        record = object.__new__(cls)
+        for name, value in values.items():
+            object.__setattr__(record, name, value)
+        return record
+
+    def __setattr__(self, name, value):
+        raise ApiAttributeError("{0} is immutable".format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise ApiAttributeError("{0} is immutable".format(type(self).__name__))
+
+    def get(self, name, default=None):
+        """returns the value of an attribute or some default value if the attribute was not set"""
+        if name not in self.attribute_names:
+            return default
+        return getattr(self, name, default)
+
+    def __getitem__(self, name):
+        value = self.get(name, _MISSING)
+        if value is _MISSING:
+            raise ApiAttributeError("{0} has no attribute '{1}'".format(type(self).__name__, name))
+        return value
+
+    def __contains__(self, name):
+        return name in self.attribute_names and hasattr(self, name)
+
+    def items(self):
+        """Returns list of (attribute name, value) of the set attributes."""
+        return [
+            (name, value) for name, value in ((name, getattr(self, name, _MISSING)) for name in self.attribute_names)
+            if value is not _MISSING
+        ]
+
+    def to_dict(self):
+        """Returns the record properties as a dict (as to_dict of the model)"""
+        return {name: _to_dict_value(value) for name, value in self.items()}
+
+    def to_model(self):
+        """Returns instance of the model class with the same values."""
+        return self.model_class._from_openapi_data(**dict(self.items()))
+
+    def __eq__(self, other):
+        if isinstance(other, CompactRecord):
+            return self.model_class is other.model_class and self.items() == other.items()
+        if self.model_class is not None and isinstance(other, self.model_class):
+            return self.to_model() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash((self.model_class, tuple(self.items())))
+
+    def __reduce__(self):
+        return _restore_record, (self.model_class, dict(self.items()))
+
+    def __repr__(self):
+        return '{0}({1})'.format(
+            type(self).__name__, ', '.join('{0}={1!r}'.format(name, value) for name, value in self.items()))
+
+
+_compact_classes = {}
+_compact_classes_lock = threading.Lock()
+_record_decoders = {}
+_record_decoders_lock = threading.Lock()
+
+
+def get_compact_class(model_class):
+    """Returns compact record class of the model class (created on first use).
+
+    Args:
+        model_class (ModelNormal): the model class
+
+    Returns:
+        subclass of CompactRecord named Compact<model class name>
+    """
+    compact_class = _compact_classes.get(model_class)
+    if compact_class is None:
+        with _compact_classes_lock:
+            compact_class = _compact_classes.get(model_class)
+            if compact_class is None:
+                attribute_names = tuple(model_class.attribute_map)
+                compact_class = type('Compact' + model_class.__name__, (CompactRecord,), {
+                    '__slots__': attribute_names,
+                    'model_class': model_class,
+                    'attribute_names': attribute_names,
+                    '__module__': __name__,
+                })
+                _compact_classes[model_class] = compact_class
+    return compact_class
+
+
+def _compile_record_decoder(model_class, trusted):
+    compact_class = get_compact_class(model_class)
+    fields = {}
+    for python_name, json_name in model_class.attribute_map.items():
+        required_types_mixed = model_class.openapi_types[python_name]
+        if trusted:
+            converter = _get_trusted_converter(required_types_mixed)
+        else:
+            converter = _get_validating_converter(required_types_mixed)
+        # values are stored by slot descriptors, bypassing __setattr__ of the immutable record
+        fields[json_name] = (python_name, getattr(compact_class, python_name).__set__, converter)
+    new_instance = object.__new__
+
+    def decode(model_data, path_to_item, configuration, check_type):
+        record = new_instance(compact_class)
+        for json_name, value in model_data.items():
+            field = fields.get(json_name)
+            if field is None:
+                # unknown keys are discarded
+                continue
+            python_name, set_value, converter = field
+            if converter is not None:
+                value = converter(value, path_to_item + [python_name], configuration, check_type)
+            set_value(record, value)
+        return record
+
+    return decode
+
+
+def get_record_decoder(model_class, trusted):
+    """Returns decoder of JSON objects into compact records of the model class.
+
+    Args:
+        model_class (ModelNormal): the model class
+        trusted (bool): whether values are converted without validation
+
+    Returns:
+        decoder function (model_data, path_to_item, configuration, check_type) -> record
+    """
+    key = (model_class, trusted)
+    decoder = _record_decoders.get(key)
+    if decoder is None:
+        with _record_decoders_lock:
+            decoder = _record_decoders.get(key)
+            if decoder is None:
+                decoder = _record_decoders[key] = _compile_record_decoder(model_class, trusted)
+    return decoder
+
+
+def _get_record_converter(model_class, trusted, convert_other):
+    decode = get_record_decoder(model_class, trusted)
+
+    def convert(value, path_to_item, configuration, check_type):
+        if isinstance(value, dict):
+            return decode(value, path_to_item, configuration, check_type)
+        return convert_other(value, path_to_item, configuration, check_type)
+    return convert
+
+
+def _get_records_list_converter(item_converter, convert_other):
+    def convert(value, path_to_item, configuration, check_type):
+        if not isinstance(value, list):
+            return convert_other(value, path_to_item, configuration, check_type)
+        return [
+            item_converter(item, path_to_item + [index], configuration, check_type)
+            for index, item in enumerate(value)
+        ]
+    return convert
+
+
+def compile_compact_converter(required_types_mixed, trusted):
+    """Compiles converter creating compact records for the given openapi type
+    specification if it is one of compact model classes (or list of them),
+    other values are converted as by the validating path (or by the fast path
+    of trusted server).
+
+    Args:
+        required_types_mixed (tuple): openapi type specification,
+            e.g. ([StarBasicInfo],) or (Star,)
+        trusted (bool): whether values are converted without validation
+
+    Returns:
+        converter function (value, path_to_item, configuration, check_type) -> value
+        or None if the value can be used as it is
+    """
+    if trusted:
+        convert_other = _get_trusted_converter(required_types_mixed)
+    else:
+        convert_other = _get_validating_converter(required_types_mixed)
+
+    classes = [required_type for required_type in required_types_mixed if required_type is not none_type]
+    if len(classes) == 1:
+        required_type = classes[0]
+        if required_type in get_compact_model_classes():
+            return _get_record_converter(required_type, trusted, convert_other or (lambda value, *args: value))
+        if isinstance(required_type, list) and len(required_type) == 1 and \
+                required_type[0] in get_compact_model_classes():
+            item_converter = compile_compact_converter(tuple(required_type), trusted)
+            return _get_records_list_converter(item_converter, convert_other or (lambda value, *args: value))
+    return convert_other
+
+
+def deserialize_compact_data(received_data, response_type, path_to_item, configuration, check_type):
+    """Deserializes decoded JSON data, objects of compact model classes into
+    compact records.
+
+    Args:
+        received_data (any): decoded JSON data
+        response_type (tuple): response type specification as used by ApiClient.deserialize
+        path_to_item (list): the path to the data, e.g. ['received_data']
+        configuration (Configuration): the configuration of the client
+        check_type (bool): whether to check types of values
+
+    Returns:
+        deserialized data
+    """
+    trusted = bool(configuration is not None and configuration.trusted_server)
+    converter = compile_compact_converter(response_type, trusted)
+    if converter is None:
+        return received_data
+    return converter(received_data, path_to_item, configuration, check_type)
@@ -10,12 +10,11 @@
 
 import copy
 import logging
-import multiprocessing
+import os
 import sys
-import urllib3
 
-from http import client as http_client
 from openapi_client.exceptions import ApiValueError
+from openapi_client.model_interning import INTERN_MODES
 
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
@@ -24,6 +23,8 @@ JSON_SCHEMA_VALIDATION_KEYWORDS = {
     'minLength', 'pattern', 'maxItems', 'minItems'
 }
 
+MODEL_REPRESENTATIONS = ('model', 'lazy', 'compact')
+
 class Configuration(object):
     """NOTE: This class is auto generated by OpenAPI Generator
 
@@ -168,7 +169,7 @@ class Configuration(object):
         """Set this to True/False to enable/disable SSL hostname verification.
         """
 
-        self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
+        self.connection_pool_maxsize = (os.cpu_count() or 1) * 5
         """urllib3 connection pool's maximum number of connections saved
            per pool. urllib3 uses 1 connection as default value, but this is
            not the best value when you are making a lot of possibly parallel
@@ -190,10 +191,65 @@ class Configuration(object):
         """
         self.retries = None
         """Adding retries to override urllib3 default value 3
+           Number of retries, urllib3 Retry or RetryPolicy (exponential
+           backoff with jitter, Retry-After, idempotency aware method rules
+           and retry budget), see retry.py.
         """
         # Enable client side validation
         self.client_side_validation = True
 
+        self.trusted_server = False
+        """Trusted server switch
+           Set this to True to deserialize responses using precompiled
+           per-model decoders which map JSON keys straight to model attributes
+           and skip type validation of received data. Use only for servers
+           that are known to conform to the OpenAPI document.
+        """
+        self.intern_models = None
+        """Interning of shared models (Star, DataSource, AttributeDefinition)
+           None - every embedded model is deserialized into its own instance
+           'response' - one instance per (model class, id) within a response
+           'session' - one instance per (model class, id) shared by all
+                       responses deserialized by the same ApiClient
+           Interning requires model_representation 'model', combining it
+           with 'lazy' or 'compact' representation raises ApiValueError.
+        """
+
+        self.model_representation = 'model'
+        """Representation of deserialized models
+           'model' - values of all attributes are converted (and validated)
+                     when the response is deserialized
+           'lazy' - models are views over the decoded JSON, each attribute
+                    is converted (and validated) when it is accessed for the
+                    first time, see lazy_model.py
+           'compact' - items of high-volume models (StarBasicInfo,
+                       measurements, magnitudes, motions, radial velocities)
+                       are immutable records with __slots__ convertible to
+                       models on demand, see compact_model.py
+        """
+
+        self.coalesce_requests = False
+        """Single-flight switch
+           Set this to True to let concurrent identical GET calls of an endpoint
+           share one in-flight request and its deserialized result (the same
+           objects are returned to all such callers).
+        """
+        self.accept_encoding = ['gzip', 'deflate', 'br', 'zstd']
+        """Compression of responses
+           Content encodings offered to the server in the order of preference.
+           Only encodings that can be decoded are offered (br requires brotli,
+           zstd requires zstandard package), compressed responses are decoded
+           transparently. Set to None to request uncompressed responses.
+        """
+        self.metrics_collector = None
+        """Instrumentation of calls
+           Object with record(metrics) method (e.g. PrometheusCollector,
+           RecordingCollector) which receives RequestMetrics of every call of
+           an endpoint (times of network, decode and model phases, status,
+           received bytes, retries, connection pool usage), see
+           instrumentation.py. Calls are not measured if None.
+        """
+
         # Options to pass down to the underlying urllib3 socket
         self.socket_options = None
 
@@ -202,10 +258,13 @@ class Configuration(object):
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler', 'metrics_collector', 'retries'):
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
+        # copies report to the same collector and draw from the same retry budget
+        result.metrics_collector = self.metrics_collector
+        result.retries = self.retries
         # use setters to configure loggers
         result.logger_file = self.logger_file
         result.debug = self.debug
@@ -220,6 +279,16 @@ class Configuration(object):
                     raise ApiValueError(
                         "Invalid keyword: '{0}''".format(v))
             self._disabled_client_side_validations = s
+        if name == 'intern_models' and value not in INTERN_MODES:
+            raise ApiValueError(
+                "Invalid intern_models: '{0}'".format(value))
+        if name == 'model_representation' and value not in MODEL_REPRESENTATIONS:
+            raise ApiValueError(
+                "Invalid model_representation: '{0}'".format(value))
+        if name in ('intern_models', 'model_representation') and \
+                getattr(self, 'intern_models', None) and getattr(self, 'model_representation', 'model') != 'model':
+            raise ApiValueError(
+                "intern_models requires model_representation 'model', not '{0}'".format(self.model_representation))
 
     @classmethod
     def set_default(cls, default):
@@ -299,14 +368,17 @@ class Configuration(object):
             for _, logger in self.logger.items():
                 logger.setLevel(logging.DEBUG)
             # turn on http_client debug
+            from http import client as http_client
             http_client.HTTPConnection.debuglevel = 1
         else:
             # if debug status is False, turn off debug logging,
             # setting log level to default `logging.WARNING`
             for _, logger in self.logger.items():
                 logger.setLevel(logging.WARNING)
-            # turn off http_client debug
-            http_client.HTTPConnection.debuglevel = 0
+            # turn off http_client debug (if not imported yet, its debug level is the default 0)
+            http_client = sys.modules.get('http.client')
+            if http_client is not None:
+                http_client.HTTPConnection.debuglevel = 0
 
     @property
     def logger_format(self):
@@ -359,6 +431,7 @@ class Configuration(object):
         password = ""
         if self.password is not None:
             password = self.password
+        import urllib3
         return urllib3.util.make_headers(
             basic_auth=username + ':' + password
         ).get('authorization')
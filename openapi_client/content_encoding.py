@@ -0,0 +1,101 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Negotiation and decoding of compressed responses (Content-Encoding).
+
+    gzip and deflate are always available, br and zstd only if the optional
+    brotli (or brotlicffi) and zstandard packages are installed.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import zlib
+
+import urllib3.util.request
+
+from openapi_client.exceptions import ApiValueError
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _decode_gzip(data):
+    # 32 + MAX_WBITS accepts both gzip and zlib headers, concatenated members are decoded too
+    result = []
+    while data:
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        result.append(decompressor.decompress(data))
+        data = decompressor.unused_data
+    return b''.join(result)
+
+
+def _decode_deflate(data):
+    # servers send both zlib wrapped and raw deflate streams as 'deflate'
+    try:
+        return zlib.decompress(data)
+    except zlib.error:
+        return zlib.decompress(data, -zlib.MAX_WBITS)
+
+
+def _decode_zstd(data):
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+_DECODERS = {
+    'gzip': _decode_gzip,
+    'x-gzip': _decode_gzip,
+    'deflate': _decode_deflate,
+}
+if brotli is not None:
+    _DECODERS['br'] = brotli.decompress
+if zstandard is not None:
+    _DECODERS['zstd'] = _decode_zstd
+
+# encodings decoded by urllib3 (blocking transport) as well as by decode_content
+SUPPORTED_ENCODINGS = tuple(
+    encoding for encoding in urllib3.util.request.ACCEPT_ENCODING.split(',')
+    if encoding in _DECODERS
+)
+
+
+def get_accept_encoding(preferred_encodings):
+    """Returns value of Accept-Encoding request header.
+
+    :param preferred_encodings: list of encodings in the order of preference,
+        unsupported encodings are left out.
+    :return: header value or None if no encoding should be offered.
+    """
+    if not preferred_encodings:
+        return None
+    encodings = [encoding for encoding in preferred_encodings if encoding in SUPPORTED_ENCODINGS]
+    return ', '.join(encodings) or None
+
+
+def decode_content(data, content_encoding):
+    """Decodes response body compressed by the given Content-Encoding.
+
+    :param data: received body (bytes)
+    :param content_encoding: value of Content-Encoding response header,
+        encodings applied in order of listing (e.g. 'gzip' or 'deflate, gzip')
+    :return: decoded body
+    """
+    encodings = [encoding.strip().lower() for encoding in (content_encoding or '').split(',')]
+    for encoding in reversed(encodings):
+        if not encoding or encoding == 'identity':
+            continue
+        decoder = _DECODERS.get(encoding)
+        if decoder is None:
+            raise ApiValueError("Unsupported Content-Encoding: %s" % encoding)
+        data = decoder(data)
+    return data
@@ -0,0 +1,213 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Fast-path deserialization of responses received from a trusted server.
+
+    Instead of running validate_and_convert_types for every field of every model,
+    a decoder is compiled once per model class from its openapi_types and
+    attribute_map. The decoder maps JSON keys straight to model attributes and
+    performs only the conversions JSON cannot express (e.g. int -> float).
+    Resulting objects are instances of the same model classes that the validating
+    path produces.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import threading
+
+from openapi_client.model_interning import get_active_pool, get_interned_model_classes
+from openapi_client.model_utils import (
+    ModelNormal,
+    OpenApiModel,
+    date,
+    datetime,
+    deserialize_model,
+    deserialize_primitive,
+    none_type,
+    validate_and_convert_types
+)
+
+
+_model_decoders = {}
+_model_decoders_lock = threading.Lock()
+
+
+def _convert_float(value, path_to_item, configuration, check_type):
+    # JSON does not distinguish 7 from 7.0
+    if type(value) is int:
+        return float(value)
+    return value
+
+
+def _get_date_converter(klass):
+    def convert(value, path_to_item, configuration, check_type):
+        if isinstance(value, str):
+            return deserialize_primitive(value, klass, path_to_item)
+        return value
+    return convert
+
+
+def _get_generic_converter(required_types_mixed):
+    def convert(value, path_to_item, configuration, check_type):
+        return validate_and_convert_types(value, required_types_mixed, path_to_item, True, check_type,
+                                          configuration=configuration)
+    return convert
+
+
+def _get_list_converter(item_converter):
+    def convert(value, path_to_item, configuration, check_type):
+        if not isinstance(value, list) or item_converter is None:
+            return value
+        return [
+            item_converter(item, path_to_item + [index], configuration, check_type) if item is not None else None
+            for index, item in enumerate(value)
+        ]
+    return convert
+
+
+def _get_model_converter(model_class):
+    def convert(value, path_to_item, configuration, check_type):
+        return get_model_decoder(model_class)(value, path_to_item, configuration, check_type)
+    return convert
+
+
+def compile_type_converter(required_types_mixed):
+    """Compiles converter for the given openapi type specification.
+
+    Args:
+        required_types_mixed (tuple): openapi type specification,
+            e.g. (float, none_type), ([Star],) or (Star,)
+
+    Returns:
+        converter function (value, path_to_item, configuration, check_type) -> value
+        or None if the value can be used as it is
+    """
+    classes = [required_type for required_type in required_types_mixed if required_type is not none_type]
+    if len(classes) != 1:
+        return _get_generic_converter(required_types_mixed)
+
+    required_type = classes[0]
+    if isinstance(required_type, list):
+        return _get_list_converter(compile_type_converter(tuple(required_type)))
+    if required_type is float:
+        return _convert_float
+    if required_type in (int, str, bool):
+        return None
+    if required_type in (date, datetime):
+        return _get_date_converter(required_type)
+    if isinstance(required_type, type) and issubclass(required_type, OpenApiModel):
+        return _get_model_converter(required_type)
+    return _get_generic_converter(required_types_mixed)
+
+
+def _is_fast_path_model(model_class):
+    return (
+        issubclass(model_class, ModelNormal) and
+        model_class.discriminator is None and
+        not model_class._composed_schemas
+    )
+
+
+def _compile_model_decoder(model_class):
+    """Compiles decoder mapping JSON objects to instances of model_class."""
+    if not _is_fast_path_model(model_class):
+        def decode_with_validation(model_data, path_to_item, configuration, check_type):
+            return deserialize_model(model_data, model_class, path_to_item, check_type, configuration, True)
+        return decode_with_validation
+
+    fields = {}
+    for python_name, json_name in model_class.attribute_map.items():
+        fields[json_name] = (python_name, compile_type_converter(model_class.openapi_types[python_name]))
+    additional_properties_type = model_class.additional_properties_type
+    visited_composed_classes = (model_class,)
+    new_instance = object.__new__
+
+    def decode(model_data, path_to_item, configuration, check_type):
+        if not isinstance(model_data, dict):
+            return deserialize_model(model_data, model_class, path_to_item, check_type, configuration, True)
+
+        data_store = {}
+        for json_name, value in model_data.items():
+            field = fields.get(json_name)
+            if field is None:
+                if additional_properties_type is None:
+                    if configuration is not None and configuration.discard_unknown_keys:
+                        continue
+                    # let the validating path raise the usual error
+                    return deserialize_model(model_data, model_class, path_to_item, check_type, configuration, True)
+                data_store[json_name] = validate_and_convert_types(
+                    value, additional_properties_type, path_to_item + [json_name], True, check_type,
+                    configuration=configuration)
+                continue
+
+            python_name, converter = field
+            if converter is not None and value is not None:
+                value = converter(value, path_to_item + [python_name], configuration, check_type)
+            data_store[python_name] = value
+
+        instance = new_instance(model_class)
+        instance.__dict__.update(
+            _data_store=data_store,
+            _check_type=check_type,
+            _spec_property_naming=True,
+            _path_to_item=path_to_item,
+            _configuration=configuration,
+            _visited_composed_classes=visited_composed_classes
+        )
+        return instance
+
+    if model_class not in get_interned_model_classes():
+        return decode
+
+    def decode_interned(model_data, path_to_item, configuration, check_type):
+        pool = get_active_pool()
+        intern_key = pool.get_key(model_class, model_data) if pool is not None else None
+        if intern_key is None:
+            return decode(model_data, path_to_item, configuration, check_type)
+        instance = pool.get(intern_key)
+        if instance is None:
+            instance = pool.add(intern_key, decode(model_data, path_to_item, configuration, check_type))
+        return instance
+
+    return decode_interned
+
+
+def get_model_decoder(model_class):
+    """Returns decoder of the given model class, compiling it on first use.
+
+    Args:
+        model_class (OpenApiModel): the model class
+
+    Returns:
+        decoder function (model_data, path_to_item, configuration, check_type) -> model instance
+    """
+    decoder = _model_decoders.get(model_class)
+    if decoder is None:
+        with _model_decoders_lock:
+            decoder = _model_decoders.get(model_class)
+            if decoder is None:
+                decoder = _compile_model_decoder(model_class)
+                _model_decoders[model_class] = decoder
+    return decoder
+
+
+def deserialize_trusted_data(received_data, response_type, path_to_item, configuration, check_type):
+    """Deserializes decoded JSON data received from a trusted server.
+
+    Args:
+        received_data (any): decoded JSON data
+        response_type (tuple): response type specification as used by ApiClient.deserialize
+        path_to_item (list): the path to the data, e.g. ['received_data']
+        configuration (Configuration): the configuration of the client
+        check_type (bool): stored in created models, used when they are modified later
+
+    Returns:
+        deserialized data
+    """
+    if received_data is None:
+        return None
+    converter = compile_type_converter(response_type)
+    if converter is None:
+        return received_data
+    return converter(received_data, path_to_item, configuration, check_type)
@@ -0,0 +1,415 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    HTTP cache of GET responses layered over RESTClientObject.
+
+    Responses are stored keyed by URL (including query parameters) in a
+    pluggable backend (MemoryCacheBackend, DirectoryCacheBackend). Fresh
+    responses (Cache-Control max-age, Expires or default_max_age) are served
+    without any request, stale responses are revalidated by conditional
+    requests (If-None-Match / If-Modified-Since) and served from the cache
+    when the server answers 304 Not Modified.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import collections
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlencode
+
+from openapi_client.exceptions import ApiException
+from openapi_client.instrumentation import get_current_metrics
+
+
+logger = logging.getLogger(__name__)
+
+# headers describing the transfer of the original response, not the stored (decoded) body
+_UNSTORED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive')
+
+
+def _record_cache_result(result):
+    metrics = get_current_metrics()
+    if metrics is not None:
+        metrics.cache = result
+
+
+class CacheEntry(object):
+    """Stored response."""
+
+    def __init__(self, status, reason, headers, data, stored_at, fresh_until):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+        self.stored_at = stored_at
+        self.fresh_until = fresh_until
+
+    @property
+    def size(self):
+        return len(self.data) + sum(len(name) + len(value) for name, value in self.headers.items())
+
+    def is_fresh(self, now=None):
+        return (now or time.time()) < self.fresh_until
+
+    def to_dict(self):
+        """Returns metadata of the entry (everything except data)."""
+        return {
+            'status': self.status,
+            'reason': self.reason,
+            'headers': self.headers,
+            'stored_at': self.stored_at,
+            'fresh_until': self.fresh_until,
+        }
+
+
+class CachedResponse(object):
+    """Response served from the cache.
+
+    Provides the interface of RESTResponse as well as of urllib3.HTTPResponse
+    returned for `_preload_content=False` (data, stream, release_conn).
+    """
+
+    def __init__(self, entry):
+        self.status = entry.status
+        self.reason = entry.reason
+        self.headers = entry.headers
+        self.data = entry.data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name.lower(), default)
+
+    def stream(self, amt=65536, decode_content=None):
+        for start in range(0, len(self.data), amt):
+            yield self.data[start:start + amt]
+
+    def release_conn(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class MemoryCacheBackend(object):
+    """In-memory LRU storage limited by the total size of stored responses.
+
+    :param max_bytes: maximum total size of stored responses (bodies and
+        headers), least recently used responses are evicted first.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._remove(key)
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+
+class DirectoryCacheBackend(object):
+    """Storage of responses in files of a directory (one file per response),
+    usable by multiple processes and persisting between runs.
+
+    Files are limited by their total size, modification time of a file is
+    updated when it is read, thus least recently used responses are evicted
+    first. Size of files written by other processes is taken into account
+    when the directory is scanned for eviction.
+
+    :param path: cache directory, created if it does not exist.
+    :param max_bytes: maximum total size of the files, unlimited if None.
+    """
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self.size = sum(size for _, size, _ in self._scan())
+
+    def _get_file_path(self, key):
+        return os.path.join(self.path, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.cache')
+
+    @staticmethod
+    def _get_file_size(file_path):
+        try:
+            return os.path.getsize(file_path)
+        except OSError:
+            return 0
+
+    def _scan(self):
+        """Returns (path, size, modification time) of all stored files."""
+        files = []
+        for file_name in os.listdir(self.path):
+            if file_name.endswith('.cache'):
+                file_path = os.path.join(self.path, file_name)
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                files.append((file_path, stat.st_size, stat.st_mtime))
+        return files
+
+    def get(self, key):
+        file_path = self._get_file_path(key)
+        try:
+            with open(file_path, 'rb') as cache_file:
+                metadata = json.loads(cache_file.readline())
+                data = cache_file.read()
+            os.utime(file_path)
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(data=data, **metadata)
+
+    def set(self, key, entry):
+        file_path = self._get_file_path(key)
+        metadata = json.dumps(entry.to_dict()).encode('utf-8') + b'\n'
+        file_size = len(metadata) + len(entry.data)
+        if self.max_bytes is not None and file_size > self.max_bytes:
+            self.delete(key)
+            return
+        temporary_path = '%s.%d.%d.tmp' % (file_path, os.getpid(), threading.get_ident())
+        with open(temporary_path, 'wb') as cache_file:
+            cache_file.write(metadata)
+            cache_file.write(entry.data)
+        with self._lock:
+            replaced_size = self._get_file_size(file_path)
+            os.replace(temporary_path, file_path)
+            self.size += file_size - replaced_size
+            if self.max_bytes is not None and self.size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        files = self._scan()
+        size = sum(file_size for _, file_size, _ in files)
+        for file_path, file_size, _ in sorted(files, key=lambda file: file[2]):
+            if size <= self.max_bytes:
+                break
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            size -= file_size
+        self.size = size
+
+    def delete(self, key):
+        file_path = self._get_file_path(key)
+        with self._lock:
+            file_size = self._get_file_size(file_path)
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                return
+            self.size -= file_size
+
+    def clear(self):
+        with self._lock:
+            for file_path, _, _ in self._scan():
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+            self.size = 0
+
+
+def _parse_cache_control(value):
+    directives = {}
+    for directive in (value or '').split(','):
+        name, _, argument = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"')
+    return directives
+
+
+def get_freshness_lifetime(headers, default_max_age=0):
+    """Returns number of seconds the response is fresh for or None if it
+    must not be stored.
+
+    :param headers: response headers (lower-case names)
+    :param default_max_age: lifetime of responses without explicit freshness
+        information (Cache-Control max-age, Expires)
+    """
+    cache_control = _parse_cache_control(headers.get('cache-control'))
+    if 'no-store' in cache_control:
+        return None
+    if 'no-cache' in cache_control:
+        return 0
+    if 'max-age' in cache_control:
+        try:
+            return max(0, int(cache_control['max-age']))
+        except ValueError:
+            return 0
+    if 'expires' in headers:
+        try:
+            expires = email.utils.parsedate_to_datetime(headers['expires']).timestamp()
+        except (TypeError, ValueError):
+            return 0
+        return max(0, expires - time.time())
+    return default_max_age
+
+
+class CachingRESTClientObject(object):
+    """RESTClientObject wrapper caching GET responses.
+
+    Other requests (and GET requests with a body) are passed to the wrapped
+    client as they are.
+
+    :param rest_client: wrapped RESTClientObject
+    :param backend: storage of responses (MemoryCacheBackend,
+        DirectoryCacheBackend or object with the same get/set/delete/clear methods)
+    :param default_max_age: number of seconds responses without explicit
+        freshness information are served without revalidation, 0 means
+        such responses are always revalidated.
+    """
+
+    def __init__(self, rest_client, backend=None, default_max_age=0):
+        self.rest_client = rest_client
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.default_max_age = default_max_age
+        # counters are updated by multiple threads
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    def __getattr__(self, name):
+        return getattr(self.rest_client, name)
+
+    @staticmethod
+    def get_key(url, query_params=None):
+        if query_params:
+            url += ('&' if '?' in url else '?') + urlencode(query_params)
+        return 'GET ' + url
+
+    def invalidate(self, url, query_params=None):
+        """Removes stored response of the given URL."""
+        self.backend.delete(self.get_key(url, query_params))
+
+    def clear(self):
+        """Removes all stored responses."""
+        self.backend.clear()
+
+    def request(self, method, url, query_params=None, headers=None,
+                body=None, post_params=None, _preload_content=True,
+                _request_timeout=None):
+        """Perform requests, see RESTClientObject.request.
+
+        Responses of GET requests are returned as CachedResponse objects
+        regardless of `_preload_content`, whole body is always read.
+        """
+        if method.upper() != 'GET' or body is not None or post_params:
+            return self.rest_client.request(
+                method, url, query_params=query_params, headers=headers, body=body,
+                post_params=post_params, _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+
+        key = self.get_key(url, query_params)
+        entry = self.backend.get(key)
+        now = time.time()
+        if entry is not None and entry.is_fresh(now):
+            with self._lock:
+                self.hits += 1
+            _record_cache_result('hit')
+            return CachedResponse(entry)
+
+        headers = dict(headers or {})
+        if entry is not None:
+            if 'etag' in entry.headers:
+                headers['If-None-Match'] = entry.headers['etag']
+            if 'last-modified' in entry.headers:
+                headers['If-Modified-Since'] = entry.headers['last-modified']
+
+        try:
+            r = self.rest_client.request(
+                'GET', url, query_params=query_params, headers=headers,
+                _preload_content=True, _request_timeout=_request_timeout)
+        except ApiException as e:
+            if e.status != 304 or entry is None:
+                raise
+            # not modified, refresh metadata of the stored response
+            with self._lock:
+                self.revalidations += 1
+            _record_cache_result('revalidated')
+            stored_headers = dict(entry.headers)
+            stored_headers.update(self._get_stored_headers(e.headers))
+            entry = CacheEntry(entry.status, entry.reason, stored_headers, entry.data, now, now)
+            self._store(key, entry, now)
+            return CachedResponse(entry)
+
+        with self._lock:
+            self.misses += 1
+        _record_cache_result('miss')
+        entry = CacheEntry(r.status, r.reason, self._get_stored_headers(r.getheaders()), r.data, now, now)
+        self._store(key, entry, now)
+        return CachedResponse(entry)
+
+    def _store(self, key, entry, now):
+        lifetime = get_freshness_lifetime(entry.headers, self.default_max_age)
+        if lifetime is None or (lifetime == 0 and 'etag' not in entry.headers and
+                                'last-modified' not in entry.headers):
+            # response can not be reused
+            self.backend.delete(key)
+            return
+        entry.stored_at = now
+        entry.fresh_until = now + lifetime
+        try:
+            self.backend.set(key, entry)
+        except OSError as e:
+            logger.warning("Response could not be stored in HTTP cache: %s", e)
+
+    @staticmethod
+    def _get_stored_headers(headers):
+        return {
+            name.lower(): value for name, value in (headers or {}).items()
+            if name.lower() not in _UNSTORED_HEADERS
+        }
+
+    def GET(self, url, headers=None, query_params=None, _preload_content=True,
+            _request_timeout=None):
+        return self.request("GET", url,
+                            headers=headers,
+                            _preload_content=_preload_content,
+                            _request_timeout=_request_timeout,
+                            query_params=query_params)
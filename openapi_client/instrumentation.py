@@ -0,0 +1,298 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Instrumentation of requests (Configuration.metrics_collector).
+
+    When a metrics collector is configured, every call of an endpoint made by
+    ApiClient is measured and RequestMetrics of the call are passed to
+    collector.record(metrics) when the call ends (successfully or by an
+    exception). Time of the call is split into phases:
+        network - sending the request and receiving the response, split by
+                  RESTClientObject into time to response headers (connection,
+                  DNS lookup and server time) and transfer of the body
+        decode - decoding of the body (charset, JSON)
+        model - building of returned objects from the decoded data
+    Without metrics collector (default) calls are not measured at all.
+
+    Collectors are called by multiple threads concurrently. Any object with
+    record(metrics) method can be used as a collector, PrometheusCollector
+    aggregates metrics into counters and histograms exported in Prometheus
+    text format.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import abc
+import bisect
+import collections
+import contextlib
+import contextvars
+import threading
+import time
+
+from openapi_client.exceptions import ApiException
+
+
+# Metrics of the call being made by the current thread (or task), filled by the REST layer
+_current_metrics = contextvars.ContextVar('openapi_client_request_metrics', default=None)
+
+
+class RequestMetrics(object):
+    """Measurements of a single call of an endpoint.
+
+    Times are in seconds, values which were not measured are None (e.g. body
+    of responses returned without preloading content is not decoded by the
+    client, responses served from HTTP cache are not transferred).
+
+    :param method: HTTP method (e.g. 'GET')
+    :param endpoint: path of the endpoint with unsubstituted parameters
+        (e.g. '/stars/{id}'), unlike URLs suitable as metric label
+    """
+
+    __slots__ = ('method', 'endpoint', 'host', 'status', 'error', 'total_time', 'network_time',
+                 'time_to_headers', 'transfer_time', 'decode_time', 'model_time', 'bytes_received',
+                 'retries', 'cache', 'pool_connections_in_use', 'pool_maxsize', 'streamed')
+
+    def __init__(self, method, endpoint):
+        self.method = method
+        self.endpoint = endpoint
+        self.host = None
+        # HTTP status of the response, None if no response was received
+        self.status = None
+        # class name of the exception the call ended with
+        self.error = None
+        self.total_time = None
+        self.network_time = None
+        self.time_to_headers = None
+        self.transfer_time = None
+        self.decode_time = None
+        self.model_time = None
+        # number of bytes of the body received from the network (before content decoding)
+        self.bytes_received = None
+        self.retries = 0
+        # 'hit', 'revalidated' or 'miss' if the response passed through HTTP cache
+        self.cache = None
+        # connections of the host's connection pool in use when the response was received
+        self.pool_connections_in_use = None
+        self.pool_maxsize = None
+        # whether the body was left to the caller to read (_preload_content=False)
+        self.streamed = False
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return 'RequestMetrics({0})'.format(', '.join(
+            '{0}={1!r}'.format(name, getattr(self, name)) for name in self.__slots__))
+
+
+def get_current_metrics():
+    """Returns metrics of the call being made by the current thread (or task)
+    or None if the call is not measured."""
+    return _current_metrics.get()
+
+
+@contextlib.contextmanager
+def measuring(metrics, collector):
+    """Makes the metrics current while the block is executed, measures total
+    time of the block and passes the metrics to the collector when the block
+    ends (exception raised by the block is recorded and propagated).
+    """
+    token = _current_metrics.set(metrics)
+    started = time.perf_counter()
+    try:
+        yield metrics
+    except BaseException as e:
+        metrics.error = type(e).__name__
+        if isinstance(e, ApiException) and e.status:
+            metrics.status = e.status
+        raise
+    finally:
+        metrics.total_time = time.perf_counter() - started
+        _current_metrics.reset(token)
+        collector.record(metrics)
+
+
+class MetricsCollector(abc.ABC):
+    """Base class of metrics collectors.
+
+    Subclasses must implement record (otherwise they cannot be instantiated).
+    """
+
+    @abc.abstractmethod
+    def record(self, metrics):
+        """Called when a measured call ends.
+
+        :param metrics: RequestMetrics of the call
+        """
+
+
+class RecordingCollector(MetricsCollector):
+    """Collector keeping metrics of the latest calls (e.g. for debugging).
+
+    :param maxlen: maximum number of kept metrics, all are kept if None
+    """
+
+    def __init__(self, maxlen=None):
+        self.records = collections.deque(maxlen=maxlen)
+
+    def record(self, metrics):
+        self.records.append(metrics)
+
+    def clear(self):
+        self.records.clear()
+
+
+# Default histogram buckets (seconds), the same as of Prometheus client libraries
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# Phases of a call measured by histogram of PrometheusCollector: (phase label, RequestMetrics attribute)
+_PHASES = (
+    ('total', 'total_time'),
+    ('network', 'network_time'),
+    ('headers', 'time_to_headers'),
+    ('transfer', 'transfer_time'),
+    ('decode', 'decode_time'),
+    ('model', 'model_time'),
+)
+
+
+class _Histogram(object):
+    __slots__ = ('bucket_counts', 'count', 'sum')
+
+    def __init__(self, buckets_count):
+        # the last bucket counts observations greater than all bounds (+Inf)
+        self.bucket_counts = [0] * (buckets_count + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+def _format_labels(labels):
+    return '{' + ','.join(
+        '{0}="{1}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class PrometheusCollector(MetricsCollector):
+    """Collector aggregating metrics into Prometheus-style counters, gauges
+    and histograms, exported in Prometheus text format by expose().
+
+    Exported metrics (prefixed by the namespace):
+        requests_total{method,endpoint,status} - counter of calls, status is
+            'error' for calls which ended without response
+        request_duration_seconds{method,endpoint,phase} - histogram of
+            duration of the call phases (total, network, headers, transfer,
+            decode, model)
+        response_bytes_total{method,endpoint} - counter of received bytes
+        request_retries_total{method,endpoint} - counter of retries
+        http_cache_total{method,endpoint,result} - counter of responses
+            passed through HTTP cache by result (hit, revalidated, miss)
+        connection_pool_in_use{host} - connections in use at the latest response
+        connection_pool_maxsize{host} - size of the connection pool
+
+    :param namespace: prefix of names of the metrics
+    :param buckets: upper bounds of histogram buckets (seconds)
+    """
+
+    def __init__(self, namespace='cpstars', buckets=DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests = collections.Counter()
+        self._durations = {}
+        self._bytes = collections.Counter()
+        self._retries = collections.Counter()
+        self._cache_results = collections.Counter()
+        self._pool_in_use = {}
+        self._pool_maxsize = {}
+
+    def record(self, metrics):
+        endpoint = (metrics.method, metrics.endpoint)
+        status = str(metrics.status) if metrics.status is not None else 'error'
+        observations = [(phase, getattr(metrics, attribute)) for phase, attribute in _PHASES]
+        with self._lock:
+            self._requests[endpoint + (status,)] += 1
+            for phase, value in observations:
+                if value is None:
+                    continue
+                histogram = self._durations.get(endpoint + (phase,))
+                if histogram is None:
+                    histogram = self._durations[endpoint + (phase,)] = _Histogram(len(self.buckets))
+                histogram.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+                histogram.count += 1
+                histogram.sum += value
+            if metrics.bytes_received is not None:
+                self._bytes[endpoint] += metrics.bytes_received
+            if metrics.retries:
+                self._retries[endpoint] += metrics.retries
+            if metrics.cache is not None:
+                self._cache_results[endpoint + (metrics.cache,)] += 1
+            if metrics.pool_connections_in_use is not None:
+                self._pool_in_use[metrics.host] = metrics.pool_connections_in_use
+                self._pool_maxsize[metrics.host] = metrics.pool_maxsize
+
+    def clear(self):
+        """Resets all metrics."""
+        with self._lock:
+            self._requests.clear()
+            self._durations.clear()
+            self._bytes.clear()
+            self._retries.clear()
+            self._cache_results.clear()
+            self._pool_in_use.clear()
+            self._pool_maxsize.clear()
+
+    def expose(self):
+        """Returns the metrics in Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+
+        def add_family(name, metric_type, help_text, samples):
+            name = self.namespace + '_' + name
+            lines.append('# HELP {0} {1}'.format(name, help_text))
+            lines.append('# TYPE {0} {1}'.format(name, metric_type))
+            for suffix, labels, value in samples:
+                lines.append('{0}{1}{2} {3}'.format(name, suffix, _format_labels(labels), _format_value(value)))
+
+        with self._lock:
+            add_family('requests_total', 'counter', 'Calls of endpoints.', [
+                ('', (('method', method), ('endpoint', endpoint), ('status', status)), count)
+                for (method, endpoint, status), count in sorted(self._requests.items())
+            ])
+
+            duration_samples = []
+            for (method, endpoint, phase), histogram in sorted(self._durations.items()):
+                labels = (('method', method), ('endpoint', endpoint), ('phase', phase))
+                cumulative_count = 0
+                for bound, count in zip(self.buckets + (float('inf'),), histogram.bucket_counts):
+                    cumulative_count += count
+                    bound_label = '+Inf' if bound == float('inf') else _format_value(float(bound))
+                    duration_samples.append(('_bucket', labels + (('le', bound_label),), cumulative_count))
+                duration_samples.append(('_sum', labels, histogram.sum))
+                duration_samples.append(('_count', labels, histogram.count))
+            add_family('request_duration_seconds', 'histogram', 'Duration of phases of calls of endpoints.',
+                       duration_samples)
+
+            add_family('response_bytes_total', 'counter', 'Bytes of response bodies received from the network.', [
+                ('', (('method', method), ('endpoint', endpoint)), count)
+                for (method, endpoint), count in sorted(self._bytes.items())
+            ])
+            add_family('request_retries_total', 'counter', 'Retries of requests.', [
+                ('', (('method', method), ('endpoint', endpoint)), count)
+                for (method, endpoint), count in sorted(self._retries.items())
+            ])
+            add_family('http_cache_total', 'counter', 'Responses passed through HTTP cache by result.', [
+                ('', (('method', method), ('endpoint', endpoint), ('result', result)), count)
+                for (method, endpoint, result), count in sorted(self._cache_results.items())
+            ])
+            add_family('connection_pool_in_use', 'gauge', 'Connections of the pool in use at the latest response.', [
+                ('', (('host', host),), count) for host, count in sorted(self._pool_in_use.items())
+            ])
+            add_family('connection_pool_maxsize', 'gauge', 'Maximum number of connections kept by the pool.', [
+                ('', (('host', host),), count) for host, count in sorted(self._pool_maxsize.items())
+            ])
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,103 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Incremental decoding of JSON arrays received in chunks.
+
+    Items of a top-level JSON array are decoded (and yielded) as soon as they
+    are received, so only the not yet decoded part of the body is held in
+    memory instead of the whole response.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import codecs
+import json
+
+from openapi_client.exceptions import ApiValueError
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = ',]' + _WHITESPACE
+
+
+def _skip_whitespace(buffer, position):
+    while position < len(buffer) and buffer[position] in _WHITESPACE:
+        position += 1
+    return position
+
+
+def iter_json_array(chunks, encoding='utf-8'):
+    """Decodes top-level JSON array from chunks of its serialized form.
+
+    Args:
+        chunks (iterable): bytes (or str) chunks of the JSON document
+        encoding (str): encoding of bytes chunks
+
+    Yields:
+        decoded items of the array (lists, dicts, primitives)
+
+    Raises:
+        ApiValueError: the document is not a valid JSON array
+    """
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ''
+    position = 0
+    # 'start' - before '[', 'first_item' / 'item' - before (first) item,
+    # 'separator' - before ',' or ']', 'end' - after ']'
+    state = 'start'
+    chunks = iter(chunks)
+    finished = False
+
+    while not finished:
+        chunk = next(chunks, None)
+        if chunk is None:
+            finished = True
+            chunk = text_decoder.decode(b'', final=True)
+        elif isinstance(chunk, bytes):
+            chunk = text_decoder.decode(chunk)
+        buffer = buffer[position:] + chunk
+        position = 0
+
+        while True:
+            position = _skip_whitespace(buffer, position)
+            if position == len(buffer):
+                break
+
+            if state == 'start':
+                if buffer[position] != '[':
+                    raise ApiValueError("Response is not a JSON array.")
+                position += 1
+                state = 'first_item'
+            elif state in ('first_item', 'item'):
+                if state == 'first_item' and buffer[position] == ']':
+                    position += 1
+                    state = 'end'
+                    continue
+                try:
+                    item, end = _decoder.raw_decode(buffer, position)
+                except ValueError:
+                    if finished:
+                        raise ApiValueError("Invalid JSON array item at offset %d." % position)
+                    # item is not received completely yet
+                    break
+                # item (number) may continue in the next chunk, e.g. '1.5' + 'e3'
+                if not finished and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                    break
+                position = end
+                state = 'separator'
+                yield item
+            elif state == 'separator':
+                if buffer[position] == ',':
+                    state = 'item'
+                elif buffer[position] == ']':
+                    state = 'end'
+                else:
+                    raise ApiValueError("Invalid JSON array separator at offset %d." % position)
+                position += 1
+            else:
+                raise ApiValueError("Unexpected data after the end of JSON array.")
+
+    if state != 'end':
+        raise ApiValueError("JSON array is not complete.")
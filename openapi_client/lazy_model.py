@@ -0,0 +1,248 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Lazy deserialization of responses (Configuration.model_representation = 'lazy').
+
+    Models are created as instances of the usual model classes whose data store
+    is a view over the decoded JSON object. Values of attributes are converted
+    and validated only when they are accessed (attribute access, get(...),
+    [...]) and kept for later accesses, nested models are lazy as well.
+    Attributes that are never read cost nothing, but invalid data are reported
+    only when the attribute is accessed.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import threading
+
+from openapi_client.fast_deserializer import _is_fast_path_model, compile_type_converter
+from openapi_client.model_utils import OpenApiModel, none_type, validate_and_convert_types
+
+
+class _LazyFields(object):
+    """Attribute names and value converters of a model class."""
+
+    def __init__(self, model_class, trusted):
+        self.model_class = model_class
+        self.python_to_json = dict(model_class.attribute_map)
+        self.json_to_python = {json_name: python_name for python_name, json_name in model_class.attribute_map.items()}
+        self.converters = {
+            python_name: compile_lazy_converter(model_class.openapi_types[python_name], trusted)
+            for python_name in model_class.attribute_map
+        }
+        additional_properties_type = model_class.additional_properties_type
+        if additional_properties_type is None:
+            self.additional_converter = None
+        else:
+            self.additional_converter = compile_lazy_converter(additional_properties_type, trusted)
+
+
+_lazy_fields = {}
+_lazy_fields_lock = threading.Lock()
+
+
+def _get_lazy_fields(model_class, trusted):
+    key = (model_class, trusted)
+    fields = _lazy_fields.get(key)
+    if fields is None:
+        with _lazy_fields_lock:
+            fields = _lazy_fields.get(key)
+            if fields is None:
+                fields = _lazy_fields[key] = _LazyFields(model_class, trusted)
+    return fields
+
+
+class LazyDataStore(object):
+    """Data store of a lazy model (used in place of the dict of attribute
+    values). Keys are python attribute names, values are converted on first
+    access. Keys of the JSON object unknown to the model are kept unconverted
+    under their JSON names unless the model allows additional properties.
+    """
+
+    __slots__ = ('_fields', '_received_data', '_values', '_path_to_item', '_configuration', '_check_type')
+
+    def __init__(self, fields, received_data, path_to_item, configuration, check_type):
+        self._fields = fields
+        self._received_data = received_data
+        self._values = {}
+        self._path_to_item = path_to_item
+        self._configuration = configuration
+        self._check_type = check_type
+
+    def __contains__(self, name):
+        return name in self._values or self._fields.python_to_json.get(name, name) in self._received_data
+
+    def __getitem__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        value = self._received_data[self._fields.python_to_json.get(name, name)]
+        converter = self._fields.converters.get(name, self._fields.additional_converter)
+        if converter is not None:
+            value = converter(value, self._path_to_item + [name], self._configuration, self._check_type)
+        self._values[name] = value
+        return value
+
+    def __setitem__(self, name, value):
+        # values set by the model (set_attribute) are already validated
+        self._values[name] = value
+
+    def get(self, name, default=None):
+        if name not in self:
+            return default
+        return self[name]
+
+    def keys(self):
+        json_to_python = self._fields.json_to_python
+        keys = [json_to_python.get(json_name, json_name) for json_name in self._received_data]
+        keys.extend(name for name in self._values if name not in keys)
+        return keys
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def items(self):
+        return [(name, self[name]) for name in self.keys()]
+
+    def values(self):
+        return [self[name] for name in self.keys()]
+
+    @property
+    def received_data(self):
+        """Decoded JSON object the values are converted from."""
+        return self._received_data
+
+    @property
+    def converted_values(self):
+        """Dictionary of already converted (or set) values."""
+        return self._values
+
+    def is_converted(self, name):
+        """Returns True if value of the attribute was already converted."""
+        return name in self._values
+
+
+def new_lazy_model(model_class, received_data, path_to_item, configuration, check_type):
+    """Creates lazy instance of the model class, see module documentation.
+
+    Args:
+        model_class (ModelNormal): the model class
+        received_data (dict): decoded JSON object
+        path_to_item (list): the path to the data, e.g. ['received_data', 0]
+        configuration (Configuration): the configuration of the client
+        check_type (bool): whether to check types of values (on access)
+
+    Returns:
+        model instance
+    """
+    trusted = bool(configuration is not None and configuration.trusted_server)
+    data_store = LazyDataStore(_get_lazy_fields(model_class, trusted), received_data, path_to_item, configuration,
+                               check_type)
+    instance = object.__new__(model_class)
+    instance.__dict__.update(
+        _data_store=data_store,
+        _check_type=check_type,
+        _spec_property_naming=True,
+        _path_to_item=path_to_item,
+        _configuration=configuration,
+        _visited_composed_classes=(model_class,)
+    )
+    return instance
+
+
+def _get_lazy_model_converter(model_class, convert_other):
+    def convert(value, path_to_item, configuration, check_type):
+        if isinstance(value, dict):
+            return new_lazy_model(model_class, value, path_to_item, configuration, check_type)
+        return convert_other(value, path_to_item, configuration, check_type)
+    return convert
+
+
+def _get_lazy_list_converter(item_converter, convert_other):
+    def convert(value, path_to_item, configuration, check_type):
+        if not isinstance(value, list):
+            return convert_other(value, path_to_item, configuration, check_type)
+        return [
+            item_converter(item, path_to_item + [index], configuration, check_type)
+            for index, item in enumerate(value)
+        ]
+    return convert
+
+
+def _get_validating_converter(required_types_mixed):
+    def convert(value, path_to_item, configuration, check_type):
+        return validate_and_convert_types(value, required_types_mixed, path_to_item, True, check_type,
+                                          configuration=configuration)
+    return convert
+
+
+def _get_trusted_converter(required_types_mixed):
+    converter = compile_type_converter(required_types_mixed)
+    if converter is None:
+        return None
+
+    def convert(value, path_to_item, configuration, check_type):
+        if value is None:
+            return None
+        return converter(value, path_to_item, configuration, check_type)
+    return convert
+
+
+def compile_lazy_converter(required_types_mixed, trusted):
+    """Compiles converter creating lazy models for the given openapi type
+    specification, other values are converted as by the validating path
+    (or by the fast path of trusted server).
+
+    Args:
+        required_types_mixed (tuple): openapi type specification,
+            e.g. (float, none_type), ([Star],) or (Star,)
+        trusted (bool): whether values are converted without validation
+
+    Returns:
+        converter function (value, path_to_item, configuration, check_type) -> value
+        or None if the value can be used as it is
+    """
+    if trusted:
+        convert_other = _get_trusted_converter(required_types_mixed) or (lambda value, *args: value)
+    else:
+        convert_other = _get_validating_converter(required_types_mixed)
+
+    classes = [required_type for required_type in required_types_mixed if required_type is not none_type]
+    if len(classes) == 1:
+        required_type = classes[0]
+        if isinstance(required_type, type) and issubclass(required_type, OpenApiModel) and \
+                _is_fast_path_model(required_type):
+            return _get_lazy_model_converter(required_type, convert_other)
+        if isinstance(required_type, list) and len(required_type) == 1:
+            item_converter = compile_lazy_converter(tuple(required_type), trusted)
+            if item_converter is not None:
+                return _get_lazy_list_converter(item_converter, convert_other)
+
+    if trusted:
+        return _get_trusted_converter(required_types_mixed)
+    return convert_other
+
+
+def deserialize_lazy_data(received_data, response_type, path_to_item, configuration, check_type):
+    """Deserializes decoded JSON data into lazy models.
+
+    Args:
+        received_data (any): decoded JSON data
+        response_type (tuple): response type specification as used by ApiClient.deserialize
+        path_to_item (list): the path to the data, e.g. ['received_data']
+        configuration (Configuration): the configuration of the client
+        check_type (bool): whether to check types of values (on access)
+
+    Returns:
+        deserialized data
+    """
+    trusted = bool(configuration is not None and configuration.trusted_server)
+    converter = compile_lazy_converter(response_type, trusted)
+    if converter is None:
+        return received_data
+    return converter(received_data, path_to_item, configuration, check_type)
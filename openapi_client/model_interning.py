@@ -0,0 +1,99 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Interning of shared model instances during deserialization.
+
+    Many models embed the same nested objects, e.g. every Magnitude of a star
+    contains the whole Star and DataSource. While an intern pool is active,
+    deserialization of such models returns one canonical instance per
+    (model class, id) instead of building (and validating) identical copies.
+
+    Interned instances are shared, modifying one of them modifies it
+    everywhere it is referenced.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import contextlib
+import contextvars
+import threading
+import weakref
+
+
+INTERN_MODES = (None, 'response', 'session')
+
+_active_pool = contextvars.ContextVar('openapi_client_intern_pool', default=None)
+_interned_model_classes = None
+
+
+def get_interned_model_classes():
+    """Returns model classes whose instances are interned.
+
+    Only models identified by 'id' which are commonly embedded in other
+    models are interned. Classes are imported on first use as model modules
+    import model_utils themselves.
+    """
+    global _interned_model_classes
+    if _interned_model_classes is None:
+        from openapi_client.model.attribute_definition import AttributeDefinition
+        from openapi_client.model.data_source import DataSource
+        from openapi_client.model.star import Star
+        _interned_model_classes = frozenset([AttributeDefinition, DataSource, Star])
+    return _interned_model_classes
+
+
+class InternPool(object):
+    """Canonical model instances keyed by (model class, id).
+
+    :param weak: if True, instances are held by weak references only, i.e.
+        the pool does not keep alive instances no longer used elsewhere
+        (suitable for pools living as long as the client).
+    """
+
+    def __init__(self, weak=False):
+        self._instances = weakref.WeakValueDictionary() if weak else {}
+        self._lock = threading.Lock()
+        self._model_classes = get_interned_model_classes()
+
+    def __len__(self):
+        return len(self._instances)
+
+    def get_key(self, model_class, model_data):
+        """Returns intern key of the received model data or None if the
+        model is not interned."""
+        if model_class not in self._model_classes or not isinstance(model_data, dict):
+            return None
+        model_id = model_data.get('id')
+        if model_id is None:
+            return None
+        return model_class, model_id
+
+    def get(self, key):
+        return self._instances.get(key)
+
+    def add(self, key, instance):
+        """Adds instance to the pool and returns the canonical instance
+        (instance added concurrently by other thread wins)."""
+        with self._lock:
+            return self._instances.setdefault(key, instance)
+
+    def clear(self):
+        with self._lock:
+            self._instances.clear()
+
+
+def get_active_pool():
+    """Returns intern pool of the current deserialization or None."""
+    return _active_pool.get()
+
+
+@contextlib.contextmanager
+def interning(pool):
+    """Activates the intern pool for deserialization in the current context."""
+    token = _active_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _active_pool.reset(token)
+
@@ -26,6 +26,7 @@ from openapi_client.exceptions import (
     ApiTypeError,
     ApiValueError,
 )
+from openapi_client.model_interning import get_active_pool
 
 none_type = type(None)
 file_type = io.IOBase
@@ -545,7 +546,8 @@ class ModelNormal(OpenApiModel):
     def __eq__(self, other):
         """Returns true if both objects are equal"""
         if not isinstance(other, self.__class__):
-            return False
+            # e.g. compact record of the model decides itself
+            return NotImplemented
 
         if not set(self._data_store.keys()) == set(other._data_store.keys()):
             return False
@@ -1373,7 +1375,15 @@ def deserialize_model(model_data, model_class, path_to_item, check_type,
         return model_class._new_from_openapi_data(*model_data, **kw_args)
     if isinstance(model_data, dict):
         kw_args.update(model_data)
-        return model_class._new_from_openapi_data(**kw_args)
+        # reuse canonical instance of interned models (e.g. Star, DataSource)
+        pool = get_active_pool()
+        intern_key = pool.get_key(model_class, model_data) if pool is not None else None
+        if intern_key is None:
+            return model_class._new_from_openapi_data(**kw_args)
+        instance = pool.get(intern_key)
+        if instance is None:
+            instance = pool.add(intern_key, model_class._new_from_openapi_data(**kw_args))
+        return instance
     elif isinstance(model_data, PRIMITIVE_TYPES):
         return model_class._new_from_openapi_data(model_data, **kw_args)
 
@@ -8,21 +8,63 @@
 # or import this package, but before doing it, use:
 # import sys
 # sys.setrecursionlimit(n)
+#
+# Classes are imported on first access (see __getattr__), importing this
+# package alone is cheap.
 
-from openapi_client.model.attribute_definition import AttributeDefinition
-from openapi_client.model.data_source import DataSource
-from openapi_client.model.data_source_basic_info import DataSourceBasicInfo
-from openapi_client.model.export_csv_form import ExportCsvForm
-from openapi_client.model.extended_star import ExtendedStar
-from openapi_client.model.external_details import ExternalDetails
-from openapi_client.model.identifier import Identifier
-from openapi_client.model.light_curve_measurement import LightCurveMeasurement
-from openapi_client.model.magnitude import Magnitude
-from openapi_client.model.magnitude_attribute import MagnitudeAttribute
-from openapi_client.model.motion import Motion
-from openapi_client.model.radial_velocity import RadialVelocity
-from openapi_client.model.spectrum_measurement import SpectrumMeasurement
-from openapi_client.model.star import Star
-from openapi_client.model.star_basic_info import StarBasicInfo
-from openapi_client.model.star_datasource_attribute import StarDatasourceAttribute
-from openapi_client.model.vizier_table import VizierTable
+import typing
+
+if typing.TYPE_CHECKING:
+    from openapi_client.model.attribute_definition import AttributeDefinition
+    from openapi_client.model.data_source import DataSource
+    from openapi_client.model.data_source_basic_info import DataSourceBasicInfo
+    from openapi_client.model.export_csv_form import ExportCsvForm
+    from openapi_client.model.extended_star import ExtendedStar
+    from openapi_client.model.external_details import ExternalDetails
+    from openapi_client.model.identifier import Identifier
+    from openapi_client.model.light_curve_measurement import LightCurveMeasurement
+    from openapi_client.model.magnitude import Magnitude
+    from openapi_client.model.magnitude_attribute import MagnitudeAttribute
+    from openapi_client.model.motion import Motion
+    from openapi_client.model.radial_velocity import RadialVelocity
+    from openapi_client.model.spectrum_measurement import SpectrumMeasurement
+    from openapi_client.model.star import Star
+    from openapi_client.model.star_basic_info import StarBasicInfo
+    from openapi_client.model.star_datasource_attribute import StarDatasourceAttribute
+    from openapi_client.model.vizier_table import VizierTable
+
+_LAZY_ATTRIBUTES = {
+    'AttributeDefinition': 'openapi_client.model.attribute_definition',
+    'DataSource': 'openapi_client.model.data_source',
+    'DataSourceBasicInfo': 'openapi_client.model.data_source_basic_info',
+    'ExportCsvForm': 'openapi_client.model.export_csv_form',
+    'ExtendedStar': 'openapi_client.model.extended_star',
+    'ExternalDetails': 'openapi_client.model.external_details',
+    'Identifier': 'openapi_client.model.identifier',
+    'LightCurveMeasurement': 'openapi_client.model.light_curve_measurement',
+    'Magnitude': 'openapi_client.model.magnitude',
+    'MagnitudeAttribute': 'openapi_client.model.magnitude_attribute',
+    'Motion': 'openapi_client.model.motion',
+    'RadialVelocity': 'openapi_client.model.radial_velocity',
+    'SpectrumMeasurement': 'openapi_client.model.spectrum_measurement',
+    'Star': 'openapi_client.model.star',
+    'StarBasicInfo': 'openapi_client.model.star_basic_info',
+    'StarDatasourceAttribute': 'openapi_client.model.star_datasource_attribute',
+    'VizierTable': 'openapi_client.model.vizier_table',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -13,13 +13,16 @@ import json
 import logging
 import re
 import ssl
+import time
 from urllib.parse import urlencode
 from urllib.parse import urlparse
 from urllib.request import proxy_bypass_environment
 import urllib3
 import ipaddress
 
+from openapi_client.content_encoding import get_accept_encoding
 from openapi_client.exceptions import ApiException, UnauthorizedException, ForbiddenException, NotFoundException, ServiceException, ApiValueError
+from openapi_client.instrumentation import get_current_metrics
 
 
 logger = logging.getLogger(__name__)
@@ -63,6 +66,8 @@ class RESTClientObject(object):
 
         if configuration.retries is not None:
             addition_pool_args['retries'] = configuration.retries
+        # budget of RetryPolicy is earned by requests, see retry.py
+        self.retry_budget = getattr(configuration.retries, 'budget', None)
 
         if configuration.socket_options is not None:
             addition_pool_args['socket_options'] = configuration.socket_options
@@ -73,6 +78,9 @@ class RESTClientObject(object):
             else:
                 maxsize = 4
 
+        # compressed responses are decoded by urllib3 (decode_content)
+        self.accept_encoding = get_accept_encoding(configuration.accept_encoding)
+
         # https pool manager
         if configuration.proxy and not should_bypass_proxies(
                 configuration.host, no_proxy=configuration.no_proxy or ''):
@@ -130,6 +138,8 @@ class RESTClientObject(object):
 
         post_params = post_params or {}
         headers = headers or {}
+        if self.accept_encoding and 'Accept-Encoding' not in headers:
+            headers['Accept-Encoding'] = self.accept_encoding
 
         timeout = None
         if _request_timeout:
@@ -140,6 +150,15 @@ class RESTClientObject(object):
                 timeout = urllib3.Timeout(
                     connect=_request_timeout[0], read=_request_timeout[1])
 
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+
+        # measured responses are read after the headers are received to split the times
+        metrics = get_current_metrics()
+        preload_content = _preload_content and metrics is None
+        if metrics is not None:
+            started = time.perf_counter()
+
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
@@ -156,7 +175,7 @@ class RESTClientObject(object):
                     r = self.pool_manager.request(
                         method, url,
                         body=request_body,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
@@ -164,7 +183,7 @@ class RESTClientObject(object):
                         method, url,
                         fields=post_params,
                         encode_multipart=False,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'multipart/form-data':
@@ -176,7 +195,7 @@ class RESTClientObject(object):
                         method, url,
                         fields=post_params,
                         encode_multipart=True,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
                         headers=headers)
                 # Pass a `string` parameter directly in the body to support
@@ -187,7 +206,7 @@ class RESTClientObject(object):
                     r = self.pool_manager.request(
                         method, url,
                         body=request_body,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
                         headers=headers)
                 else:
@@ -200,36 +219,47 @@ class RESTClientObject(object):
             else:
                 r = self.pool_manager.request(method, url,
                                               fields=query_params,
-                                              preload_content=_preload_content,
+                                              preload_content=preload_content,
                                               timeout=timeout,
                                               headers=headers)
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
 
+        if metrics is not None:
+            self._measure_response(r, url, metrics, started, _preload_content)
+
         if _preload_content:
             r = RESTResponse(r)
 
             # log response body
             logger.debug("response body: %s", r.data)
 
-        if not 200 <= r.status <= 299:
-            if r.status == 401:
-                raise UnauthorizedException(http_resp=r)
-
-            if r.status == 403:
-                raise ForbiddenException(http_resp=r)
-
-            if r.status == 404:
-                raise NotFoundException(http_resp=r)
-
-            if 500 <= r.status <= 599:
-                raise ServiceException(http_resp=r)
-
-            raise ApiException(http_resp=r)
+        raise_for_status(r)
 
         return r
 
+    def _measure_response(self, r, url, metrics, started, read_body):
+        headers_received = time.perf_counter()
+        metrics.time_to_headers = headers_received - started
+        if r.retries is not None:
+            metrics.retries += len(r.retries.history)
+        pool = self.pool_manager.connection_from_url(url)
+        metrics.host = '{0}:{1}'.format(pool.host, pool.port)
+        metrics.pool_maxsize = pool.pool.maxsize
+        # idle connections (or free slots) are kept in the pool's queue
+        metrics.pool_connections_in_use = pool.pool.maxsize - pool.pool.qsize()
+        if read_body:
+            try:
+                r.data
+            finally:
+                r.release_conn()
+            metrics.transfer_time = time.perf_counter() - headers_received
+            # bytes read from the socket, before content decoding
+            metrics.bytes_received = r.tell()
+        else:
+            metrics.streamed = True
+
     def GET(self, url, headers=None, query_params=None, _preload_content=True,
             _request_timeout=None):
         return self.request("GET", url,
@@ -298,6 +328,26 @@ class RESTClientObject(object):
 # end of class RESTClientObject
 
 
+def raise_for_status(r):
+    """ Raise exception corresponding to the status of response
+    (RESTResponse or compatible object) unless it is successful
+    """
+    if not 200 <= r.status <= 299:
+        if r.status == 401:
+            raise UnauthorizedException(http_resp=r)
+
+        if r.status == 403:
+            raise ForbiddenException(http_resp=r)
+
+        if r.status == 404:
+            raise NotFoundException(http_resp=r)
+
+        if 500 <= r.status <= 599:
+            raise ServiceException(http_resp=r)
+
+        raise ApiException(http_resp=r)
+
+
 def is_ipv4(target):
     """ Test if IPv4 address or not
     """
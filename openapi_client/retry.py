@@ -0,0 +1,155 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Retry policy of requests (Configuration.retries = RetryPolicy(...)).
+
+    RetryPolicy is urllib3 Retry which
+        - waits exponentially growing time with random jitter before retries
+          (concurrent clients failed by the same hiccup do not retry at once)
+        - waits as long as the server asks by Retry-After header (429, 503)
+        - retries idempotent methods (GET, PUT, DELETE, ...) on connection and
+          read errors and on statuses of temporary failures, other methods
+          (POST) only when the request was surely not processed (connection
+          errors, 429 Too Many Requests)
+        - draws retries from RetryBudget shared by all requests of a client (or
+          of multiple clients), thus a long outage does not multiply the load
+          of the server and a bulk job does not wait for retries indefinitely
+    When retries are exhausted, the last response is returned (and raised as
+    ApiException by the REST client) or the last error is raised.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import random
+import threading
+
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+
+# Statuses of temporary failures retried by default
+DEFAULT_STATUS_FORCELIST = (429, 502, 503, 504)
+
+# Statuses of requests rejected without processing, retried regardless of method
+NOT_PROCESSED_STATUS_CODES = frozenset([429])
+
+
+class RetryBudget(object):
+    """Limits retries of all requests sharing the budget (token bucket).
+
+    Each request adds `ratio` of a retry to the budget, each retry takes one
+    whole retry, at most `capacity` retries are saved. Thus in the long run
+    at most `ratio` of requests are retried while short bursts of failures
+    are retried up to `capacity` times.
+
+    :param ratio: retries earned by a request, e.g. 0.1 - one retry per ten requests
+    :param capacity: maximum number of saved retries (the budget is full initially)
+    :param max_retry_time: maximum total time (seconds) of waiting before retries,
+        unlimited if None
+    """
+
+    def __init__(self, ratio=0.1, capacity=10, max_retry_time=None):
+        self.ratio = ratio
+        self.capacity = capacity
+        self.max_retry_time = max_retry_time
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        # statistics
+        self.retries = 0
+        self.rejected_retries = 0
+        self.retry_time = 0.0
+
+    def deposit(self):
+        """Called for each request."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self, wait_time):
+        """Called before a retry, returns whether the retry is allowed.
+
+        :param wait_time: time (seconds) waited before the retry
+        """
+        with self._lock:
+            if self._tokens < 1 or \
+                    (self.max_retry_time is not None and self.retry_time + wait_time > self.max_retry_time):
+                self.rejected_retries += 1
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            self.retry_time += wait_time
+            return True
+
+    @property
+    def available_retries(self):
+        return int(self._tokens)
+
+
+class RetryPolicy(Retry):
+    """urllib3 Retry with exponential backoff with jitter, idempotency aware
+    method rules and retry budget, see module documentation.
+
+    Waiting time before n-th consecutive retry is
+    min(backoff_max, backoff_factor * 2 ** (n - 1)), reduced by random part
+    of up to `jitter` of it, unless the server sends Retry-After header.
+
+    :param total: maximum number of retries of a request
+    :param backoff_factor: waiting time (seconds) before the first retry
+    :param backoff_max: maximum waiting time (seconds) before a retry
+    :param jitter: randomized fraction of waiting time (0 - no jitter, 1 - full jitter)
+    :param status_forcelist: statuses of responses retried
+    :param budget: RetryBudget shared by requests, retries are not limited if None
+    :param kwargs: other arguments of urllib3 Retry
+    """
+
+    def __init__(self, total=5, backoff_factor=0.5, backoff_max=30, jitter=0.5,
+                 status_forcelist=DEFAULT_STATUS_FORCELIST, budget=None, raise_on_status=False, **kwargs):
+        super().__init__(total=total, backoff_factor=backoff_factor, backoff_max=backoff_max,
+                         status_forcelist=status_forcelist, raise_on_status=raise_on_status, **kwargs)
+        self.jitter = jitter
+        self.budget = budget
+        # drawn once, the budget is charged with the same time which is waited
+        self._jitter_random = random.random()
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.jitter = self.jitter
+        retry.budget = self.budget
+        return retry
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if super().is_retry(method, status_code, has_retry_after):
+            return True
+        # requests rejected before processing can be repeated regardless of method
+        return bool(self.total) and status_code in NOT_PROCESSED_STATUS_CODES and \
+            (status_code in (self.status_forcelist or ()) or (self.respect_retry_after_header and has_retry_after))
+
+    def get_backoff_time(self):
+        consecutive_errors_len = 0
+        for entry in reversed(self.history):
+            if entry.redirect_location is not None:
+                break
+            consecutive_errors_len += 1
+        if consecutive_errors_len == 0:
+            return 0
+        backoff_value = min(self.backoff_max, self.backoff_factor * (2 ** (consecutive_errors_len - 1)))
+        return backoff_value * (1 - self.jitter * self._jitter_random)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if self.budget is None or (response is not None and response.get_redirect_location()):
+            return new_retry
+
+        wait_time = None
+        if response is not None and self.respect_retry_after_header:
+            wait_time = new_retry.get_retry_after(response)
+        if wait_time is None:
+            wait_time = new_retry.get_backoff_time()
+        if not self.budget.withdraw(wait_time):
+            reason = error or ResponseError("retry budget exhausted")
+            raise MaxRetryError(_pool, url, reason) from reason
+        return new_retry
+
+    def __repr__(self):
+        return "{0}(total={1}, backoff_factor={2}, jitter={3}, budget={4})".format(
+            type(self).__name__, self.total, self.backoff_factor, self.jitter, self.budget)
@@ -0,0 +1,68 @@
+"""
+    Chemically Peculiar Stars Database OpenAPI definitions
+
+    Coalescing of concurrent identical calls (single-flight).
+
+    While a call with a given key is in flight, other callers using the same
+    key wait for it and receive its result (or exception) instead of making
+    their own call.
+
+    The version of the OpenAPI document: 1.0.0
+"""
+
+
+import threading
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Group of calls deduplicated by keys. Instance may be shared by
+    multiple threads."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, function):
+        """Calls function() unless a call with the same key is in flight,
+        in which case its result is awaited and returned.
+
+        :param key: hashable key identifying equal calls
+        :param function: function without arguments
+        :return: result of the function (shared by all coalesced callers)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
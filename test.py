@@ -6,7 +6,28 @@ however, functions tend to use each other (*_by_renson especially).
 """
 
 
-from cpstars import CPStars
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from cpstars import CPStars, StarDossier, StarQueryResult
+from cpstars_async import AsyncCPStars
+from cpstars_cache import ResultCache
+from cpstars_catalog import CatalogStore, content_hash
+from cpstars_spatial import CrossmatchResult
+from cpstars_table import StarBasicInfoTable
+from mock_server import MockServer
+from openapi_client.exceptions import ApiException, ServiceException
+from openapi_client.http_cache import CacheEntry, DirectoryCacheBackend
+from openapi_client.instrumentation import MetricsCollector, PrometheusCollector, RecordingCollector
+from openapi_client.model.data_source import DataSource
+from openapi_client.model.data_source_basic_info import DataSourceBasicInfo
+from openapi_client.model.extended_star import ExtendedStar
 from openapi_client.model.external_details import ExternalDetails
 from openapi_client.model.identifier import Identifier
 from openapi_client.model.light_curve_measurement import LightCurveMeasurement
@@ -15,6 +36,7 @@ from openapi_client.model.magnitude_attribute import MagnitudeAttribute
 from openapi_client.model.radial_velocity import RadialVelocity
 from openapi_client.model.spectrum_measurement import SpectrumMeasurement
 from openapi_client.model.star import Star
+from openapi_client.retry import RetryBudget, RetryPolicy
 
 # In case different server should be queried, host_address can be specified
 # cpstars: CPStars = CPStars(host_address="http://localhost:8081")
@@ -23,6 +45,18 @@ from openapi_client.model.star import Star
 cpstars: CPStars = CPStars()
 
 
+def import_time_test():
+    # modules slow to import must not be imported by importing cpstars and creating CPStars instance
+    deferred_modules = ('numpy', 'urllib3', 'multiprocessing.pool', 'dateutil', 'openapi_client.api_client',
+                        'openapi_client.api.stars_controller_api', 'openapi_client.model.star', 'cpstars_spatial')
+
+    code = "import sys, cpstars; cpstars.CPStars(); print(' '.join(sorted(sys.modules)))"
+    imported_modules = set(subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                          check=True, capture_output=True, text=True).stdout.split())
+
+    assert imported_modules.isdisjoint(deferred_modules), imported_modules.intersection(deferred_modules)
+
+
 def get_basic_info_for_stars_test():
     current_database_stars_count = 8205
 
@@ -31,6 +65,212 @@ def get_basic_info_for_stars_test():
     assert len(stars) == current_database_stars_count
 
 
+def get_basic_info_for_stars_trusted_server_test():
+    current_database_stars_count = 8205
+
+    trusted_cpstars: CPStars = CPStars(trusted_server=True)
+    stars: list = trusted_cpstars.get_basic_info_for_stars()
+
+    assert len(stars) == current_database_stars_count
+    assert stars == cpstars.get_basic_info_for_stars()
+
+
+def get_basic_info_for_stars_lazy_test():
+    current_database_stars_count = 8205
+
+    lazy_cpstars: CPStars = CPStars(model_representation='lazy')
+    stars: list = lazy_cpstars.get_basic_info_for_stars()
+
+    assert len(stars) == current_database_stars_count
+    assert stars[0].get('renson') == stars[0].renson
+    assert stars == cpstars.get_basic_info_for_stars()
+
+
+def get_basic_info_for_stars_compact_test():
+    current_database_stars_count = 8205
+
+    compact_cpstars: CPStars = CPStars(model_representation='compact')
+    stars: list = compact_cpstars.get_basic_info_for_stars()
+
+    assert len(stars) == current_database_stars_count
+    assert stars[0].get('renson') == stars[0].renson
+    assert stars[0].to_model() == cpstars.get_basic_info_for_stars()[0]
+    assert stars == cpstars.get_basic_info_for_stars()
+
+
+def get_basic_info_for_stars_compressed_test():
+    stars_count = 1000
+
+    # local mock server compressing responses (gzip) for clients accepting it
+    with MockServer(stars_count=stars_count) as mock_server:
+        stars: list = CPStars(host_address=mock_server.host).get_basic_info_for_stars()
+        compressed_bytes_sent = mock_server.bytes_sent
+
+    with MockServer(stars_count=stars_count, compression=False) as mock_server:
+        uncompressed_stars: list = CPStars(host_address=mock_server.host).get_basic_info_for_stars()
+        uncompressed_bytes_sent = mock_server.bytes_sent
+
+    assert len(stars) == stars_count
+    assert stars == uncompressed_stars
+    assert compressed_bytes_sent < uncompressed_bytes_sent
+
+
+def get_basic_info_for_stars_http_cache_test():
+    stars_count = 1000
+
+    # local mock server answering conditional requests (ETag) with 304 Not Modified
+    with MockServer(stars_count=stars_count) as mock_server:
+        caching_cpstars: CPStars = CPStars(host_address=mock_server.host, http_cache=True)
+        stars: list = caching_cpstars.get_basic_info_for_stars()
+        bytes_sent = mock_server.bytes_sent
+        revalidated_stars: list = caching_cpstars.get_basic_info_for_stars()
+
+        assert mock_server.bytes_sent == bytes_sent
+
+    assert len(stars) == stars_count
+    assert stars == revalidated_stars
+
+
+def directory_http_cache_eviction_test():
+    entry = CacheEntry(200, 'OK', {'etag': '"1"'}, b'x' * 1000, 0, 0)
+
+    with tempfile.TemporaryDirectory() as directory_path:
+        unlimited_backend = DirectoryCacheBackend(directory_path, max_bytes=None)
+        unlimited_backend.set('GET /stars/1', entry)
+        file_size = unlimited_backend.size
+
+        # files stored earlier count towards the limit
+        backend = DirectoryCacheBackend(directory_path, max_bytes=2 * file_size)
+        assert backend.size == file_size
+
+        backend.set('GET /stars/2', entry)
+        # reading makes the response recently used, the other one is evicted
+        assert backend.get('GET /stars/1') is not None
+        backend.set('GET /stars/3', entry)
+
+        assert backend.get('GET /stars/2') is None
+        assert backend.get('GET /stars/1') is not None and backend.get('GET /stars/3') is not None
+        assert backend.size == 2 * file_size == sum(
+            os.path.getsize(os.path.join(directory_path, file_name)) for file_name in os.listdir(directory_path))
+
+
+def get_basic_info_for_stars_metrics_test():
+    stars_count = 1000
+    recording_collector = RecordingCollector()
+    prometheus_collector = PrometheusCollector()
+
+    with MockServer(stars_count=stars_count) as mock_server:
+        measured_cpstars: CPStars = CPStars(host_address=mock_server.host, metrics_collector=recording_collector)
+        stars: list = measured_cpstars.get_basic_info_for_stars()
+        # counted by the server before the response is sent, thus complete when the call returns
+        bytes_sent = mock_server.bytes_sent
+        requests_count = mock_server.requests_count
+
+    metrics = recording_collector.records[-1]
+    prometheus_collector.record(metrics)
+    exposition = prometheus_collector.expose()
+
+    assert len(stars) == stars_count
+    assert len(recording_collector.records) == requests_count == 1
+    assert (metrics.method, metrics.endpoint, metrics.status, metrics.error) == ('GET', '/stars', 200, None)
+    assert metrics.bytes_received == bytes_sent
+    assert metrics.network_time + metrics.decode_time + metrics.model_time <= metrics.total_time
+    assert 'cpstars_requests_total{method="GET",endpoint="/stars",status="200"} 1' in exposition
+    assert 'cpstars_request_duration_seconds_count{method="GET",endpoint="/stars",phase="model"} 1' in exposition
+
+    # collector not implementing record is refused before it is passed to CPStars
+    incomplete_collector_class = type('IncompleteCollector', (MetricsCollector,), {})
+    try:
+        incomplete_collector_class()
+        assert False
+    except TypeError:
+        pass
+
+
+def get_basic_info_for_stars_retried_test():
+    stars_count = 100
+    recording_collector = RecordingCollector()
+
+    # local mock server answering first requests by 503 Service Unavailable
+    with MockServer(stars_count=stars_count, failures=2) as mock_server:
+        retrying_cpstars: CPStars = CPStars(host_address=mock_server.host, metrics_collector=recording_collector,
+                                            retries=RetryPolicy(backoff_factor=0.01, budget=RetryBudget()))
+        stars: list = retrying_cpstars.get_basic_info_for_stars()
+
+    assert len(stars) == stars_count
+    assert recording_collector.records[-1].retries == 2
+
+    # retries are opt-in, failed responses are not retried by default
+    with MockServer(stars_count=stars_count, failures=1) as mock_server:
+        try:
+            CPStars(host_address=mock_server.host).get_basic_info_for_stars()
+            assert False
+        except ServiceException:
+            pass
+
+        assert mock_server.requests_count == 1
+
+    # retries are limited by the budget shared by requests
+    retry_budget: RetryBudget = RetryBudget(capacity=2)
+    with MockServer(stars_count=stars_count, failures=10) as mock_server:
+        retrying_cpstars: CPStars = CPStars(host_address=mock_server.host,
+                                            retries=RetryPolicy(backoff_factor=0.01, budget=retry_budget))
+        for _ in range(2):
+            try:
+                retrying_cpstars.get_basic_info_for_stars()
+                assert False
+            except ServiceException:
+                pass
+
+        assert mock_server.requests_count == 4
+        assert (retry_budget.retries, retry_budget.rejected_retries) == (2, 2)
+
+
+def get_basic_info_table_test():
+    current_database_stars_count = 8205
+    renson_id = '61670'
+
+    table: StarBasicInfoTable = cpstars.get_basic_info_table()
+    stars: list = cpstars.get_basic_info_for_stars()
+    northern_stars: StarBasicInfoTable = table[table['icrs_declination'] > 0]
+
+    assert len(table) == current_database_stars_count
+    assert len(northern_stars) == sum(1 for star in stars if star.icrs_declination > 0)
+    assert table.get_row_by_renson(renson_id)['renson'] == renson_id
+    assert table.get_row_by_id(stars[0].id)['icrs_right_ascension'] == stars[0].icrs_right_ascension
+
+
+def cone_search_test():
+    right_ascension, declination, radius = 83.82, -5.39, 5
+
+    stars: StarBasicInfoTable = cpstars.cone_search(right_ascension, declination, radius)
+    nearest_stars: StarBasicInfoTable = cpstars.get_nearest_stars(right_ascension, declination, 3)
+
+    assert len(stars) > 0
+    assert all(separation <= radius for separation in stars['separation'])
+    assert list(nearest_stars['id']) == list(stars['id'][:3])
+
+
+def crossmatch_test():
+    stars: list = cpstars.get_basic_info_for_stars()[:100]
+    right_ascensions = np.array([star.icrs_right_ascension for star in stars])
+    declinations = np.array([star.icrs_declination for star in stars])
+
+    matches = cpstars.crossmatch(right_ascensions, declinations, 1 / 3600)
+
+    assert list(matches.input_indices) == list(range(len(stars)))
+    assert list(matches.cp_stars_ids) == [star.id for star in stars]
+    assert all(separation < 1e-6 for separation in matches.separations)
+
+
+def iter_basic_info_for_stars_test():
+    current_database_stars_count = 8205
+
+    stars_count = sum(1 for _ in cpstars.iter_basic_info_for_stars())
+
+    assert stars_count == current_database_stars_count
+
+
 def get_identifiers_for_star_by_renson_test():
     renson_id = '61670'
     expected_identifiers_count = 5
@@ -40,6 +280,16 @@ def get_identifiers_for_star_by_renson_test():
     assert len(identifiers) == expected_identifiers_count
 
 
+def get_identifiers_for_star_by_renson_indexed_test():
+    renson_id = '61670'
+    expected_identifiers_count = 5
+
+    indexed_cpstars: CPStars = CPStars(renson_index=True)
+    identifiers: list[Identifier] = indexed_cpstars.get_identifiers_for_star_by_renson(renson_id)
+
+    assert len(identifiers) == expected_identifiers_count
+
+
 def get_light_curve_for_star_test():
     cp_stars_id: int = 76
     expected_number_of_measurements = 1092
@@ -58,6 +308,25 @@ def get_light_curve_for_star_by_renson_test():
     assert len(light_curve_measurements) == expected_number_of_measurements
 
 
+def get_light_curve_array_test():
+    cp_stars_id: int = 76
+    expected_number_of_measurements = 1092
+
+    times, values = cpstars.get_light_curve_array(cp_stars_id)
+
+    assert times.dtype == np.float64 and values.dtype == np.float64
+    assert len(times) == len(values) == expected_number_of_measurements
+
+
+def get_light_curve_array_by_renson_test():
+    renson_id = '61600'
+    expected_number_of_measurements = 1126
+
+    times, values = cpstars.get_light_curve_array_by_renson(renson_id)
+
+    assert len(times) == len(values) == expected_number_of_measurements
+
+
 def get_magnitudes_attributes_for_star_test():
     cp_stars_id: int = 64
     expected_number_of_attributes = 1
@@ -76,6 +345,208 @@ def get_magnitudes_for_star_test():
     assert len(magnitudes) == expected_magnitudes_count
 
 
+def get_magnitudes_for_star_interned_test():
+    cp_stars_id: int = 2
+    expected_magnitudes_count = 18
+
+    # interning applies to fully converted models only
+    for model_representation in ('lazy', 'compact'):
+        try:
+            CPStars(intern_models='response', model_representation=model_representation)
+            assert False
+        except ValueError:
+            pass
+
+    interning_cpstars: CPStars = CPStars(intern_models='response')
+    magnitudes: list[Magnitude] = interning_cpstars.get_magnitudes_for_star(cp_stars_id)
+
+    assert len(magnitudes) == expected_magnitudes_count
+    assert all(magnitude.star is magnitudes[0].star for magnitude in magnitudes)
+    assert magnitudes == cpstars.get_magnitudes_for_star(cp_stars_id)
+
+
+def get_magnitudes_for_star_result_cache_test():
+    cp_stars_id: int = 2
+
+    # local mock server counting received requests
+    with MockServer(stars_count=10) as mock_server:
+        caching_cpstars: CPStars = CPStars(host_address=mock_server.host, result_cache=True)
+        magnitudes: list[Magnitude] = caching_cpstars.get_magnitudes_for_star(cp_stars_id)
+        cached_magnitudes: list[Magnitude] = caching_cpstars.get_magnitudes_for_star(cp_stars_id)
+        # argument passed by keyword hits the same entry
+        keyword_cached_magnitudes = caching_cpstars.get_magnitudes_for_star(cp_stars_id=cp_stars_id)
+        requests_count = mock_server.requests_count
+
+        caching_cpstars.result_cache.invalidate('get_magnitudes_for_star', cp_stars_id)
+        caching_cpstars.get_magnitudes_for_star(cp_stars_id)
+
+        assert mock_server.requests_count == requests_count + 1
+
+    assert cached_magnitudes is magnitudes and keyword_cached_magnitudes is magnitudes
+    assert requests_count == 1
+    assert caching_cpstars.result_cache.get_statistics()['hits'] == 2
+
+
+def result_cache_shared_test():
+    result_cache = ResultCache()
+
+    # local mock servers with different stars, cache is shared by instances of both of them
+    with MockServer(stars_count=20) as mock_server, MockServer(stars_count=10) as other_mock_server:
+        caching_cpstars: CPStars = CPStars(host_address=mock_server.host, result_cache=result_cache)
+        lazy_cpstars: CPStars = CPStars(host_address=mock_server.host, result_cache=result_cache,
+                                        model_representation='lazy')
+        other_cpstars: CPStars = CPStars(host_address=other_mock_server.host, result_cache=result_cache)
+
+        stars: list = caching_cpstars.get_basic_info_for_stars()
+        lazy_stars: list = lazy_cpstars.get_basic_info_for_stars()
+        other_stars: list = other_cpstars.get_basic_info_for_stars()
+        same_server_stars: list = CPStars(host_address=mock_server.host,
+                                          result_cache=result_cache).get_basic_info_for_stars()
+
+        result_cache.invalidate('get_basic_info_for_stars', namespace=(other_mock_server.host, 'model'))
+        other_cpstars.get_basic_info_for_stars()
+
+        assert mock_server.requests_count == 2
+        assert other_mock_server.requests_count == 2
+
+    assert (len(stars), len(other_stars)) == (20, 10)
+    assert lazy_stars is not stars and lazy_stars == stars
+    assert same_server_stars is stars
+
+
+def get_magnitudes_for_star_coalesced_test():
+    cp_stars_id: int = 2
+    concurrent_calls_count = 20
+
+    # local mock server counting received requests, large responses keep requests in flight longer
+    with MockServer(stars_count=10, magnitudes_count=2000) as mock_server:
+        coalescing_cpstars: CPStars = CPStars(host_address=mock_server.host, coalesce_requests=True,
+                                              max_workers=concurrent_calls_count)
+        with ThreadPoolExecutor(concurrent_calls_count) as executor:
+            results = list(executor.map(lambda _: coalescing_cpstars.get_magnitudes_for_star(cp_stars_id),
+                                        range(concurrent_calls_count)))
+
+        assert mock_server.requests_count < concurrent_calls_count
+
+    assert all(magnitudes == results[0] for magnitudes in results)
+
+
+def get_magnitudes_for_stars_test():
+    cp_stars_ids: list[int] = [2, 2, 3]
+    expected_magnitudes_count = 18
+
+    results = cpstars.get_magnitudes_for_stars(cp_stars_ids)
+
+    assert [result.cp_stars_id for result in results] == cp_stars_ids
+    assert all(result.ok for result in results)
+    assert len(results[0].value) == len(results[1].value) == expected_magnitudes_count
+
+
+def get_magnitudes_for_stars_async_test():
+    cp_stars_ids: list[int] = list(range(1, 51)) + [51]
+    expected_magnitudes_count = 30
+
+    async def query(host_address):
+        async with AsyncCPStars(host_address, max_connections=8) as async_cpstars:
+            return await async_cpstars.get_magnitudes_for_stars(cp_stars_ids)
+
+    # local mock server with 50 stars, the last star does not exist
+    with MockServer(stars_count=50) as mock_server:
+        results = asyncio.run(query(mock_server.host))
+
+    assert [result.cp_stars_id for result in results] == cp_stars_ids
+    assert all(len(result.value) == expected_magnitudes_count for result in results[:-1])
+    assert results[-1].error.status == 404
+
+
+def async_event_loops_test():
+    # local mock server keeping connections alive
+    with MockServer(stars_count=10) as mock_server:
+        async_cpstars: AsyncCPStars = AsyncCPStars(mock_server.host)
+        # pooled connections of the first event loop are not reused by the next one
+        star: Star = asyncio.run(async_cpstars.get_star(1))
+        other_star: Star = asyncio.run(async_cpstars.get_star(2))
+        asyncio.run(async_cpstars.close())
+
+    assert (star.id, other_star.id) == (1, 2)
+
+
+def async_malformed_response_test():
+    responses: list[bytes] = [
+        b'SSH-2.0-OpenSSH\r\n',
+        b'HTTP/1.1 OK\r\n\r\n',
+        b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n',
+        b'HTTP/1.1 200 OK\r\nContent-Length: -1\r\n\r\n',
+    ]
+
+    async def query(response):
+        # local server answering requests by the given bytes
+        async def answer(reader, writer):
+            await reader.readuntil(b'\r\n\r\n')
+            writer.write(response)
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(answer, '127.0.0.1', 0)
+        host_address = 'http://127.0.0.1:%d' % server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncCPStars(host_address) as async_cpstars:
+                await async_cpstars.get_star(1)
+        except ApiException as e:
+            return e
+        finally:
+            server.close()
+
+    errors: list = [asyncio.run(query(response)) for response in responses]
+
+    assert all(error is not None and error.status == 0 for error in errors)
+
+
+def async_facade_test():
+    stars_count = 50
+
+    async def query(host_address):
+        async with AsyncCPStars(host_address) as async_cpstars:
+            results = {
+                'table': await async_cpstars.get_basic_info_table(),
+                'cone': await async_cpstars.cone_search(0, 0, 180),
+                'nearest': await async_cpstars.get_nearest_stars(0, 0, 3),
+                'box': await async_cpstars.box_search(0, 360, -90, 90),
+                'crossmatch': await async_cpstars.crossmatch(ras, decs, 1 / 3600),
+                'crossmatch_chunks': list(await async_cpstars.iter_crossmatch(ras, decs, 1 / 3600, chunk_size=7)),
+                'renson_few': await async_cpstars.resolve_renson_ids(['20', '-1']),
+                'renson_many': await async_cpstars.resolve_renson_ids(renson_ids),
+                'dossier': await async_cpstars.get_star_dossier_by_renson('20'),
+                'extended_star': await async_cpstars.get_extended_star_by_renson('20'),
+                'datasources': await async_cpstars.get_datasources(),
+            }
+            magnitude_datasource_id = results['dossier'].magnitudes[0].datasource.id
+            results['datasource'] = await async_cpstars.get_datasource(magnitude_datasource_id)
+            return results
+
+    with MockServer(stars_count=stars_count) as mock_server:
+        stars = [mock_server.data.get_basic_info(cp_stars_id) for cp_stars_id in range(1, stars_count + 1)]
+        ras = np.array([star['icrsRightAscension'] for star in stars])
+        decs = np.array([star['icrsDeclination'] for star in stars])
+        renson_ids = [star['renson'] for star in stars] + ['-1']
+        results = asyncio.run(query(mock_server.host))
+        expected_magnitudes = CPStars(host_address=mock_server.host).get_magnitudes_for_star(2)
+
+    assert len(results['table']) == stars_count
+    assert len(results['cone']) == len(results['box']) == stars_count
+    assert list(results['nearest']['id']) == list(results['cone']['id'][:3])
+    assert list(results['crossmatch'].cp_stars_ids) == list(range(1, stars_count + 1))
+    assert list(CrossmatchResult.concatenate(results['crossmatch_chunks']).cp_stars_ids) == \
+        list(results['crossmatch'].cp_stars_ids)
+    assert results['renson_few'] == {'20': 2, '-1': None}
+    assert list(results['renson_many'].values()) == list(range(1, stars_count + 1)) + [None]
+    assert results['dossier'].star.id == 2
+    assert results['dossier'].magnitudes == expected_magnitudes
+    assert isinstance(results['extended_star'], ExtendedStar) and results['extended_star'].id == 2
+    assert isinstance(results['datasource'], DataSource)
+    assert results['datasource'].id in [datasource.id for datasource in results['datasources']]
+
+
 def get_radial_velocities_for_star_test():
     cp_stars_id: int = 7
     expected_radial_velocities_measurements_count = 1
@@ -121,6 +592,26 @@ def get_spectrum_for_star_by_renson_test():
     assert len(spectrum_measurements) == expected_number_of_spectrum_measurements
 
 
+def get_spectrum_array_test():
+    cp_stars_id = 1491
+    expected_number_of_spectrum_measurements = 3233
+
+    wavelengths, fluxes = cpstars.get_spectrum_array(cp_stars_id)
+
+    assert len(wavelengths) == len(fluxes) == expected_number_of_spectrum_measurements
+    assert np.all(np.diff(wavelengths) >= 0)
+
+
+def get_spectrum_array_by_renson_test():
+    renson_id = '160'
+    expected_number_of_spectrum_measurements = 3233
+
+    wavelengths, fluxes = cpstars.get_spectrum_array_by_renson(renson_id)
+
+    assert len(wavelengths) == len(fluxes) == expected_number_of_spectrum_measurements
+    assert np.all(np.diff(wavelengths) >= 0)
+
+
 def get_star_test():
     cp_stars_id: int = 3
     expected_renson_id: str = '61600'
@@ -132,6 +623,142 @@ def get_star_test():
     assert star.get('renson') == expected_renson_id
 
 
+def refresh_catalog_test():
+    stars_count = 20
+
+    # local mock server whose stars are changed between refreshes
+    with MockServer(stars_count=stars_count) as mock_server, CatalogStore(':memory:') as catalog:
+        added_star: dict = mock_server.data.remove_star(stars_count)
+        mirrored_cpstars: CPStars = CPStars(host_address=mock_server.host, catalog=catalog)
+
+        summary: dict = mirrored_cpstars.refresh_catalog()
+        assert sorted(summary['added']) == list(range(1, stars_count))
+        assert summary['updated'] == [] and summary['removed'] == []
+        assert len(catalog.get_basic_info_list()) == stars_count - 1
+
+        requests_count = mock_server.requests_count
+        assert mirrored_cpstars.refresh_catalog() == {'added': [], 'updated': [], 'removed': []}
+        assert mock_server.requests_count == requests_count + 1
+
+        mock_server.data.add_star(added_star)
+        mock_server.data.remove_star(stars_count - 1)
+        mock_server.data.get_basic_info(1)['binarySystemComponent'] = 'C'
+        summary: dict = mirrored_cpstars.refresh_catalog()
+        stored_ids: list = sorted(star['id'] for star in catalog.get_basic_info_list())
+
+    assert summary == {'added': [stars_count], 'updated': [1], 'removed': [stars_count - 1]}
+    assert stored_ids == list(range(1, stars_count - 1)) + [stars_count]
+
+
+def get_star_from_catalog_test():
+    stars_count = 20
+    cp_stars_id: int = 3
+    missing_cp_stars_id: int = 5
+
+    with MockServer(stars_count=stars_count) as mock_server, CatalogStore(':memory:') as catalog:
+        CPStars(host_address=mock_server.host, catalog=catalog).refresh_catalog()
+        catalog.remove_stars([missing_cp_stars_id])
+
+        mirrored_cpstars: CPStars = CPStars(host_address=mock_server.host, catalog=catalog)
+        requests_count = mock_server.requests_count
+        stars: list = mirrored_cpstars.get_basic_info_for_stars()
+        star: Star = mirrored_cpstars.get_star(cp_stars_id)
+
+        assert mock_server.requests_count == requests_count
+
+        # star missing in the catalog mirror is requested from the server
+        missing_star: Star = mirrored_cpstars.get_star(missing_cp_stars_id)
+
+        assert mock_server.requests_count == requests_count + 1
+
+    assert len(stars) == stars_count - 1
+    assert star.id == cp_stars_id
+    assert missing_star.id == missing_cp_stars_id
+
+
+def catalog_of_other_server_test():
+    # catalog mirror refreshed from one server is not used to answer queries of another one
+    with MockServer(stars_count=50) as mirrored_server, MockServer(stars_count=10) as other_server, \
+            CatalogStore(':memory:') as catalog:
+        CPStars(host_address=mirrored_server.host, catalog=catalog).refresh_catalog()
+        other_cpstars: CPStars = CPStars(host_address=other_server.host, catalog=catalog)
+        stars: list = other_cpstars.get_basic_info_for_stars()
+
+        assert other_server.requests_count == 1
+
+        summary: dict = other_cpstars.refresh_catalog()
+        requests_count = other_server.requests_count
+        mirrored_stars: list = other_cpstars.get_basic_info_for_stars()
+
+        assert other_server.requests_count == requests_count
+
+    assert len(stars) == len(mirrored_stars) == 10
+    assert len(summary['updated']) == 10 and len(summary['removed']) == 40
+
+
+def refresh_catalog_command_test():
+    stars_count = 20
+
+    with MockServer(stars_count=stars_count) as mock_server, tempfile.TemporaryDirectory() as directory:
+        catalog_path = os.path.join(directory, 'catalog.sqlite3')
+        output = subprocess.run([sys.executable, 'cpstars_catalog.py', 'refresh', '--host', mock_server.host,
+                                 '--path', catalog_path], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                check=True, capture_output=True, text=True).stdout
+
+        with CatalogStore(catalog_path) as catalog:
+            stored_stars: list = catalog.get_basic_info_list()
+
+        # catalog refresh does not build spatial index
+        assert os.listdir(directory) == ['catalog.sqlite3']
+
+    assert output.strip() == 'added: {}, updated: 0, removed: 0'.format(stars_count)
+    assert len(stored_stars) == stars_count
+
+
+def get_star_from_catalog_store_test():
+    cp_stars_id: int = 3
+    renson_id: str = '61600'
+    # no server listens at the address, stars stored in the catalog mirror are not requested
+    host_address: str = 'http://127.0.0.1:9'
+    basic_info: dict = {
+        'id': cp_stars_id,
+        'renson': renson_id,
+        'consideredCategoryAffiliationProbabilityFlag': '',
+        'binarySystemComponent': '',
+        'icrsRightAscension': 10.5,
+        'icrsDeclination': -20.25,
+        'galacticLongitude': 120.0,
+        'galacticLatitude': 30.0,
+    }
+    star_data: dict = dict(basic_info, icrsRightAscensionError=0.01, icrsDeclinationError=0.01,
+                           alpha='00 42 00.0', delta='-20 15 00')
+
+    with CatalogStore(':memory:') as catalog:
+        # catalog mirror is not used until it is refreshed
+        assert catalog.get_basic_info_list() is None
+
+        catalog.store_star(basic_info, {'star': star_data, 'identifiers': []})
+        catalog.mark_refreshed(host_address)
+        mirrored_cpstars: CPStars = CPStars(host_address=host_address, catalog=catalog)
+        star: Star = mirrored_cpstars.get_star(cp_stars_id)
+        renson_star: Star = mirrored_cpstars.get_star_by_renson(renson_id)
+        identifiers: list = mirrored_cpstars.get_identifiers_for_star(cp_stars_id)
+        stored_hashes: dict = catalog.get_star_hashes()
+        stored_stars: list = catalog.get_basic_info_list()
+
+        catalog.remove_stars([cp_stars_id])
+
+        assert catalog.get_basic_info_list() == []
+        assert catalog.get_star_detail(cp_stars_id, 'star') is None
+
+    assert star.id == renson_star.id == cp_stars_id
+    assert star.get('renson') == renson_id
+    assert identifiers == []
+    # hash does not depend on order of keys
+    assert stored_hashes == {cp_stars_id: content_hash(dict(reversed(list(basic_info.items()))))}
+    assert stored_stars == [basic_info]
+
+
 def get_star_by_renson_test():
     renson_id: str = '61600'
     expected_cp_stars_id: int = 3
@@ -143,6 +770,111 @@ def get_star_by_renson_test():
     assert star.get('renson') == renson_id
 
 
+def resolve_renson_ids_test():
+    renson_ids: list[str] = ['61600', '61670', '-1']
+    expected_cp_stars_id: int = 3
+
+    # local mock server counting received requests, Renson id of a mock star is its CP-Stars id * 10
+    with MockServer(stars_count=1000) as mock_server:
+        mock_renson_ids: list[str] = [str(cp_stars_id * 10) for cp_stars_id in range(1, 1001)] + ['-1']
+        resolved_ids: dict = CPStars(host_address=mock_server.host).resolve_renson_ids(mock_renson_ids)
+
+        assert mock_server.requests_count <= 2
+
+        # a few identifiers are queried one by one
+        few_resolved_ids: dict = CPStars(host_address=mock_server.host).resolve_renson_ids(['20', '-1'])
+
+    assert resolved_ids['10'] == 1 and resolved_ids['10000'] == 1000
+    assert resolved_ids['-1'] is None
+    assert few_resolved_ids == {'20': 2, '-1': None}
+
+    resolved_ids = cpstars.resolve_renson_ids(renson_ids)
+
+    assert resolved_ids[renson_ids[0]] == expected_cp_stars_id
+    assert resolved_ids[renson_ids[2]] is None
+
+
+def get_star_dossier_test():
+    cp_stars_id: int = 2
+    expected_magnitudes_count = 18
+
+    dossier: StarDossier = cpstars.get_star_dossier(cp_stars_id)
+
+    assert dossier.star.id == cp_stars_id
+    assert dossier.magnitudes == cpstars.get_magnitudes_for_star(cp_stars_id)
+    assert len(dossier.magnitudes) == expected_magnitudes_count
+
+
+def get_star_dossier_by_renson_test():
+    renson_id: str = '61600'
+    expected_cp_stars_id: int = 3
+
+    dossier: StarDossier = cpstars.get_star_dossier_by_renson(renson_id, extended=True, light_curve=False)
+
+    assert dossier.star.id == expected_cp_stars_id
+    assert dossier.star.get('external_details') is not None
+    assert dossier.light_curve is None
+
+
+def get_star_dossier_in_bulk_test():
+    cp_stars_ids = list(range(1, 9))
+
+    # local mock server, all workers of the API client run dossiers waiting for their requests
+    with MockServer(stars_count=10) as mock_server:
+        mock_cpstars: CPStars = CPStars(host_address=mock_server.host, max_workers=2)
+        results: list[StarQueryResult] = mock_cpstars._query_stars(mock_cpstars.get_star_dossier, cp_stars_ids)
+
+        assert [result.cp_stars_id for result in results] == cp_stars_ids
+        assert all(result.error is None for result in results), [result.error for result in results]
+        assert [result.value.star.id for result in results] == cp_stars_ids
+        assert results[0].value.magnitudes == mock_cpstars.get_magnitudes_for_star(1)
+
+
+def get_extended_star_test():
+    cp_stars_id: int = 1
+
+    star: ExtendedStar = cpstars.get_extended_star(cp_stars_id)
+
+    assert star.id == cp_stars_id
+    assert star.get('external_details') is not None
+
+
+def get_datasources_test():
+    magnitude: Magnitude = cpstars.get_magnitudes_for_star(2)[0]
+
+    datasources: list[DataSourceBasicInfo] = cpstars.get_datasources()
+    datasource: DataSource = cpstars.get_datasource(magnitude.datasource.id)
+
+    assert magnitude.datasource.id in [datasource.id for datasource in datasources]
+    assert datasource.name == magnitude.datasource.name
+    assert datasource is cpstars.get_datasource(magnitude.datasource.id)
+    assert datasource == CPStars().get_datasource(magnitude.datasource.id)
+
+
+def get_datasources_shared_test():
+    datasource_id: int = 1
+
+    # local mock server counting received requests
+    with MockServer(stars_count=10) as mock_server:
+        lazy_cpstars: CPStars = CPStars(host_address=mock_server.host, model_representation='lazy')
+        lazy_datasources: list = lazy_cpstars.get_datasources()
+        lazy_datasource: DataSource = lazy_cpstars.get_datasource(datasource_id)
+        requests_count = mock_server.requests_count
+
+        # received data are shared by instances of the server, objects are built by each instance
+        other_cpstars: CPStars = CPStars(host_address=mock_server.host)
+        datasources: list = other_cpstars.get_datasources()
+        datasource: DataSource = other_cpstars.get_datasource(datasource_id)
+
+        assert mock_server.requests_count == requests_count == 2
+
+    assert 'LazyDataStore' in type(lazy_datasource.__dict__.get('_data_store')).__name__
+    assert 'LazyDataStore' not in type(datasource.__dict__.get('_data_store')).__name__
+    assert datasource is other_cpstars.get_datasource(datasource_id)
+    assert [item.id for item in datasources] == [item.id for item in lazy_datasources]
+    assert datasource.name == lazy_datasource.name
+
+
 def get_vizier_metadata_test():
     """
     External data may change, thus this test may fail as well in case expected
@@ -170,14 +902,70 @@ if __name__ == '__main__':
     print("|  FUNCTION                                         |")
     print("+---------------------------------------------------+")
 
+    print(str.format("   {:<40} ", "import cpstars"), end="")
+    import_time_test()
+    print("[ OK ]")
+
     print(str.format("   {:<40} ", "get_basic_info_for_stars"), end="")
     get_basic_info_for_stars_test()
     print("[ OK ]")
 
+    print(str.format("   {:<40} ", "get_basic_info_for_stars (trusted)"), end="")
+    get_basic_info_for_stars_trusted_server_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_basic_info_for_stars (lazy)"), end="")
+    get_basic_info_for_stars_lazy_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_basic_info_for_stars (compact)"), end="")
+    get_basic_info_for_stars_compact_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_basic_info_for_stars (compressed)"), end="")
+    get_basic_info_for_stars_compressed_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_basic_info_for_stars (HTTP cache)"), end="")
+    get_basic_info_for_stars_http_cache_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "DirectoryCacheBackend (eviction)"), end="")
+    directory_http_cache_eviction_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_basic_info_for_stars (metrics)"), end="")
+    get_basic_info_for_stars_metrics_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_basic_info_for_stars (retried)"), end="")
+    get_basic_info_for_stars_retried_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_basic_info_table"), end="")
+    get_basic_info_table_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "cone_search"), end="")
+    cone_search_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "crossmatch"), end="")
+    crossmatch_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "iter_basic_info_for_stars"), end="")
+    iter_basic_info_for_stars_test()
+    print("[ OK ]")
+
     print(str.format("   {:<40} ", "get_identifiers_for_star_by_renson"), end="")
     get_identifiers_for_star_by_renson_test()
     print("[ OK ]")
 
+    print(str.format("   {:<40} ", "get_identifiers_for_star_by_renson (index)"), end="")
+    get_identifiers_for_star_by_renson_indexed_test()
+    print("[ OK ]")
+
     print(str.format("   {:<40} ", "get_light_curve_for_star"), end="")
     get_light_curve_for_star_test()
     print("[ OK ]")
@@ -186,6 +974,14 @@ if __name__ == '__main__':
     get_light_curve_for_star_by_renson_test()
     print("[ OK ]")
 
+    print(str.format("   {:<40} ", "get_light_curve_array"), end="")
+    get_light_curve_array_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_light_curve_array_by_renson"), end="")
+    get_light_curve_array_by_renson_test()
+    print("[ OK ]")
+
     print(str.format("   {:<40} ", "get_magnitudes_attributes_for_star"), end="")
     get_magnitudes_attributes_for_star_test()
     print("[ OK ]")
@@ -194,6 +990,42 @@ if __name__ == '__main__':
     get_magnitudes_for_star_test()
     print("[ OK ]")
 
+    print(str.format("   {:<40} ", "get_magnitudes_for_star (interned)"), end="")
+    get_magnitudes_for_star_interned_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_magnitudes_for_star (result cache)"), end="")
+    get_magnitudes_for_star_result_cache_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "result cache (shared by instances)"), end="")
+    result_cache_shared_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_magnitudes_for_star (coalesced)"), end="")
+    get_magnitudes_for_star_coalesced_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_magnitudes_for_stars"), end="")
+    get_magnitudes_for_stars_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_magnitudes_for_stars (async)"), end="")
+    get_magnitudes_for_stars_async_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "AsyncCPStars (consecutive event loops)"), end="")
+    async_event_loops_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "AsyncCPStars (malformed responses)"), end="")
+    async_malformed_response_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "AsyncCPStars (local functions)"), end="")
+    async_facade_test()
+    print("[ OK ]")
+
     print(str.format("   {:<40} ", "get_radial_velocities_for_star"), end="")
     get_radial_velocities_for_star_test()
     print("[ OK ]")
@@ -210,14 +1042,70 @@ if __name__ == '__main__':
     get_spectrum_for_star_by_renson_test()
     print("[ OK ]")
 
+    print(str.format("   {:<40} ", "get_spectrum_array"), end="")
+    get_spectrum_array_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_spectrum_array_by_renson"), end="")
+    get_spectrum_array_by_renson_test()
+    print("[ OK ]")
+
     print(str.format("   {:<40} ", "get_star"), end="")
     get_star_test()
     print("[ OK ]")
 
+    print(str.format("   {:<40} ", "refresh_catalog"), end="")
+    refresh_catalog_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_star (catalog mirror)"), end="")
+    get_star_from_catalog_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "catalog mirror of other server"), end="")
+    catalog_of_other_server_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "cpstars_catalog.py refresh"), end="")
+    refresh_catalog_command_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_star (catalog store)"), end="")
+    get_star_from_catalog_store_test()
+    print("[ OK ]")
+
     print(str.format("   {:<40} ", "get_star_by_renson"), end="")
     get_star_by_renson_test()
     print("[ OK ]")
 
+    print(str.format("   {:<40} ", "get_star_dossier"), end="")
+    get_star_dossier_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_star_dossier (from bulk functions)"), end="")
+    get_star_dossier_in_bulk_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_star_dossier_by_renson"), end="")
+    get_star_dossier_by_renson_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "resolve_renson_ids"), end="")
+    resolve_renson_ids_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_extended_star"), end="")
+    get_extended_star_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_datasources"), end="")
+    get_datasources_test()
+    print("[ OK ]")
+
+    print(str.format("   {:<40} ", "get_datasources (shared by instances)"), end="")
+    get_datasources_shared_test()
+    print("[ OK ]")
+
     print(str.format("   {:<40} ", "get_vizier_metadata"), end="")
     get_vizier_metadata_test()
     print("[ OK ]")